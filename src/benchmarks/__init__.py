@@ -0,0 +1,27 @@
+from .import_time import (
+    CORE_MODULES,
+    HEAVY_MODULES,
+    ImportMeasurement,
+    check_import_budget,
+    measure_import_time,
+)
+from .scaling import (
+    ScalingResult,
+    run_scaling_benchmarks,
+    visualize_scaling_results,
+)
+from .throughput import BenchmarkResult, measure, run_throughput_benchmarks
+
+__all__ = [
+    "BenchmarkResult",
+    "CORE_MODULES",
+    "HEAVY_MODULES",
+    "ImportMeasurement",
+    "ScalingResult",
+    "check_import_budget",
+    "measure",
+    "measure_import_time",
+    "run_scaling_benchmarks",
+    "run_throughput_benchmarks",
+    "visualize_scaling_results",
+]
@@ -0,0 +1,11 @@
+import sys
+
+from .import_time import check_import_budget
+
+if __name__ == "__main__":
+    failures = check_import_budget()
+
+    for failure in failures:
+        print(failure)
+
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,94 @@
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from constants import IMPORT_TIME_BUDGET_SECONDS, IMPORT_TIME_REPEATS
+
+SOURCE_DIR = Path(__file__).resolve().parents[1]
+
+CORE_MODULES = (
+    "data",
+    "data.pool",
+    "data.shared_pool",
+    "classes",
+    "classes.team_sampling",
+    "simulation",
+    "solvers",
+    "solvers.genetic_operators",
+    "solvers.pareto",
+    "solvers.population",
+    "tournament",
+)
+HEAVY_MODULES = ("pandas", "pandera", "pydantic", "matplotlib", "seaborn")
+
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+heavy = [name for name in {heavy_modules!r} if name in sys.modules]
+print(json.dumps({{"seconds": seconds, "heavy_modules": heavy}}))
+"""
+
+
+@dataclass
+class ImportMeasurement:
+    module: str
+    seconds: float
+    heavy_modules: list[str]
+
+
+def measure_import_time(
+    module: str, repeats: int = IMPORT_TIME_REPEATS
+) -> ImportMeasurement:
+    best: ImportMeasurement | None = None
+
+    # Every measurement runs in a fresh interpreter, so nothing is cached.
+    for _ in range(repeats):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                MEASURE_SCRIPT.format(module=module, heavy_modules=HEAVY_MODULES),
+            ],
+            cwd=SOURCE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(output.stdout)
+        measurement = ImportMeasurement(
+            module, result["seconds"], result["heavy_modules"]
+        )
+
+        if best is None or measurement.seconds < best.seconds:
+            best = measurement
+
+    if best is None:
+        raise ValueError("repeats must be positive.")
+
+    return best
+
+
+def check_import_budget(
+    modules: tuple[str, ...] = CORE_MODULES,
+    budget: float = IMPORT_TIME_BUDGET_SECONDS,
+    repeats: int = IMPORT_TIME_REPEATS,
+) -> list[str]:
+    failures: list[str] = []
+
+    for module in modules:
+        measurement = measure_import_time(module, repeats)
+
+        if measurement.heavy_modules:
+            failures.append(f"{module} imports {', '.join(measurement.heavy_modules)}")
+
+        if measurement.seconds > budget:
+            failures.append(
+                f"{module} takes {measurement.seconds:.3f}s to import, "
+                f"the budget is {budget:.3f}s"
+            )
+
+    return failures
@@ -0,0 +1,186 @@
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from classes import sample_replacement_moves, sample_team_positions
+from constants import (
+    DEFAULT_SCALING_DATAFRAME_TEAMS,
+    DEFAULT_SCALING_POOL_SIZES,
+    DEFAULT_SCALING_TEAMS,
+    DEFAULT_TABU_NEIGHBOURS_PER_STEP,
+    POKEMON_TO_REPLACE_AMOUNT,
+)
+from data import get_pokemon_pool
+from simulation import (
+    DamageFormula,
+    TypeMultiplierFormula,
+    calculate_damage_block,
+    damage_attack_devide_defense,
+    multiply_type_multiplier,
+)
+from solvers.genetic_operators import mutate_teams
+
+from .throughput import BenchmarkResult, measure
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from pandera.typing import DataFrame
+
+    from schemas import PokemonSchema
+
+
+@dataclass
+class ScalingResult(BenchmarkResult):
+    pool_size: int
+
+
+def _measure_pool(
+    pokemons: "DataFrame[PokemonSchema]",
+    teams_amount: int,
+    dataframe_teams: int,
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+    rng: np.random.Generator,
+) -> list[BenchmarkResult]:
+    from classes import PokemonTeam
+
+    pool = get_pokemon_pool(pokemons)
+    teams = sample_team_positions(pool, teams_amount, rng=rng)
+    ids = pool.ids[teams]
+    members = np.unique(teams[:dataframe_teams])
+    team = PokemonTeam.from_positions(pokemons, teams[0])
+
+    return [
+        measure(
+            "pool",
+            pool.get_size(),
+            lambda: get_pokemon_pool(pokemons),
+        ),
+        measure(
+            "team_sampling",
+            teams_amount,
+            lambda: sample_team_positions(pool, teams_amount, rng=rng),
+        ),
+        measure(
+            "mutation",
+            teams_amount,
+            lambda: mutate_teams(pool, teams, POKEMON_TO_REPLACE_AMOUNT, rng),
+        ),
+        measure(
+            "positions",
+            teams_amount,
+            lambda: pool.get_positions(ids),
+        ),
+        measure(
+            "replacement_moves",
+            dataframe_teams,
+            lambda: [
+                sample_replacement_moves(
+                    pool, current, DEFAULT_TABU_NEIGHBOURS_PER_STEP, rng=rng
+                )
+                for current in teams[:dataframe_teams]
+            ],
+        ),
+        measure(
+            "damage_block",
+            len(members) ** 2,
+            lambda: calculate_damage_block(
+                pool, members, members, type_multiplier_formula, damage_formula
+            ),
+        ),
+        measure(
+            "dataframe_team",
+            dataframe_teams,
+            lambda: [
+                PokemonTeam.generate_team(pokemons, rng=rng)
+                for _ in range(dataframe_teams)
+            ],
+        ),
+        measure(
+            "dataframe_replacement",
+            dataframe_teams,
+            lambda: [
+                team.generate_team_with_random_replacement(pokemons, rng=rng)
+                for _ in range(dataframe_teams)
+            ],
+        ),
+        measure(
+            "dataframe_neighbors",
+            dataframe_teams,
+            lambda: team.generate_neighbors(pokemons, limit=dataframe_teams, rng=rng),
+        ),
+    ]
+
+
+def run_scaling_benchmarks(
+    pool_sizes: Sequence[int] = DEFAULT_SCALING_POOL_SIZES,
+    pokemons: "DataFrame[PokemonSchema] | None" = None,
+    teams_amount: int = DEFAULT_SCALING_TEAMS,
+    dataframe_teams: int = DEFAULT_SCALING_DATAFRAME_TEAMS,
+    type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+    damage_formula: DamageFormula = damage_attack_devide_defense,
+    rng: np.random.Generator | int | None = None,
+) -> list[ScalingResult]:
+    from data import generate_synthetic_pokemons
+
+    rng = np.random.default_rng(rng)
+    results: list[ScalingResult] = []
+
+    for pool_size in pool_sizes:
+        start = time.perf_counter()
+        synthetic = generate_synthetic_pokemons(pool_size, pokemons, rng=rng)
+        generation = BenchmarkResult(
+            "synthetic_pool", pool_size, time.perf_counter() - start
+        )
+
+        for result in [
+            generation,
+            *_measure_pool(
+                synthetic,
+                teams_amount,
+                dataframe_teams,
+                type_multiplier_formula,
+                damage_formula,
+                rng,
+            ),
+        ]:
+            results.append(
+                ScalingResult(
+                    name=result.name,
+                    items=result.items,
+                    seconds=result.seconds,
+                    pool_size=pool_size,
+                )
+            )
+
+    return results
+
+
+def visualize_scaling_results(results: Sequence[ScalingResult]) -> "plt.Figure":
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    names = list(dict.fromkeys(result.name for result in results))
+
+    # Seconds per item against pool size, so a flat curve is sub-linear work.
+    for name in names:
+        curve = sorted(
+            (result.pool_size, result.seconds / max(result.items, 1))
+            for result in results
+            if result.name == name
+        )
+        sizes, seconds = zip(*curve, strict=True)
+        ax.plot(sizes, seconds, marker="o", label=name)
+
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("Pool size")
+    ax.set_ylabel("Seconds per item")
+    ax.set_title("Scaling against pool size")
+    ax.legend(loc="upper left", fontsize=8)
+    fig.tight_layout()
+
+    return fig
@@ -0,0 +1,109 @@
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from classes import sample_team_positions
+from constants import (
+    DEFAULT_BENCH_BATTLES,
+    DEFAULT_BENCH_REFERENCE_BATTLES,
+    DEFAULT_BENCH_TEAMS,
+)
+from data import get_pokemon_pool
+from simulation import (
+    DamageFormula,
+    TypeMultiplierFormula,
+    damage_attack_devide_defense,
+    get_damage_matrix,
+    multiply_type_multiplier,
+    simulate_battles,
+)
+
+if TYPE_CHECKING:
+    from pandera.typing import DataFrame
+
+    from schemas import PokemonSchema
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    items: int
+    seconds: float
+
+    def get_items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self) | {"items_per_second": self.get_items_per_second()}
+
+
+def measure(name: str, items: int, function: Callable[[], object]) -> BenchmarkResult:
+    start = time.perf_counter()
+    function()
+    return BenchmarkResult(name, items, time.perf_counter() - start)
+
+
+def run_throughput_benchmarks(
+    pokemons: "DataFrame[PokemonSchema]",
+    battles: int = DEFAULT_BENCH_BATTLES,
+    reference_battles: int = DEFAULT_BENCH_REFERENCE_BATTLES,
+    teams_amount: int = DEFAULT_BENCH_TEAMS,
+    type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+    damage_formula: DamageFormula = damage_attack_devide_defense,
+    rng: np.random.Generator | int | None = None,
+) -> list[BenchmarkResult]:
+    from classes import PokemonTeam
+    from simulation import simulate_battle
+
+    rng = np.random.default_rng(rng)
+    pool = get_pokemon_pool(pokemons)
+    results: list[BenchmarkResult] = []
+
+    start = time.perf_counter()
+    damage = get_damage_matrix(pool, type_multiplier_formula, damage_formula)
+    results.append(
+        BenchmarkResult(
+            "damage_matrix", pool.get_size() ** 2, time.perf_counter() - start
+        )
+    )
+
+    results.append(
+        measure(
+            "team_sampling",
+            teams_amount,
+            lambda: sample_team_positions(pool, teams_amount, rng=rng),
+        )
+    )
+
+    current = sample_team_positions(pool, battles, rng=rng)
+    opponents = sample_team_positions(pool, battles, rng=rng)
+    results.append(
+        measure(
+            "vectorized_battles",
+            battles,
+            lambda: simulate_battles(pool, damage, current, opponents),
+        )
+    )
+
+    pairs = [
+        (
+            PokemonTeam.from_positions(pokemons, current[i]),
+            PokemonTeam.from_positions(pokemons, opponents[i]),
+        )
+        for i in range(min(reference_battles, battles))
+    ]
+    results.append(
+        measure(
+            "reference_battles",
+            len(pairs),
+            lambda: [
+                simulate_battle(team, opponent, type_multiplier_formula, damage_formula)
+                for team, opponent in pairs
+            ],
+        )
+    )
+
+    return results
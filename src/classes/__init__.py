@@ -1,3 +1,37 @@
-from .pokemon_team import PokemonTeam
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["PokemonTeam"]
+from .team_sampling import (
+    apply_replacement_moves,
+    generate_unique_team_positions,
+    get_replacement_moves,
+    sample_allowed_positions,
+    sample_replacement_moves,
+    sample_team_positions,
+)
+
+if TYPE_CHECKING:
+    from .pokemon_team import PokemonTeam
+
+_LAZY_IMPORTS = {
+    "PokemonTeam": ".pokemon_team",
+}
+
+__all__ = [
+    "PokemonTeam",
+    "apply_replacement_moves",
+    "generate_unique_team_positions",
+    "get_replacement_moves",
+    "sample_allowed_positions",
+    "sample_replacement_moves",
+    "sample_team_positions",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from typing import cast
+
 import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
@@ -5,15 +8,109 @@ from pandera.typing import DataFrame
 from constants import (
     FIRST_TYPE,
     ID,
+    MAX_CANDIDATE_REJECTIONS,
     NAME,
     POKEMON_TO_REPLACE_AMOUNT,
     SECOND_TYPE,
     STATS_COLS,
     TEAM_SIZE,
 )
-from data import get_pokemon_with_excluded_ids
+from data import (
+    PokemonPool,
+    PokemonPoolIndex,
+    get_canonical_team_keys,
+    get_pokemon_pool,
+    get_pokemon_pool_index,
+)
 from schemas import PokemonSchema
 
+from .team_sampling import generate_unique_team_positions
+
+
+def _iterate_random_positions(size: int, rng: np.random.Generator) -> Iterator[int]:
+    seen: set[int] = set()
+
+    # Positions come in a uniformly random order that is drawn lazily, so a
+    # caller stopping early never pays for permuting the whole pool. Once
+    # most positions were seen, the remaining ones are permuted at once.
+    while 2 * len(seen) < size:
+        position = int(rng.integers(size))
+
+        if position not in seen:
+            seen.add(position)
+            yield position
+
+    remaining = np.setdiff1d(
+        np.arange(size), np.fromiter(seen, dtype=np.intp, count=len(seen))
+    )
+    yield from rng.permutation(remaining).tolist()
+
+
+def _get_types(first_type: object, second_type: object) -> list[str]:
+    # A missing second type is NaN, which is the only non string value.
+    return [t for t in (first_type, second_type) if isinstance(t, str)]
+
+
+def _are_unique(types: list[str]) -> bool:
+    return len(types) == len(set(types))
+
+
+def _get_allowed_mask(
+    pokemons: DataFrame[PokemonSchema],
+    excluded_ids: set[str],
+    blocked_types: list[str],
+    unique_types: bool,
+) -> np.ndarray:
+    allowed = ~pokemons[ID].astype(str).isin(excluded_ids).to_numpy()
+
+    if not unique_types:
+        return allowed
+
+    if not _are_unique(blocked_types):
+        return np.zeros(len(pokemons), dtype=bool)
+
+    first_types = pokemons[FIRST_TYPE]
+    second_types = pokemons[SECOND_TYPE]
+    fitting = ~first_types.isin(blocked_types) & (
+        second_types.isna()
+        | (~second_types.isin(blocked_types) & (second_types != first_types))
+    )
+    return allowed & fitting.to_numpy()
+
+
+def _iterate_allowed_positions(
+    pokemons: DataFrame[PokemonSchema],
+    excluded_ids: set[str],
+    blocked_types: list[str],
+    unique_types: bool,
+    rng: np.random.Generator,
+    max_rejections: int = MAX_CANDIDATE_REJECTIONS,
+) -> Iterator[int]:
+    ids = pokemons[ID].to_numpy()
+    first_types = pokemons[FIRST_TYPE].to_numpy()
+    second_types = pokemons[SECOND_TYPE].to_numpy()
+    drawn: list[int] = []
+
+    # Allowed pokemons come in a uniformly random order. They are looked for
+    # one random pokemon at a time, and when that keeps failing the remaining
+    # ones are found with a single pass over the pool.
+    for position in _iterate_random_positions(len(pokemons), rng):
+        drawn.append(position)
+        types = _get_types(first_types[position], second_types[position])
+
+        if str(ids[position]) not in excluded_ids and (
+            not unique_types or _are_unique([*blocked_types, *types])
+        ):
+            yield position
+        elif len(drawn) > max_rejections:
+            break
+    else:
+        return
+
+    allowed = _get_allowed_mask(pokemons, excluded_ids, blocked_types, unique_types)
+    allowed[drawn] = False
+    yield from rng.permutation(np.flatnonzero(allowed)).tolist()
+
 
 class PokemonTeam:
     def __init__(self, members: DataFrame[PokemonSchema]) -> None:
@@ -28,6 +125,14 @@ class PokemonTeam:
     def get_ids(self) -> list[str]:
         return self.members[ID].astype(str).to_list()
 
+    def get_names(self) -> list[str]:
+        return self.members[NAME].astype(str).to_list()
+
+    def get_positions(self, pool: PokemonPool) -> np.ndarray:
+        return pool.get_positions(
+            np.asarray(self.members[ID].to_numpy(), dtype=np.int64)
+        )
+
     def get_hps(self) -> list[int]:
         return self.members["hp"].astype(int).to_list()
 
@@ -44,39 +149,60 @@ class PokemonTeam:
         new_members.iloc[second_index] = temp
         self.members = new_members.reset_index(drop=True)
 
+    def _get_member_types(self) -> list[list[str]]:
+        return [
+            _get_types(first_type, second_type)
+            for first_type, second_type in self.members[
+                [FIRST_TYPE, SECOND_TYPE]
+            ].itertuples(index=False)
+        ]
+
+    def _with_replacements(
+        self, pokemons: DataFrame[PokemonSchema], replacements: dict[int, int]
+    ) -> "PokemonTeam":
+        # One concatenation and one take instead of a row assignment per
+        # replacement, which pandas splits into one write per column.
+        members = pd.concat(
+            [self.members, pokemons.iloc[list(replacements.values())]],
+            ignore_index=True,
+        )
+        order = np.arange(self.get_size())
+        order[list(replacements)] = self.get_size() + np.arange(len(replacements))
+        return PokemonTeam(cast(DataFrame[PokemonSchema], members.iloc[order]))
+
     def generate_neighbors(
         self,
         pokemons: DataFrame[PokemonSchema],
         unique_types: bool = True,
         limit: int | None = None,
+        rng: np.random.Generator | None = None,
     ) -> list["PokemonTeam"]:
         if limit is not None and limit <= 0:
             raise ValueError("Limit must be positive or None.")
 
-        rng = np.random.default_rng()
+        rng = np.random.default_rng(rng)
 
         neighbors: list[PokemonTeam] = []
-        possible_pokemons = get_pokemon_with_excluded_ids(self.get_ids(), pokemons)
-
-        candidate_indexes = rng.permutation(possible_pokemons.index.to_numpy())
+        excluded_ids = set(self.get_ids())
+        member_types = self._get_member_types()
 
         for member_position in range(self.get_size()):
-            for candidate_index in candidate_indexes:
-                neighbor_members = self.members.copy()
-                neighbor_members.iloc[member_position] = possible_pokemons.loc[
-                    candidate_index
-                ]
-
-                if unique_types and not self.are_types_unique(neighbor_members):
-                    continue
-
-                neighbors.append(PokemonTeam(neighbor_members))
+            others_types = [
+                member_type
+                for position, types in enumerate(member_types)
+                if position != member_position
+                for member_type in types
+            ]
+
+            for candidate in _iterate_allowed_positions(
+                pokemons, excluded_ids, others_types, unique_types, rng
+            ):
+                neighbors.append(
+                    self._with_replacements(pokemons, {member_position: candidate})
+                )
 
                 if limit is not None and len(neighbors) >= limit:
-                    break
-
-            if limit is not None and len(neighbors) >= limit:
-                break
+                    return neighbors
 
         return neighbors
 
@@ -85,38 +211,46 @@ class PokemonTeam:
         pokemons: DataFrame[PokemonSchema],
         replacements: int = POKEMON_TO_REPLACE_AMOUNT,
         unique_types: bool = True,
+        rng: np.random.Generator | None = None,
     ) -> "PokemonTeam":
-        rng = np.random.default_rng()
+        rng = np.random.default_rng(rng)
 
         members_to_replace_indexes = rng.choice(
             self.get_size(), size=replacements, replace=False
         )
 
-        possible_pokemons = get_pokemon_with_excluded_ids(self.get_ids(), pokemons)
+        ids = pokemons[ID].to_numpy()
+        first_types = pokemons[FIRST_TYPE].to_numpy()
+        second_types = pokemons[SECOND_TYPE].to_numpy()
+        excluded_ids = set(self.get_ids())
+        member_types = self._get_member_types()
 
-        new_members = self.members.copy()
+        chosen: dict[int, int] = {}
 
         for member_index in members_to_replace_indexes:
-            if possible_pokemons.empty:
-                break
-
-            possible_members_indexes = rng.permutation(possible_pokemons.index)
-
-            for possible_member_index in possible_members_indexes:
-                possible_member = possible_pokemons.loc[possible_member_index].copy()
-
-                possible_members = new_members.copy()
-
-                possible_members.iloc[member_index] = possible_member
+            others_types = [
+                member_type
+                for position, types in enumerate(member_types)
+                if position != member_index
+                for member_type in types
+            ]
+            candidate = next(
+                _iterate_allowed_positions(
+                    pokemons, excluded_ids, others_types, unique_types, rng
+                ),
+                None,
+            )
 
-                if unique_types and not self.are_types_unique(possible_members):
-                    continue
+            if candidate is None:
+                continue
 
-                new_members = possible_members
-                possible_pokemons = possible_pokemons.drop(possible_member.name)
-                break
+            chosen[int(member_index)] = candidate
+            member_types[member_index] = _get_types(
+                first_types[candidate], second_types[candidate]
+            )
+            excluded_ids.add(str(ids[candidate]))
 
-        return PokemonTeam(new_members)
+        return self._with_replacements(pokemons, chosen)
 
     def __repr__(self) -> str:
         names = self.members[NAME].tolist()
@@ -128,29 +262,99 @@ class PokemonTeam:
         pokemons: DataFrame[PokemonSchema],
         team_size: int = TEAM_SIZE,
         unique_types: bool = True,
+        rng: np.random.Generator | None = None,
     ) -> "PokemonTeam":
-        rng = np.random.default_rng()
-
-        members: DataFrame[PokemonSchema] = pokemons.iloc[0:0].copy()
-
-        possible_members_indexes = rng.permutation(pokemons.index)
+        rng = np.random.default_rng(rng)
+
+        ids = pokemons[ID].to_numpy()
+        first_types = pokemons[FIRST_TYPE].to_numpy()
+        second_types = pokemons[SECOND_TYPE].to_numpy()
+        positions: list[int] = []
+        team_ids: set[str] = set()
+        team_types: list[str] = []
+
+        while len(positions) < team_size:
+            candidate = next(
+                _iterate_allowed_positions(
+                    pokemons, team_ids, team_types, unique_types, rng
+                ),
+                None,
+            )
 
-        for candidate_index in possible_members_indexes:
-            if len(members) >= team_size:
+            if candidate is None:
                 break
 
-            candidate = pokemons.loc[candidate_index].copy()
-            candidate_members: DataFrame[PokemonSchema] = pd.concat(
-                [members, candidate.to_frame().T],
-                ignore_index=True,
+            positions.append(candidate)
+            team_ids.add(str(ids[candidate]))
+            team_types.extend(
+                _get_types(first_types[candidate], second_types[candidate])
             )
 
-            if unique_types and not cls.are_types_unique(candidate_members):
-                continue
+        return cls(pokemons.iloc[positions])
+
+    @classmethod
+    def from_positions(
+        cls, pokemons: DataFrame[PokemonSchema], positions: np.ndarray
+    ) -> "PokemonTeam":
+        return cls(pokemons.iloc[positions])
+
+    @classmethod
+    def from_names(
+        cls,
+        pokemons: DataFrame[PokemonSchema],
+        names: list[str],
+        index: PokemonPoolIndex | None = None,
+    ) -> "PokemonTeam":
+        index = index or get_pokemon_pool_index(pokemons)
+        return cls.from_positions(pokemons, index.encode_names(names))
 
-            members = candidate_members
+    @classmethod
+    def from_team_positions(
+        cls, pokemons: DataFrame[PokemonSchema], teams: np.ndarray
+    ) -> list["PokemonTeam"]:
+        teams = np.asarray(teams)
+        team_size = teams.shape[1]
+
+        # One gather for all teams, each team is then a slice of its rows.
+        members = pokemons.iloc[teams.ravel()].reset_index(drop=True)
+        return [
+            cls(members.iloc[start : start + team_size])
+            for start in range(0, len(members), team_size)
+        ]
+
+    @classmethod
+    def from_team_names(
+        cls,
+        pokemons: DataFrame[PokemonSchema],
+        names: np.ndarray | list[list[str]],
+        index: PokemonPoolIndex | None = None,
+    ) -> list["PokemonTeam"]:
+        index = index or get_pokemon_pool_index(pokemons)
+        return cls.from_team_positions(pokemons, index.encode_names(names))
 
-        return cls(members)
+    @staticmethod
+    def get_team_positions(
+        teams: list["PokemonTeam"], index: PokemonPoolIndex
+    ) -> np.ndarray:
+        ids = np.array(
+            [team.members[ID].to_numpy(dtype=np.int64) for team in teams],
+            dtype=np.int64,
+        )
+        return index.encode_ids(ids.reshape(len(teams), -1))
+
+    @classmethod
+    def sample_unique_teams(
+        cls,
+        pokemons: DataFrame[PokemonSchema],
+        teams_amount: int,
+        team_size: int = TEAM_SIZE,
+        unique_types: bool = True,
+        rng: np.random.Generator | int | None = None,
+    ) -> list["PokemonTeam"]:
+        positions = generate_unique_team_positions(
+            get_pokemon_pool(pokemons), teams_amount, team_size, unique_types, rng
+        )
+        return cls.from_team_positions(pokemons, positions)
 
     @classmethod
     def generate_unique_teams(
@@ -160,6 +364,7 @@ class PokemonTeam:
         max_attempts: int | None = None,
         team_size: int = TEAM_SIZE,
         unique_types: bool = True,
+        rng: np.random.Generator | None = None,
     ) -> list["PokemonTeam"]:
         if opponents_limit is not None and opponents_limit <= 0:
             raise ValueError("opponents_limit must be positive or None")
@@ -175,8 +380,10 @@ class PokemonTeam:
         elif max_attempts is None or max_attempts <= 0:
             raise ValueError("max_attempts must be positive")
 
+        rng = np.random.default_rng(rng)
+        pool = get_pokemon_pool(pokemons)
         opponents: list[PokemonTeam] = []
-        seen_signatures: set[tuple[str, ...]] = set()
+        seen_keys: set[int] = set()
 
         attempts = 0
         while attempts < max_attempts and (
@@ -184,13 +391,17 @@ class PokemonTeam:
         ):
             attempts += 1
 
-            team = cls.generate_team(pokemons, team_size, unique_types)
-            signature = tuple(sorted(team.get_ids()))
+            team = cls.generate_team(pokemons, team_size, unique_types, rng)
+            key = int(
+                get_canonical_team_keys(
+                    team.get_positions(pool)[None, :], pool.get_size()
+                )[0]
+            )
 
-            if signature in seen_signatures:
+            if key in seen_keys:
                 continue
 
-            seen_signatures.add(signature)
+            seen_keys.add(key)
             opponents.append(team)
 
         return opponents
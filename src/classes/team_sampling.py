@@ -0,0 +1,264 @@
+import numpy as np
+
+from constants import (
+    MAX_REJECTION_ROUNDS,
+    MAX_SAMPLING_ROUNDS,
+    SAMPLING_CHUNK_SIZE,
+    TEAM_SIZE,
+)
+from data.pool import PokemonPool
+from data.team_keys import get_unique_team_indexes
+
+
+def _sample_dense_positions(
+    type_masks: np.ndarray,
+    blocked_masks: np.ndarray,
+    excluded: np.ndarray,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    rows = np.arange(len(blocked_masks))
+    allowed = (type_masks[None, :] & blocked_masks[:, None]) == 0
+    allowed[rows[:, None], excluded] = False
+
+    keys = rng.random(allowed.shape)
+    keys[~allowed] = -1.0
+    chosen = keys.argmax(axis=1)
+
+    return chosen, allowed[rows, chosen]
+
+
+def sample_allowed_positions(
+    pool: PokemonPool,
+    blocked_masks: np.ndarray,
+    excluded: np.ndarray,
+    rng: np.random.Generator,
+    max_rounds: int = MAX_REJECTION_ROUNDS,
+) -> tuple[np.ndarray, np.ndarray]:
+    index = pool.type_mask_index
+    blocked_masks = np.asarray(blocked_masks, dtype=np.int64)
+    excluded = np.asarray(excluded, dtype=np.intp)
+
+    # A pokemon is drawn uniformly among the type groups that fit, which
+    # costs the same for any pool size. Excluded pokemons are drawn again,
+    # and rows that keep failing fall back to a draw over the whole pool, so
+    # every row stays uniform over its allowed pokemons.
+    weights = np.where(
+        (index.masks[None, :] & blocked_masks[:, None]) == 0, index.counts[None, :], 0
+    )
+    cumulative = np.cumsum(weights, axis=1)
+    totals = cumulative[:, -1]
+
+    positions = np.zeros(len(blocked_masks), dtype=np.intp)
+    found = totals > 0
+    pending = np.flatnonzero(found)
+
+    for _ in range(max_rounds):
+        if pending.size == 0:
+            break
+
+        targets = rng.integers(0, totals[pending])
+        groups = (cumulative[pending] <= targets[:, None]).sum(axis=1)
+        offsets = targets - cumulative[pending, groups] + weights[pending, groups]
+        positions[pending] = index.positions[index.starts[groups] + offsets]
+
+        is_excluded = (excluded[pending] == positions[pending, None]).any(axis=1)
+        pending = pending[is_excluded]
+
+    if pending.size > 0:
+        positions[pending], found[pending] = _sample_dense_positions(
+            pool.get_type_masks(), blocked_masks[pending], excluded[pending], rng
+        )
+
+    return positions, found
+
+
+def _draft_team_positions(
+    pool: PokemonPool,
+    teams_amount: int,
+    team_size: int,
+    unique_types: bool,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    type_masks = pool.get_type_masks()
+    teams = np.zeros((teams_amount, team_size), dtype=np.intp)
+    team_masks = np.zeros(teams_amount, dtype=np.int64)
+    complete = np.ones(teams_amount, dtype=bool)
+
+    # Every slot picks uniformly among the pokemons still allowed in the team,
+    # which is the same distribution as PokemonTeam.generate_team.
+    for slot in range(team_size):
+        blocked_masks = (
+            team_masks if unique_types else np.zeros(teams_amount, dtype=np.int64)
+        )
+        chosen, allowed = sample_allowed_positions(
+            pool, blocked_masks, teams[:, :slot], rng
+        )
+
+        complete &= allowed
+        teams[:, slot] = chosen
+        team_masks |= type_masks[chosen]
+
+    return teams, complete
+
+
+def sample_team_positions(
+    pool: PokemonPool,
+    teams_amount: int,
+    team_size: int = TEAM_SIZE,
+    unique_types: bool = True,
+    rng: np.random.Generator | int | None = None,
+    max_rounds: int = MAX_SAMPLING_ROUNDS,
+) -> np.ndarray:
+    if teams_amount < 0:
+        raise ValueError("teams_amount must not be negative.")
+
+    if team_size > pool.get_size():
+        raise ValueError("team_size must not be greater than the pool size.")
+
+    rng = np.random.default_rng(rng)
+
+    teams = np.empty((teams_amount, team_size), dtype=np.intp)
+    pending = np.arange(teams_amount)
+
+    for _ in range(max_rounds):
+        if pending.size == 0:
+            break
+
+        for start in range(0, pending.size, SAMPLING_CHUNK_SIZE):
+            chunk = pending[start : start + SAMPLING_CHUNK_SIZE]
+            drafted, complete = _draft_team_positions(
+                pool, len(chunk), team_size, unique_types, rng
+            )
+            teams[chunk[complete]] = drafted[complete]
+            pending[start : start + SAMPLING_CHUNK_SIZE][complete] = -1
+
+        pending = pending[pending >= 0]
+
+    if pending.size > 0:
+        raise ValueError(
+            f"Could not sample {teams_amount} teams of size {team_size} "
+            f"within {max_rounds} rounds."
+        )
+
+    return teams
+
+
+def generate_unique_team_positions(
+    pool: PokemonPool,
+    teams_amount: int,
+    team_size: int = TEAM_SIZE,
+    unique_types: bool = True,
+    rng: np.random.Generator | int | None = None,
+    max_rounds: int = MAX_SAMPLING_ROUNDS,
+) -> np.ndarray:
+    if teams_amount <= 0:
+        raise ValueError("teams_amount must be positive.")
+
+    rng = np.random.default_rng(rng)
+    teams = np.empty((0, team_size), dtype=np.intp)
+
+    for _ in range(max_rounds):
+        missing = teams_amount - len(teams)
+
+        if missing == 0:
+            return teams
+
+        drafted = sample_team_positions(
+            pool, missing, team_size, unique_types, rng, max_rounds
+        )
+        teams = np.concatenate([teams, drafted])
+
+        # Teams are equal when they have the same members in any order.
+        teams = teams[get_unique_team_indexes(teams, pool.get_size())]
+
+    if len(teams) < teams_amount:
+        raise ValueError(
+            f"Could not generate {teams_amount} unique teams, "
+            f"only {len(teams)} found within {max_rounds} rounds."
+        )
+
+    return teams
+
+
+def get_replacement_moves(
+    pool: PokemonPool,
+    team: np.ndarray,
+    unique_types: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    type_masks = pool.get_type_masks()
+    team_masks = type_masks[team]
+
+    allowed = np.ones((len(team), pool.get_size()), dtype=bool)
+    allowed[:, team] = False
+
+    if unique_types:
+        for slot in range(len(team)):
+            others_mask = np.bitwise_or.reduce(np.delete(team_masks, slot))
+            allowed[slot] &= (type_masks & others_mask) == 0
+
+    slots, candidates = np.nonzero(allowed)
+    return slots, candidates
+
+
+def apply_replacement_moves(
+    team: np.ndarray, slots: np.ndarray, candidates: np.ndarray
+) -> np.ndarray:
+    neighbors = np.repeat(team[None, :], len(slots), axis=0)
+    neighbors[np.arange(len(slots)), slots] = candidates
+    return neighbors
+
+
+def _get_replacement_counts(
+    pool: PokemonPool, team: np.ndarray, unique_types: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    type_masks = pool.get_type_masks()
+    team_masks = type_masks[team]
+    others_masks = np.zeros(len(team), dtype=np.int64)
+
+    if unique_types:
+        for slot in range(len(team)):
+            others_masks[slot] = np.bitwise_or.reduce(np.delete(team_masks, slot))
+
+    index = pool.type_mask_index
+    fitting = (index.masks[None, :] & others_masks[:, None]) == 0
+    members_fitting = (team_masks[None, :] & others_masks[:, None]) == 0
+    counts = (fitting * index.counts[None, :]).sum(axis=1) - members_fitting.sum(axis=1)
+
+    return counts, others_masks
+
+
+def sample_replacement_moves(
+    pool: PokemonPool,
+    team: np.ndarray,
+    amount: int,
+    unique_types: bool = True,
+    rng: np.random.Generator | int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(rng)
+    team = np.asarray(team, dtype=np.intp)
+    counts, others_masks = _get_replacement_counts(pool, team, unique_types)
+    total = int(counts.sum())
+
+    # Enumerating moves is linear in the pool size, so it is only worth it
+    # when most of the moves are asked for.
+    if 2 * amount >= total:
+        slots, candidates = get_replacement_moves(pool, team, unique_types)
+        chosen = rng.choice(len(slots), size=min(amount, len(slots)), replace=False)
+        return slots[chosen], candidates[chosen]
+
+    # Moves are drawn uniformly and the repeated ones dropped, which is the
+    # same as drawing them without replacement.
+    moves = np.empty(0, dtype=np.int64)
+    while len(moves) < amount:
+        missing = amount - len(moves)
+        slots = rng.choice(len(team), size=missing, p=counts / total)
+        candidates, found = sample_allowed_positions(
+            pool, others_masks[slots], np.broadcast_to(team, (missing, len(team))), rng
+        )
+
+        drawn = slots[found] * pool.get_size() + candidates[found]
+        moves = np.concatenate([moves, drawn])
+        _, first_indexes = np.unique(moves, return_index=True)
+        moves = moves[np.sort(first_indexes)]
+
+    return moves // pool.get_size(), moves % pool.get_size()
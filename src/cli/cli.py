@@ -0,0 +1,311 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+from constants import (
+    DEFAULT_BENCH_BATTLES,
+    DEFAULT_BENCH_REFERENCE_BATTLES,
+    DEFAULT_SERVICE_WORKERS,
+)
+
+type Backend = Literal["reference", "vectorized"]
+
+SOLVERS = {
+    "ea": "EvolutionaryAlgorithmPokemonSolver",
+    "hill-climbing": "HillClimbingPokemonSolver",
+    "random-search": "RandomSearchPokemonSolver",
+    "simulated-annealing": "SimulatedAnnealingPokemonSolver",
+    "tabu": "TabuSearchPokemonSolver",
+}
+
+BACKENDS: tuple[Backend, ...] = ("reference", "vectorized")
+
+# Solver fields that switch a solver to the given simulation backend.
+# Solvers missing a backend here only support their default one.
+SOLVER_BACKENDS: dict[str, dict[Backend, dict[str, Any]]] = {
+    "ea": {
+        "reference": {"large_population": False},
+        "vectorized": {"large_population": True},
+    },
+    "hill-climbing": {
+        "reference": {"steepest_ascent": False},
+        "vectorized": {"steepest_ascent": True},
+    },
+    "random-search": {"reference": {}},
+    "simulated-annealing": {"reference": {}},
+    "tabu": {"vectorized": {}},
+}
+
+OUTPUT_FORMATS = (".json", ".parquet")
+
+
+def parse_field(assignment: str) -> tuple[str, Any]:
+    name, separator, raw_value = assignment.partition("=")
+
+    if not separator or not name:
+        raise argparse.ArgumentTypeError(f"Expected FIELD=VALUE, got {assignment!r}.")
+
+    try:
+        value = json.loads(raw_value)
+    except json.JSONDecodeError:
+        value = raw_value
+
+    return name, value
+
+
+def get_solver_class(solver_name: str) -> Any:
+    import solvers
+
+    return getattr(solvers, SOLVERS[solver_name])
+
+
+def create_solver(
+    solver_name: str, backend: Backend | None, fields: list[tuple[str, Any]]
+) -> Any:
+    backends = SOLVER_BACKENDS[solver_name]
+
+    if backend is not None and backend not in backends:
+        raise ValueError(
+            f"Solver {solver_name!r} supports only the {', '.join(backends)} backend."
+        )
+
+    solver_class = get_solver_class(solver_name)
+    unknown = [name for name, _ in fields if name not in solver_class.model_fields]
+
+    if unknown:
+        raise ValueError(
+            f"Unknown fields for solver {solver_name!r}: {', '.join(unknown)}."
+        )
+
+    backend_fields = backends.get(backend, {}) if backend is not None else {}
+    return solver_class.model_validate(backend_fields | dict(fields))
+
+
+def write_rows(rows: list[dict[str, Any]], output: Path | None) -> None:
+    if output is None:
+        json.dump(rows, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    if output.suffix == ".parquet":
+        import pandas as pd
+
+        pd.DataFrame(rows).to_parquet(output, index=False)
+    else:
+        output.write_text(json.dumps(rows, indent=2))
+
+
+async def run_solver(
+    solver: Any, runs: int, workers: int, seed: int | None, time_budget: float | None
+) -> list[dict[str, Any]]:
+    from service import EvaluationService
+
+    rngs = np.random.default_rng(solver.seed if seed is None else seed).spawn(runs)
+    rows: list[dict[str, Any]] = []
+    start = time.perf_counter()
+
+    async with EvaluationService(workers=workers) as service:
+        pending: set[asyncio.Task[dict[str, Any]]] = set()
+
+        async def run(run_index: int) -> dict[str, Any]:
+            run_start = time.perf_counter()
+            best_team, best_fitness, _, _ = await service.solve(
+                solver, rng=rngs[run_index]
+            )
+            return {
+                "run": run_index,
+                "solver": type(solver).__name__,
+                "fitness": best_fitness,
+                "team_ids": best_team.get_ids(),
+                "team_names": best_team.get_names(),
+                "stats_sum": best_team.get_stats_sum(),
+                "seconds": time.perf_counter() - run_start,
+            }
+
+        # The time budget stops new runs from starting, runs already started
+        # are always finished and reported.
+        for run_index in range(runs):
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                break
+
+            pending.add(asyncio.create_task(run(run_index)))
+
+            if len(pending) >= workers:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                rows.extend(task.result() for task in done)
+
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            rows.extend(task.result() for task in done)
+
+    return sorted(rows, key=lambda row: row["run"])
+
+
+def command_solve(arguments: argparse.Namespace) -> int:
+    rows = asyncio.run(
+        run_solver(
+            arguments.solver_instance,
+            arguments.runs,
+            arguments.workers,
+            arguments.seed,
+            arguments.time_budget,
+        )
+    )
+    write_rows(rows, arguments.output)
+    return 0
+
+
+def command_solvers(arguments: argparse.Namespace) -> int:
+    rows = [
+        {
+            "solver": solver_name,
+            "backends": list(SOLVER_BACKENDS[solver_name]),
+            "fields": {
+                name: repr(field.default)
+                for name, field in get_solver_class(solver_name).model_fields.items()
+            },
+        }
+        for solver_name in SOLVERS
+    ]
+    write_rows(rows, arguments.output)
+    return 0
+
+
+def command_bench(arguments: argparse.Namespace) -> int:
+    from benchmarks import (
+        check_import_budget,
+        run_scaling_benchmarks,
+        run_throughput_benchmarks,
+    )
+    from data import get_pokemons
+
+    results = run_throughput_benchmarks(
+        get_pokemons(),
+        battles=arguments.battles,
+        reference_battles=arguments.reference_battles,
+        rng=arguments.seed,
+    )
+    rows = [result.to_dict() for result in results]
+
+    if arguments.pool_sizes:
+        scaling = run_scaling_benchmarks(arguments.pool_sizes, rng=arguments.seed)
+        rows.extend(result.to_dict() for result in scaling)
+
+    failures = check_import_budget()
+    rows.append({"name": "import_budget", "failures": failures})
+
+    write_rows(rows, arguments.output)
+    return 1 if failures else 0
+
+
+def command_experiments(arguments: argparse.Namespace) -> int:
+    if arguments.experiments == "sa":
+        from experiments.sa_experiments import perform_sa_experiments
+
+        perform_sa_experiments()
+    else:
+        from experiments import perform_ea_experiments
+
+        perform_ea_experiments()
+
+    return 0
+
+
+def output_path(value: str) -> Path:
+    path = Path(value)
+
+    if path.suffix not in OUTPUT_FORMATS:
+        raise argparse.ArgumentTypeError(
+            f"Output must end with one of {', '.join(OUTPUT_FORMATS)}."
+        )
+
+    return path
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pop-project", description="Search for the best pokemon team."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    solve = subparsers.add_parser("solve", help="run a solver")
+    solve.add_argument("solver", choices=SOLVERS)
+    solve.add_argument(
+        "--set",
+        dest="field",
+        metavar="FIELD=VALUE",
+        type=parse_field,
+        action="append",
+        default=[],
+        help="set a solver field, values are parsed as JSON when possible",
+    )
+    solve.add_argument("--backend", choices=BACKENDS)
+    solve.add_argument("--runs", type=int, default=1)
+    solve.add_argument("--workers", type=int, default=DEFAULT_SERVICE_WORKERS)
+    solve.add_argument("--seed", type=int)
+    solve.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="do not start new runs after this many seconds",
+    )
+    solve.add_argument("--output", type=output_path)
+    solve.set_defaults(handler=command_solve)
+
+    solvers = subparsers.add_parser("solvers", help="list solvers and fields")
+    solvers.add_argument("--output", type=output_path)
+    solvers.set_defaults(handler=command_solvers)
+
+    bench = subparsers.add_parser("bench", help="run throughput benchmarks")
+    bench.add_argument("--battles", type=int, default=DEFAULT_BENCH_BATTLES)
+    bench.add_argument(
+        "--reference-battles", type=int, default=DEFAULT_BENCH_REFERENCE_BATTLES
+    )
+    bench.add_argument(
+        "--pool-sizes",
+        type=int,
+        nargs="+",
+        help="also measure scaling on synthetic pools of these sizes",
+    )
+    bench.add_argument("--seed", type=int)
+    bench.add_argument("--output", type=output_path)
+    bench.set_defaults(handler=command_bench)
+
+    experiments = subparsers.add_parser("experiments", help="run experiments")
+    experiments.add_argument(
+        "experiments", choices=("ea", "sa"), nargs="?", default="ea"
+    )
+    experiments.set_defaults(handler=command_experiments)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = create_parser()
+    arguments = parser.parse_args(argv)
+
+    # Running without a command keeps the old behaviour of main.py.
+    if arguments.command is None:
+        arguments = parser.parse_args(["experiments", "ea"])
+
+    # Only invalid solver settings are usage errors, errors raised while a
+    # command runs are not caught.
+    if arguments.command == "solve":
+        try:
+            arguments.solver_instance = create_solver(
+                arguments.solver, arguments.backend, arguments.field
+            )
+        except ValueError as error:
+            parser.error(str(error))
+
+    return int(arguments.handler(arguments))
@@ -4,9 +4,15 @@ from .constants import (
     ATTACK,
     COMPLETE_POKEMON_DATA_SET_PATH,
     CURRENT,
+    DEFAULT_COEVOLUTION_TOP_TEAMS,
+    DEFAULT_CROSSOVER_RATE,
+    DEFAULT_CROSSOVER_TYPE,
     DEFAULT_ELITE_SIZE,
     DEFAULT_GENERATIONS,
+    DEFAULT_HALL_OF_FAME_SIZE,
+    DEFAULT_HISTORY_LIMIT,
     DEFAULT_MUTATION_RATE,
+    DEFAULT_OBJECTIVES,
     DEFAULT_OPPONENTS_LIMIT,
     DEFAULT_POPULATION_SIZE,
     DEFAULT_TOURNAMENT_SIZE,
@@ -31,6 +37,7 @@ from .constants import (
     STATS_COLS,
     TEAM_SIZE,
     TYPES,
+    NO_TYPE_LABEL,
     DEFAULT_INITIAL_TEMPERATURE,
     DEFAULT_MIN_TEMPERATURE,
     DEFAULT_ALPHA,
@@ -47,9 +54,59 @@ from .constants import (
     DEFAULT_TRIALS,
     DEFAULT_HILL_CLIMBING_NEIGHBOUR_PER_STEP,
     DEFAULT_HILL_CLIMBING_MAX_EVALUATIONS,
+    DEFAULT_HILL_CLIMBING_STEEPEST_MAX_EVALUATIONS,
     STATS_SUM,
     SA_REPORT_PATH,
-    REPORT_DIR
+    REPORT_DIR,
+    DEFAULT_OPPONENTS_CANDIDATES_LIMIT,
+    DEFAULT_REPRESENTATIVE_OPPONENTS,
+    DEFAULT_CLUSTERING_ITERATIONS,
+    MAX_SAMPLING_ROUNDS,
+    SAMPLING_CHUNK_SIZE,
+    MAX_REJECTION_ROUNDS,
+    MAX_CANDIDATE_REJECTIONS,
+    DEFAULT_TABU_MAX_EVALUATIONS,
+    DEFAULT_TABU_NEIGHBOURS_PER_STEP,
+    DEFAULT_TABU_TENURE,
+    DEFAULT_TABU_OPPONENTS_LIMIT,
+    DEFAULT_TABU_PATIENCE,
+    DEFAULT_TABU_RESTARTS,
+    BATTLES_CHUNK_SIZE,
+    DAMAGE_CHUNK_SIZE,
+    DEFAULT_TOURNAMENT_BLOCK_SIZE,
+    DEFAULT_TOURNAMENT_WORKERS,
+    DEFAULT_BRADLEY_TERRY_PRIOR,
+    DEFAULT_BRADLEY_TERRY_ITERATIONS,
+    DEFAULT_BRADLEY_TERRY_TOLERANCE,
+    ELO_BASE_RATING,
+    ELO_SCALE,
+    DEFAULT_SERVICE_WORKERS,
+    DEFAULT_SERVICE_CHUNK_SIZE,
+    DEFAULT_SERVICE_CACHE_ENTRIES,
+    IMPORT_TIME_BUDGET_SECONDS,
+    IMPORT_TIME_REPEATS,
+    DEFAULT_BENCH_BATTLES,
+    DEFAULT_BENCH_REFERENCE_BATTLES,
+    DEFAULT_BENCH_TEAMS,
+    DEFAULT_SURROGATE_FRACTION,
+    DEFAULT_SURROGATE_MIN_SAMPLES,
+    DEFAULT_SURROGATE_RIDGE_ALPHA,
+    DEFAULT_SURROGATE_NEIGHBORS,
+    DEFAULT_SURROGATE_MAX_SAMPLES,
+    DEFAULT_SURROGATE_CORRELATION_WINDOW,
+    DEFAULT_REPORT_WORKERS,
+    DEFAULT_REPORT_DPI,
+    DEFAULT_REPORT_ROWS_PER_PAGE,
+    DEFAULT_HISTORY_QUANTILES,
+    DEFAULT_HISTORY_BINS,
+    RESULTS_DIR,
+    DEFAULT_SYNTHETIC_STAT_NOISE,
+    DEFAULT_SCALING_POOL_SIZES,
+    DEFAULT_SCALING_TEAMS,
+    DEFAULT_SCALING_DATAFRAME_TEAMS,
+    DEFAULT_DAMAGE_TILE_SIZE,
+    DEFAULT_DAMAGE_TABLE_BYTES,
+    MAX_DAMAGE_CACHE_ENTRIES,
 )
 
 __all__ = [
@@ -58,6 +115,7 @@ __all__ = [
     "FIRST_TYPE",
     "SECOND_TYPE",
     "TYPES",
+    "NO_TYPE_LABEL",
     "HP",
     "ATTACK",
     "SPECIAL_ATTACK",
@@ -83,6 +141,12 @@ __all__ = [
     "DEFAULT_ELITE_SIZE",
     "DEFAULT_TOURNAMENT_SIZE",
     "DEFAULT_OPPONENTS_LIMIT",
+    "DEFAULT_CROSSOVER_RATE",
+    "DEFAULT_CROSSOVER_TYPE",
+    "DEFAULT_HISTORY_LIMIT",
+    "DEFAULT_HALL_OF_FAME_SIZE",
+    "DEFAULT_COEVOLUTION_TOP_TEAMS",
+    "DEFAULT_OBJECTIVES",
     "MAX_STEPS_PER_BATTLE",
     "EXPERIMENTS_IMAGES_DIR",
     "DEFAULT_INITIAL_TEMPERATURE",
@@ -101,7 +165,57 @@ __all__ = [
     "DEFAULT_HILL_CLIMBING_PATIENCE",
     "DEFAULT_HILL_CLIMBING_RESTARTS",
     "DEFAULT_HILL_CLIMBING_NEIGHBOUR_REPLACEMENTS",
+    "DEFAULT_HILL_CLIMBING_STEEPEST_MAX_EVALUATIONS",
     "STATS_SUM",
     "SA_REPORT_PATH",
-    "REPORT_DIR"
+    "REPORT_DIR",
+    "DEFAULT_OPPONENTS_CANDIDATES_LIMIT",
+    "DEFAULT_REPRESENTATIVE_OPPONENTS",
+    "DEFAULT_CLUSTERING_ITERATIONS",
+    "MAX_SAMPLING_ROUNDS",
+    "SAMPLING_CHUNK_SIZE",
+    "MAX_REJECTION_ROUNDS",
+    "MAX_CANDIDATE_REJECTIONS",
+    "DEFAULT_TABU_MAX_EVALUATIONS",
+    "DEFAULT_TABU_NEIGHBOURS_PER_STEP",
+    "DEFAULT_TABU_TENURE",
+    "DEFAULT_TABU_OPPONENTS_LIMIT",
+    "DEFAULT_TABU_PATIENCE",
+    "DEFAULT_TABU_RESTARTS",
+    "BATTLES_CHUNK_SIZE",
+    "DAMAGE_CHUNK_SIZE",
+    "DEFAULT_TOURNAMENT_BLOCK_SIZE",
+    "DEFAULT_TOURNAMENT_WORKERS",
+    "DEFAULT_BRADLEY_TERRY_PRIOR",
+    "DEFAULT_BRADLEY_TERRY_ITERATIONS",
+    "DEFAULT_BRADLEY_TERRY_TOLERANCE",
+    "ELO_BASE_RATING",
+    "ELO_SCALE",
+    "DEFAULT_SERVICE_WORKERS",
+    "DEFAULT_SERVICE_CHUNK_SIZE",
+    "DEFAULT_SERVICE_CACHE_ENTRIES",
+    "IMPORT_TIME_BUDGET_SECONDS",
+    "IMPORT_TIME_REPEATS",
+    "DEFAULT_BENCH_BATTLES",
+    "DEFAULT_BENCH_REFERENCE_BATTLES",
+    "DEFAULT_BENCH_TEAMS",
+    "DEFAULT_SURROGATE_FRACTION",
+    "DEFAULT_SURROGATE_MIN_SAMPLES",
+    "DEFAULT_SURROGATE_RIDGE_ALPHA",
+    "DEFAULT_SURROGATE_NEIGHBORS",
+    "DEFAULT_SURROGATE_MAX_SAMPLES",
+    "DEFAULT_SURROGATE_CORRELATION_WINDOW",
+    "DEFAULT_REPORT_WORKERS",
+    "DEFAULT_REPORT_DPI",
+    "DEFAULT_REPORT_ROWS_PER_PAGE",
+    "DEFAULT_HISTORY_QUANTILES",
+    "DEFAULT_HISTORY_BINS",
+    "RESULTS_DIR",
+    "DEFAULT_SYNTHETIC_STAT_NOISE",
+    "DEFAULT_SCALING_POOL_SIZES",
+    "DEFAULT_SCALING_TEAMS",
+    "DEFAULT_SCALING_DATAFRAME_TEAMS",
+    "DEFAULT_DAMAGE_TILE_SIZE",
+    "DEFAULT_DAMAGE_TABLE_BYTES",
+    "MAX_DAMAGE_CACHE_ENTRIES",
 ]
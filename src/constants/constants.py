@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Final, Literal
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATASETS_DIR = PROJECT_ROOT / "data" / "datasets"
@@ -10,6 +11,11 @@ EXPERIMENTS_IMAGES_DIR = PROJECT_ROOT / "experiments" / "images"
 TEAM_SIZE = 6
 POKEMON_TO_REPLACE_AMOUNT = 2
 
+MAX_SAMPLING_ROUNDS = 20
+SAMPLING_CHUNK_SIZE = 4096
+MAX_REJECTION_ROUNDS = 8
+MAX_CANDIDATE_REJECTIONS = 64
+
 ID = "pokedex_number"
 NAME = "name"
 FIRST_TYPE = "type1"
@@ -35,6 +41,7 @@ TYPES = [
     "steel",
     "water",
 ]
+NO_TYPE_LABEL = "none"
 
 HP = "hp"
 ATTACK = "attack"
@@ -86,8 +93,18 @@ DEFAULT_MUTATION_RATE = 0.6
 DEFAULT_ELITE_SIZE = 1
 DEFAULT_TOURNAMENT_SIZE = 3
 DEFAULT_OPPONENTS_LIMIT = 100
+DEFAULT_CROSSOVER_RATE = 0.0
+DEFAULT_CROSSOVER_TYPE: Final[Literal["uniform", "slot", "type_aware"]] = "type_aware"
+DEFAULT_HISTORY_LIMIT = 100
+DEFAULT_HALL_OF_FAME_SIZE = 10
+DEFAULT_COEVOLUTION_TOP_TEAMS = 5
+DEFAULT_OBJECTIVES: Final[
+    tuple[Literal["mean_hp_ratio", "win_rate", "worst_case", "stats_sum"], ...]
+] = ("mean_hp_ratio", "win_rate", "worst_case", "stats_sum")
 
 MAX_STEPS_PER_BATTLE = 1000
+BATTLES_CHUNK_SIZE = 65536
+DAMAGE_CHUNK_SIZE = 1 << 22
 
 # Default parameters for simulated annealing solver
 DEFAULT_INITIAL_TEMPERATURE = 0.5
@@ -110,6 +127,73 @@ DEFAULT_HILL_CLIMBING_NEIGHBOUR_REPLACEMENTS = 1
 DEFAULT_HILL_CLIMBING_OPPONENTS_LIMIT = 100
 DEFAULT_HILL_CLIMBING_RESTARTS = 0
 DEFAULT_HILL_CLIMBING_PATIENCE = 100
+# Steepest ascent scores whole neighbourhoods of 1000 to 2000 moves per step.
+DEFAULT_HILL_CLIMBING_STEEPEST_MAX_EVALUATIONS = 20_000
+
+# Default parameters for tabu search solver
+DEFAULT_TABU_MAX_EVALUATIONS = 200
+DEFAULT_TABU_NEIGHBOURS_PER_STEP = 20
+DEFAULT_TABU_TENURE = 10
+DEFAULT_TABU_OPPONENTS_LIMIT = 100
+DEFAULT_TABU_PATIENCE = 30
+DEFAULT_TABU_RESTARTS = 0
+
+# Default parameters for opponents compression
+DEFAULT_OPPONENTS_CANDIDATES_LIMIT = 100
+DEFAULT_REPRESENTATIVE_OPPONENTS = 20
+DEFAULT_CLUSTERING_ITERATIONS = 100
+
+# Default parameters for round robin tournaments
+DEFAULT_TOURNAMENT_BLOCK_SIZE = 256
+DEFAULT_TOURNAMENT_WORKERS = 1
+DEFAULT_BRADLEY_TERRY_PRIOR = 0.5
+DEFAULT_BRADLEY_TERRY_ITERATIONS = 1000
+DEFAULT_BRADLEY_TERRY_TOLERANCE = 1e-9
+ELO_BASE_RATING = 1500.0
+ELO_SCALE = 400.0
+
+# Default parameters for the evaluation service
+DEFAULT_SERVICE_WORKERS = 4
+DEFAULT_SERVICE_CHUNK_SIZE = 256
+DEFAULT_SERVICE_CACHE_ENTRIES = 1 << 20
+
+# Import time budget of the NumPy only core
+IMPORT_TIME_BUDGET_SECONDS = 0.5
+IMPORT_TIME_REPEATS = 3
+
+# Default sizes of the throughput benchmarks
+DEFAULT_BENCH_BATTLES = 100_000
+DEFAULT_BENCH_REFERENCE_BATTLES = 200
+DEFAULT_BENCH_TEAMS = 100_000
+
+# Default parameters for surrogate-assisted search
+DEFAULT_SURROGATE_FRACTION = 0.25
+DEFAULT_SURROGATE_MIN_SAMPLES = 50
+DEFAULT_SURROGATE_RIDGE_ALPHA = 1.0
+DEFAULT_SURROGATE_NEIGHBORS = 10
+DEFAULT_SURROGATE_MAX_SAMPLES = 20_000
+DEFAULT_SURROGATE_CORRELATION_WINDOW = 200
+
+# Default parameters for pdf reports
+DEFAULT_REPORT_WORKERS = 1
+DEFAULT_REPORT_DPI = 150
+DEFAULT_REPORT_ROWS_PER_PAGE = 25
+
+# Default parameters for history plots
+DEFAULT_HISTORY_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+DEFAULT_HISTORY_BINS = 50
+
+# Default parameters for synthetic pools and scaling benchmarks
+DEFAULT_SYNTHETIC_STAT_NOISE = 0.1
+DEFAULT_SCALING_POOL_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_SCALING_TEAMS = 10_000
+DEFAULT_SCALING_DATAFRAME_TEAMS = 20
+
+# Default parameters for damage tables
+DEFAULT_DAMAGE_TILE_SIZE = 64
+DEFAULT_DAMAGE_TABLE_BYTES = 1 << 28
+MAX_DAMAGE_CACHE_ENTRIES = 1 << 20
 
 REPORT_DIR = PROJECT_ROOT / "data" / "reports"
+RESULTS_DIR = PROJECT_ROOT / "data" / "results"
 SA_REPORT_PATH = PROJECT_ROOT / "data" / "reports" / "sa_experiments_report.pdf"
@@ -1,3 +1,55 @@
-from .data import get_pokemon_with_excluded_ids, get_pokemons
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["get_pokemons", "get_pokemon_with_excluded_ids"]
+from .pool import PokemonPool, TypeMaskIndex, get_pokemon_pool
+from .pool_index import PokemonPoolIndex, get_pokemon_pool_index
+from .shared_pool import (
+    SharedArrayLayout,
+    SharedArrays,
+    SharedArraysHandle,
+    share_pokemon_pool,
+)
+from .team_keys import (
+    get_canonical_team_keys,
+    get_canonical_teams,
+    get_team_keys,
+    get_unique_team_indexes,
+)
+
+if TYPE_CHECKING:
+    from .data import get_pokemon_with_excluded_ids, get_pokemons
+    from .synthetic import generate_synthetic_pokemons
+
+_LAZY_IMPORTS = {
+    "get_pokemon_with_excluded_ids": ".data",
+    "get_pokemons": ".data",
+    "generate_synthetic_pokemons": ".synthetic",
+}
+
+__all__ = [
+    "get_pokemons",
+    "get_pokemon_with_excluded_ids",
+    "generate_synthetic_pokemons",
+    "get_pokemon_pool",
+    "PokemonPool",
+    "TypeMaskIndex",
+    "get_pokemon_pool_index",
+    "PokemonPoolIndex",
+    "SharedArrayLayout",
+    "SharedArrays",
+    "SharedArraysHandle",
+    "share_pokemon_pool",
+    "get_team_keys",
+    "get_canonical_teams",
+    "get_canonical_team_keys",
+    "get_unique_team_indexes",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from constants import (
+    AGAINST_COLS,
+    ATTACK,
+    DEFENSE,
+    FIRST_TYPE,
+    HP,
+    ID,
+    SECOND_TYPE,
+    SPECIAL_ATTACK,
+    SPECIAL_DEFENSE,
+    SPEED,
+    TYPES,
+)
+
+if TYPE_CHECKING:
+    from pandera.typing import DataFrame
+
+    from schemas import PokemonSchema
+
+NO_TYPE = -1
+
+
+@dataclass(frozen=True)
+class TypeMaskIndex:
+    masks: np.ndarray
+    counts: np.ndarray
+    starts: np.ndarray
+    positions: np.ndarray
+
+    def get_groups_amount(self) -> int:
+        return len(self.masks)
+
+
+@dataclass(frozen=True, eq=False)
+class PokemonPool:
+    ids: np.ndarray
+    hp: np.ndarray
+    attack: np.ndarray
+    sp_attack: np.ndarray
+    defense: np.ndarray
+    sp_defense: np.ndarray
+    speed: np.ndarray
+    first_types: np.ndarray
+    second_types: np.ndarray
+    against: np.ndarray
+
+    def get_size(self) -> int:
+        return len(self.ids)
+
+    @cached_property
+    def id_order(self) -> np.ndarray:
+        return np.argsort(self.ids)
+
+    @cached_property
+    def type_masks(self) -> np.ndarray:
+        masks = np.left_shift(np.int64(1), self.first_types.astype(np.int64))
+        has_second_type = self.second_types != NO_TYPE
+        masks[has_second_type] |= np.left_shift(
+            np.int64(1), self.second_types[has_second_type].astype(np.int64)
+        )
+        masks.setflags(write=False)
+        return masks
+
+    @cached_property
+    def type_mask_index(self) -> TypeMaskIndex:
+        # There are at most a few hundred distinct type combinations, so
+        # sampling over groups of equal masks does not depend on the pool size.
+        masks, inverse, counts = np.unique(
+            self.get_type_masks(), return_inverse=True, return_counts=True
+        )
+        return TypeMaskIndex(
+            masks=masks,
+            counts=counts,
+            starts=np.cumsum(counts) - counts,
+            positions=np.argsort(inverse.ravel(), kind="stable"),
+        )
+
+    def get_positions(self, ids: np.ndarray) -> np.ndarray:
+        ids = np.asarray(ids, dtype=self.ids.dtype)
+        sorter = self.id_order
+        found = np.searchsorted(self.ids, ids, sorter=sorter)
+        found = np.minimum(found, len(self.ids) - 1)
+        positions = sorter[found]
+
+        if not np.array_equal(self.ids[positions], ids):
+            raise ValueError("Some pokemon ids are not present in the pool.")
+
+        return positions
+
+    def get_type_masks(self) -> np.ndarray:
+        return self.type_masks
+
+
+def get_type_codes(types: np.ndarray) -> np.ndarray:
+    codes = np.full(len(types), NO_TYPE, dtype=np.int8)
+    known = np.isin(types, TYPES)
+    codes[known] = np.searchsorted(np.array(TYPES), types[known].astype(str))
+    return codes
+
+
+def get_pokemon_pool(pokemons: "DataFrame[PokemonSchema]") -> PokemonPool:
+    def column(name: str) -> np.ndarray:
+        return pokemons[name].to_numpy(dtype=np.int32)
+
+    return PokemonPool(
+        ids=column(ID),
+        hp=column(HP),
+        attack=column(ATTACK),
+        sp_attack=column(SPECIAL_ATTACK),
+        defense=column(DEFENSE),
+        sp_defense=column(SPECIAL_DEFENSE),
+        speed=column(SPEED),
+        first_types=get_type_codes(pokemons[FIRST_TYPE].to_numpy(dtype=object)),
+        second_types=get_type_codes(pokemons[SECOND_TYPE].to_numpy(dtype=object)),
+        against=pokemons[AGAINST_COLS].to_numpy(dtype=np.float64),
+    )
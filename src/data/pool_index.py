@@ -0,0 +1,99 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from constants import ID, NAME
+
+if TYPE_CHECKING:
+    from pandera.typing import DataFrame
+
+    from schemas import PokemonSchema
+
+MISSING_POSITION = -1
+
+
+class PokemonPoolIndex:
+    def __init__(self, names: np.ndarray, ids: np.ndarray) -> None:
+        self.names = np.asarray(names, dtype=str)
+        self.ids = np.asarray(ids, dtype=np.int64)
+
+        if len(self.names) != len(self.ids):
+            raise ValueError("Names and ids must have the same length.")
+
+        if len(np.unique(self.names)) != len(self.names):
+            raise ValueError("Pokemon names in the pool must be unique.")
+
+        if len(np.unique(self.ids)) != len(self.ids):
+            raise ValueError("Pokemon ids in the pool must be unique.")
+
+        positions = np.arange(len(self.ids), dtype=np.intp)
+        self.position_by_name = dict(
+            zip(self.names.tolist(), positions.tolist(), strict=True)
+        )
+
+        # Pokedex numbers are small, so a dense table maps them to positions
+        # with a single gather, for one id and for whole team arrays alike.
+        table_size = int(self.ids.max()) + 1 if len(self.ids) > 0 else 0
+        self.position_by_id = np.full(table_size, MISSING_POSITION, dtype=np.intp)
+        self.position_by_id[self.ids] = positions
+
+        self.name_order = np.argsort(self.names)
+        self.sorted_names = self.names[self.name_order]
+
+    def get_size(self) -> int:
+        return len(self.ids)
+
+    def get_position(self, name: str) -> int:
+        if name not in self.position_by_name:
+            raise ValueError(f"Pokemon {name!r} is not present in the pool.")
+
+        return int(self.position_by_name[name])
+
+    def get_position_by_id(self, pokemon_id: int | str) -> int:
+        return int(self.encode_ids(np.array([pokemon_id]))[0])
+
+    def encode_names(self, names: np.ndarray | list) -> np.ndarray:
+        names = np.asarray(names, dtype=str)
+        found = np.searchsorted(self.sorted_names, names)
+        found = np.minimum(found, max(len(self.sorted_names) - 1, 0))
+        missing = (
+            self.sorted_names[found] != names
+            if len(self.sorted_names) > 0
+            else np.ones(names.shape, dtype=bool)
+        )
+
+        if missing.any():
+            unknown = np.unique(names[missing]).tolist()
+            raise ValueError(f"Pokemon names are not present in the pool: {unknown}")
+
+        return self.name_order[found]
+
+    def encode_ids(self, ids: np.ndarray | list) -> np.ndarray:
+        ids = np.asarray(ids).astype(np.int64)
+        known = (ids >= 0) & (ids < len(self.position_by_id))
+        positions = np.full(ids.shape, MISSING_POSITION, dtype=np.intp)
+        positions[known] = self.position_by_id[ids[known]]
+
+        if (positions == MISSING_POSITION).any():
+            unknown = np.unique(ids[positions == MISSING_POSITION]).tolist()
+            raise ValueError(f"Pokemon ids are not present in the pool: {unknown}")
+
+        return positions
+
+    def get_names(self, positions: np.ndarray) -> np.ndarray:
+        return np.asarray(self.names[positions])
+
+    def get_ids(self, positions: np.ndarray) -> np.ndarray:
+        return np.asarray(self.ids[positions])
+
+    def names_to_ids(self, names: np.ndarray | list) -> np.ndarray:
+        return np.asarray(self.ids[self.encode_names(names)])
+
+    def ids_to_names(self, ids: np.ndarray | list) -> np.ndarray:
+        return np.asarray(self.names[self.encode_ids(ids)])
+
+
+def get_pokemon_pool_index(pokemons: "DataFrame[PokemonSchema]") -> PokemonPoolIndex:
+    return PokemonPoolIndex(
+        pokemons[NAME].to_numpy(dtype=str), pokemons[ID].to_numpy(dtype=np.int64)
+    )
@@ -0,0 +1,104 @@
+from dataclasses import dataclass, fields
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Self
+
+import numpy as np
+
+from .pool import PokemonPool
+
+SHARED_ARRAYS_ALIGNMENT = 64
+
+
+@dataclass(frozen=True)
+class SharedArrayLayout:
+    name: str
+    dtype: str
+    shape: tuple[int, ...]
+    offset: int
+
+
+@dataclass(frozen=True)
+class SharedArraysHandle:
+    memory_name: str
+    layouts: tuple[SharedArrayLayout, ...]
+
+
+class SharedArrays:
+    def __init__(
+        self, memory: SharedMemory, handle: SharedArraysHandle, owner: bool
+    ) -> None:
+        self.memory = memory
+        self.handle = handle
+        self.owner = owner
+
+    @classmethod
+    def create(cls, arrays: dict[str, np.ndarray]) -> "SharedArrays":
+        layouts: list[SharedArrayLayout] = []
+        offset = 0
+
+        for name, array in arrays.items():
+            layouts.append(
+                SharedArrayLayout(name, array.dtype.str, array.shape, offset)
+            )
+            aligned_size = -(-array.nbytes // SHARED_ARRAYS_ALIGNMENT)
+            offset += aligned_size * SHARED_ARRAYS_ALIGNMENT
+
+        memory = SharedMemory(create=True, size=max(offset, 1))
+        shared = cls(memory, SharedArraysHandle(memory.name, tuple(layouts)), True)
+
+        for layout, array in zip(layouts, arrays.values(), strict=True):
+            shared._get_view(layout)[...] = array
+
+        return shared
+
+    @classmethod
+    def attach(cls, handle: SharedArraysHandle) -> "SharedArrays":
+        return cls(SharedMemory(name=handle.memory_name), handle, False)
+
+    def _get_view(self, layout: SharedArrayLayout) -> np.ndarray:
+        return np.ndarray(
+            layout.shape,
+            dtype=np.dtype(layout.dtype),
+            buffer=self.memory.buf,
+            offset=layout.offset,
+        )
+
+    def get_arrays(self) -> dict[str, np.ndarray]:
+        arrays: dict[str, np.ndarray] = {}
+
+        # Views are read only, workers must never change the shared pool.
+        for layout in self.handle.layouts:
+            view = self._get_view(layout)
+            view.flags.writeable = False
+            arrays[layout.name] = view
+
+        return arrays
+
+    def get_pool(self) -> PokemonPool:
+        arrays = self.get_arrays()
+        return PokemonPool(
+            **{field.name: arrays[field.name] for field in fields(PokemonPool)}
+        )
+
+    def close(self) -> None:
+        self.memory.close()
+
+        if self.owner:
+            self.memory.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def share_pokemon_pool(pool: PokemonPool, **extra_arrays: np.ndarray) -> SharedArrays:
+    arrays = {field.name: getattr(pool, field.name) for field in fields(PokemonPool)}
+    return SharedArrays.create(arrays | extra_arrays)
@@ -0,0 +1,41 @@
+import numpy as np
+from pandera.typing import DataFrame
+
+from constants import DEFAULT_SYNTHETIC_STAT_NOISE, HP, ID, NAME, SPEED, STATS_COLS
+from schemas import PokemonSchema
+
+from .data import get_pokemons
+
+
+def generate_synthetic_pokemons(
+    size: int,
+    pokemons: DataFrame[PokemonSchema] | None = None,
+    stat_noise: float = DEFAULT_SYNTHETIC_STAT_NOISE,
+    rng: np.random.Generator | int | None = None,
+) -> DataFrame[PokemonSchema]:
+    if size <= 0:
+        raise ValueError("size must be positive.")
+
+    if stat_noise < 0:
+        raise ValueError("stat_noise must not be negative.")
+
+    if pokemons is None:
+        pokemons = get_pokemons(
+            include_legendary=True, include_only_final_evolutions=False
+        )
+
+    rng = np.random.default_rng(rng)
+    stats_cols = [HP, *STATS_COLS, SPEED]
+
+    # Every synthetic pokemon copies the typing, type effectiveness and
+    # legendary flag of a real one, so the type combinations keep their real
+    # frequencies, and only its stats are perturbed.
+    data = pokemons.iloc[rng.integers(len(pokemons), size=size)].reset_index(drop=True)
+    stats = data[stats_cols].to_numpy(dtype=float)
+    noise = rng.lognormal(sigma=stat_noise, size=stats.shape)
+    data[stats_cols] = np.maximum(np.rint(stats * noise), 1).astype(np.int64)
+
+    data[ID] = np.arange(1, size + 1)
+    data[NAME] = data[NAME].astype(str) + "-" + data[ID].astype(str)
+
+    return PokemonSchema.validate(data, lazy=True)
@@ -0,0 +1,63 @@
+import numpy as np
+
+KEY_BITS = 63
+
+HASH_SEED = 0x9E3779B97F4A7C15
+HASH_MULTIPLIERS = (0xBF58476D1CE4E5B9, 0x94D049BB133111EB)
+HASH_SHIFTS = (30, 27, 31)
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    values = values ^ (values >> np.uint64(HASH_SHIFTS[0]))
+    values = values * np.uint64(HASH_MULTIPLIERS[0])
+    values = values ^ (values >> np.uint64(HASH_SHIFTS[1]))
+    values = values * np.uint64(HASH_MULTIPLIERS[1])
+    return np.asarray(values ^ (values >> np.uint64(HASH_SHIFTS[2])), dtype=np.uint64)
+
+
+def _pack_teams(teams: np.ndarray, pool_size: int) -> np.ndarray:
+    teams = np.asarray(teams, dtype=np.int64)
+
+    if teams.ndim != 2:
+        raise ValueError("teams must be a two dimensional array.")
+
+    if float(pool_size) ** teams.shape[1] < 2**KEY_BITS:
+        keys = np.zeros(len(teams), dtype=np.int64)
+        for slot in range(teams.shape[1]):
+            keys = keys * pool_size + teams[:, slot]
+
+        return keys
+
+    # Teams of large pools do not fit into 64 bits, so they are hashed with
+    # splitmix64 instead. Collisions are possible but negligible in practice.
+    keys = np.full(len(teams), HASH_SEED, dtype=np.uint64)
+    for slot in range(teams.shape[1]):
+        keys = _mix(keys ^ teams[:, slot].astype(np.uint64))
+
+    return (keys >> np.uint64(1)).astype(np.int64)
+
+
+def get_team_keys(teams: np.ndarray, pool_size: int) -> np.ndarray:
+    # Members are packed in order, since the order changes the battle.
+    return _pack_teams(teams, pool_size)
+
+
+def get_canonical_teams(teams: np.ndarray) -> np.ndarray:
+    return np.sort(np.asarray(teams), axis=1)
+
+
+def get_canonical_team_keys(teams: np.ndarray, pool_size: int) -> np.ndarray:
+    # Teams with the same members in any order share the key.
+    return _pack_teams(get_canonical_teams(teams), pool_size)
+
+
+def get_unique_team_indexes(
+    teams: np.ndarray, pool_size: int, canonical: bool = True
+) -> np.ndarray:
+    keys = (
+        get_canonical_team_keys(teams, pool_size)
+        if canonical
+        else get_team_keys(teams, pool_size)
+    )
+    _, first_indexes = np.unique(keys, return_index=True)
+    return np.sort(first_indexes)
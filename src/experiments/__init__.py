@@ -1,3 +1,22 @@
-from .ea_experiments import perform_ea_experiments
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["perform_ea_experiments"]
+if TYPE_CHECKING:
+    from .ea_experiments import perform_ea_experiments
+
+_LAZY_IMPORTS = {
+    "perform_ea_experiments": ".ea_experiments",
+}
+
+__all__ = [
+    "perform_ea_experiments",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,7 @@ from constants import EXPERIMENTS_IMAGES_DIR
 from data import get_pokemons
 from schemas import PokemonSchema
 from solvers import EvolutionaryAlgorithmPokemonSolver
+from visualization.history import summarize_history, visualize_history_summary
 
 
 def run_multiple_runs(
@@ -20,10 +21,11 @@ def run_multiple_runs(
 
     best_teams: list[PokemonTeam] = []
     best_fitnesses: list[float] = []
+    runs_rngs = np.random.default_rng(solver.seed).spawn(runs)
 
     for i in range(runs):
         print(f"Run {i + 1}/{runs}")
-        best_team, best_fitness, _, _ = solver.solve(pokemons)
+        best_team, best_fitness, _, _ = solver.solve(pokemons, rng=runs_rngs[i])
         print(f"Best team: {best_team}")
         print(f"Best fitness: {best_fitness}")
         print(f"Best team stats sum: {best_team.get_stats_sum()}")
@@ -54,26 +56,15 @@ def create_ea_plot(
     print("Creating EA fitness over generations plot...")
     best_team, best_fitness, history, _ = solver.solve(pokemons)
 
-    for generation_index, generation in enumerate(history):
-        fitnesses = [fitness for _, fitness in generation]
-        plt.scatter(
-            [generation_index + 1] * len(fitnesses), fitnesses, color="blue", alpha=0.5
-        )
+    fig = visualize_history_summary(summarize_history(history))
 
     rng = np.random.default_rng()
-
-    plt.xlabel("Generation")
-    plt.ylabel("Fitness")
-    plt.title("Evolutionary Algorithm Fitness over Generations")
-    plt.ylim(0, 1)
-    plt.tight_layout()
-
     plot_name = f"ea_fitness_over_generations_{rng.integers(1_000_000)}.png"
 
     Path(EXPERIMENTS_IMAGES_DIR).mkdir(parents=True, exist_ok=True)
 
-    plt.savefig(EXPERIMENTS_IMAGES_DIR / plot_name)
-    plt.close()
+    fig.savefig(EXPERIMENTS_IMAGES_DIR / plot_name)
+    plt.close(fig)
 
     print(f"Plot saved as {plot_name}")
     print(f"Best team: {best_team}")
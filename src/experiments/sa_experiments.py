@@ -1,3 +1,4 @@
+import uuid
 from pathlib import Path
 from pandera.typing import DataFrame
 import matplotlib.pyplot as plt
@@ -5,9 +6,9 @@ import pandas as pd
 import numpy as np
 from pandera.typing import DataFrame
 from classes import PokemonTeam
-from constants import TEAM_SIZE, DEFAULT_OPPONENTS_LIMIT, SA_REPORT_PATH
+from constants import TEAM_SIZE, DEFAULT_OPPONENTS_LIMIT, RESULTS_DIR, SA_REPORT_PATH
 from constants.constants import DEFAULT_MAX_EVALUATIONS
-from data import get_pokemons
+from data import get_pokemon_pool, get_pokemons
 from schemas import PokemonSchema
 from solvers import (
     SimulatedAnnealingPokemonSolver,
@@ -16,6 +17,15 @@ from solvers import (
 )
 from visualization.plots import visualize_opponents_typing_distribution, visualize_opponents_stat_sums_violin
 from report.reports import PdfReport
+from simulation import (
+    DamageFormula,
+    TypeMultiplierFormula,
+    damage_attack_devide_defense,
+    get_damage_table,
+    get_remaining_hp_ratio_matrix,
+    multiply_type_multiplier,
+)
+from results import ResultsStore, RunResult
 from visualization.utils import summarize
 
 
@@ -24,15 +34,37 @@ def run_multiple_runs(
     solver: SimulatedAnnealingPokemonSolver,
     opponents: list[PokemonTeam] = None,
     runs: int = 8,
+    store: ResultsStore | None = None,
+    type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+    damage_formula: DamageFormula = damage_attack_devide_defense,
+    experiment: str | None = None,
 ) -> None:
-    print(f"Running {runs} runs of the SA solver...")
+    # Every call is stored under its own experiment name, so repeated calls
+    # appending to the same store can be told apart.
+    if experiment is None:
+        experiment = f"sa_multiple_runs-{uuid.uuid4().hex[:8]}"
+
+    print(f"Running {runs} runs of the SA solver ({experiment})...")
 
     rows = []
+    results: list[RunResult] = []
+    runs_rngs = np.random.default_rng(solver.seed).spawn(runs)
+
+    # Outcomes per opponent are stored with every run, they are the ratios the
+    # SA fitness averages.
+    pool = get_pokemon_pool(pokemons)
+    damage = get_damage_table(pool, type_multiplier_formula, damage_formula)
 
     for i in range(runs):
         print(f" Run {i+1}/{runs}...")
-        best_team, best_fitness, history, used_opponents = solver.solve(pokemons, opponents=opponents)
-        names = best_team.members['name'].tolist()
+        best_team, best_fitness, history, used_opponents = solver.solve(
+            pokemons,
+            opponents=opponents,
+            type_multiplier_formula=type_multiplier_formula,
+            damage_formula=damage_formula,
+            rng=runs_rngs[i],
+        )
+        names = best_team.get_names()
 
         print(f"  Best fitness: {best_fitness}")
         print(f"  Team: {names}")
@@ -48,6 +80,26 @@ def run_multiple_runs(
         if opponents is None:
             opponents = used_opponents
 
+        results.append(RunResult(
+            solver="SA",
+            fitness=float(best_fitness),
+            team_ids=[int(pokemon_id) for pokemon_id in best_team.get_ids()],
+            experiment=experiment,
+            config=solver.model_dump(),
+            run=i,
+            seed=solver.seed,
+            stats_sum=int(best_team.get_stats_sum()),
+            outcomes=get_remaining_hp_ratio_matrix(
+                pool,
+                damage,
+                best_team.get_positions(pool)[None, :],
+                np.array([opp.get_positions(pool) for opp in used_opponents]),
+            )[0],
+        ))
+
+    if store is not None:
+        store.append(results)
+
     return pd.DataFrame(rows)
 
 
@@ -69,8 +121,8 @@ def compare_to_random_search(
         sa_team, sa_fit, sa_hist, _ = solver.solve(pokemons, opponents=opponents, start_team=starting_team)
         rs_team, rs_fit, rs_hist, _ = baseline_solver.solve(pokemons, opponents=opponents)
 
-        sa_names = sa_team.members['name'].tolist()
-        rs_names = rs_team.members['name'].tolist()
+        sa_names = sa_team.get_names()
+        rs_names = rs_team.get_names()
 
         print(f"  SA fitness: {sa_fit}, RS fitness: {rs_fit}")
         print(f"  SA team: {sa_names}")
@@ -120,8 +172,8 @@ def compare_to_hill_climb(
         sa_team, sa_fit, sa_hist, _ = solver.solve(pokemons, opponents=opponents, start_team=starting_team)
         hc_team, hc_fit, hc_hist, _ = baseline_solver.solve(pokemons, opponents=opponents, start_team=starting_team)
 
-        sa_names = sa_team.members['name'].tolist()
-        hc_names = hc_team.members['name'].tolist()
+        sa_names = sa_team.get_names()
+        hc_names = hc_team.get_names()
 
         print(f"  SA fitness: {sa_fit}, HC fitness: {hc_fit}")
         print(f"  SA team: {sa_names}")
@@ -155,10 +207,9 @@ def compare_to_hill_climb(
 
 def perform_sa_experiments() -> None:
     pokemons = get_pokemons()
-    opponents = PokemonTeam.generate_unique_teams(
+    opponents = PokemonTeam.sample_unique_teams(
         pokemons,
-        opponents_limit=DEFAULT_OPPONENTS_LIMIT,
-        max_attempts=DEFAULT_OPPONENTS_LIMIT * 30,
+        teams_amount=DEFAULT_OPPONENTS_LIMIT,
         team_size=TEAM_SIZE,
         unique_types=True,
     )
@@ -170,7 +221,9 @@ def perform_sa_experiments() -> None:
     opponents_typings = visualize_opponents_typing_distribution(opponents)
     opponents_stats = visualize_opponents_stat_sums_violin(opponents)
 
-    df_sa_runs = run_multiple_runs(pokemons, sa, opponents=opponents, runs=8)
+    df_sa_runs = run_multiple_runs(
+        pokemons, sa, opponents=opponents, runs=8, store=ResultsStore(RESULTS_DIR)
+    )
     df_sa_vs_rs = compare_to_random_search(pokemons, sa, rs, opponents=opponents, runs=8)
     df_sa_vs_hc = compare_to_hill_climb(pokemons, sa, hc, opponents=opponents, runs=8)
 
@@ -1,4 +1,6 @@
-from experiments import perform_ea_experiments
+import sys
+
+from cli import main
 
 if __name__ == "__main__":
-    perform_ea_experiments()
+    sys.exit(main())
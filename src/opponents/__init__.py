@@ -0,0 +1,17 @@
+from .compression import (
+    CompressedOpponents,
+    CompressionError,
+    cluster_features,
+    compress_opponents,
+    evaluate_compression,
+    get_team_features,
+)
+
+__all__ = [
+    "CompressedOpponents",
+    "CompressionError",
+    "cluster_features",
+    "compress_opponents",
+    "evaluate_compression",
+    "get_team_features",
+]
@@ -0,0 +1,218 @@
+from dataclasses import dataclass
+
+import numpy as np
+from pandera.typing import DataFrame
+
+from classes import PokemonTeam
+from constants import (
+    AGAINST_COLS,
+    ATTACK,
+    DEFAULT_CLUSTERING_ITERATIONS,
+    DEFAULT_OPPONENTS_CANDIDATES_LIMIT,
+    DEFAULT_REPRESENTATIVE_OPPONENTS,
+    DEFENSE,
+    FIRST_TYPE,
+    HP,
+    SECOND_TYPE,
+    SPECIAL_ATTACK,
+    SPECIAL_DEFENSE,
+    SPEED,
+    TEAM_SIZE,
+    TYPES,
+)
+from schemas import PokemonSchema
+from simulation import (
+    DamageFormula,
+    TypeMultiplierFormula,
+    damage_attack_devide_defense,
+    get_remaining_hp_ratios,
+    multiply_type_multiplier,
+)
+
+FEATURE_STATS_COLS = [HP, ATTACK, SPECIAL_ATTACK, DEFENSE, SPECIAL_DEFENSE, SPEED]
+
+
+@dataclass
+class CompressedOpponents:
+    opponents: list[PokemonTeam]
+    weights: np.ndarray
+    candidates: list[PokemonTeam]
+    representatives_indexes: np.ndarray
+    labels: np.ndarray
+
+
+@dataclass
+class CompressionError:
+    full_fitnesses: np.ndarray
+    weighted_fitnesses: np.ndarray
+    mean_absolute_error: float
+    max_absolute_error: float
+
+
+def get_team_features(teams: list[PokemonTeam]) -> np.ndarray:
+    type_positions = {type_name: i for i, type_name in enumerate(TYPES)}
+
+    typing = np.zeros((len(teams), len(TYPES)), dtype=float)
+    defenses = np.zeros((len(teams), len(AGAINST_COLS)), dtype=float)
+    stats = np.zeros((len(teams), len(FEATURE_STATS_COLS)), dtype=float)
+
+    for i, team in enumerate(teams):
+        for type_name in team.members[[FIRST_TYPE, SECOND_TYPE]].to_numpy().ravel():
+            if type_name in type_positions:
+                typing[i, type_positions[type_name]] += 1
+
+        defenses[i] = team.members[AGAINST_COLS].to_numpy(dtype=float).mean(axis=0)
+        stats[i] = team.members[FEATURE_STATS_COLS].to_numpy(dtype=float).sum(axis=0)
+
+    # Each block is standardized and scaled by its width, so type coverage,
+    # defensive profile and stats weigh the same in the distance.
+    blocks = []
+    for block in (typing, defenses, stats):
+        std = block.std(axis=0)
+        std[std == 0] = 1.0
+        blocks.append((block - block.mean(axis=0)) / std / np.sqrt(block.shape[1]))
+
+    return np.hstack(blocks)
+
+
+def cluster_features(
+    features: np.ndarray,
+    clusters: int,
+    rng: np.random.Generator,
+    max_iterations: int = DEFAULT_CLUSTERING_ITERATIONS,
+) -> tuple[np.ndarray, np.ndarray]:
+    samples = len(features)
+
+    if clusters <= 0 or clusters > samples:
+        raise ValueError("clusters must be positive and not greater than samples.")
+
+    # k-means++ seeding
+    centroids = np.empty((clusters, features.shape[1]), dtype=float)
+    centroids[0] = features[rng.integers(samples)]
+    closest_distances = ((features - centroids[0]) ** 2).sum(axis=1)
+
+    for i in range(1, clusters):
+        total = closest_distances.sum()
+        if total > 0:
+            chosen = int(rng.choice(samples, p=closest_distances / total))
+        else:
+            chosen = int(rng.integers(samples))
+
+        centroids[i] = features[chosen]
+        closest_distances = np.minimum(
+            closest_distances, ((features - centroids[i]) ** 2).sum(axis=1)
+        )
+
+    labels = np.full(samples, -1)
+
+    for _ in range(max_iterations):
+        distances = (
+            (features**2).sum(axis=1)[:, None]
+            - 2 * features @ centroids.T
+            + (centroids**2).sum(axis=1)[None, :]
+        )
+        new_labels = distances.argmin(axis=1)
+
+        if np.array_equal(new_labels, labels):
+            break
+
+        labels = new_labels
+        counts = np.bincount(labels, minlength=clusters)
+        point_distances = distances[np.arange(samples), labels]
+
+        for empty in np.flatnonzero(counts == 0):
+            # Empty cluster takes over the worst represented point of a cluster
+            # that keeps other members, so duplicate points leave none empty.
+            donors = counts[labels] > 1
+            farthest = int(np.where(donors, point_distances, -np.inf).argmax())
+            counts[labels[farthest]] -= 1
+            counts[empty] += 1
+            labels[farthest] = empty
+
+        for i in range(clusters):
+            centroids[i] = features[labels == i].mean(axis=0)
+
+    return centroids, labels
+
+
+def compress_opponents(
+    pokemons: DataFrame[PokemonSchema],
+    candidates: list[PokemonTeam] | None = None,
+    candidates_limit: int = DEFAULT_OPPONENTS_CANDIDATES_LIMIT,
+    representatives: int = DEFAULT_REPRESENTATIVE_OPPONENTS,
+    unique_types: bool = True,
+    max_iterations: int = DEFAULT_CLUSTERING_ITERATIONS,
+    seed: int | None = None,
+) -> CompressedOpponents:
+    rng = np.random.default_rng(seed)
+
+    if candidates is None:
+        candidates = PokemonTeam.sample_unique_teams(
+            pokemons,
+            teams_amount=candidates_limit,
+            team_size=TEAM_SIZE,
+            unique_types=unique_types,
+            rng=rng,
+        )
+
+    if representatives > len(candidates):
+        raise ValueError(
+            "representatives must not be greater than the number of candidates."
+        )
+
+    features = get_team_features(candidates)
+    centroids, labels = cluster_features(features, representatives, rng, max_iterations)
+
+    # Empty clusters get no representative, labels are renumbered to index
+    # the kept ones.
+    kept = np.flatnonzero(np.bincount(labels, minlength=representatives))
+    centroids = centroids[kept]
+    labels = np.searchsorted(kept, labels)
+
+    representatives_indexes = np.empty(len(kept), dtype=int)
+    weights = np.empty(len(kept), dtype=float)
+
+    for i in range(len(kept)):
+        members = np.flatnonzero(labels == i)
+        distances = ((features[members] - centroids[i]) ** 2).sum(axis=1)
+
+        representatives_indexes[i] = members[distances.argmin()]
+        weights[i] = len(members) / len(candidates)
+
+    return CompressedOpponents(
+        opponents=[candidates[int(i)] for i in representatives_indexes],
+        weights=weights,
+        candidates=candidates,
+        representatives_indexes=representatives_indexes,
+        labels=labels,
+    )
+
+
+def evaluate_compression(
+    compressed: CompressedOpponents,
+    teams: list[PokemonTeam],
+    type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+    damage_formula: DamageFormula = damage_attack_devide_defense,
+) -> CompressionError:
+    full_fitnesses = np.empty(len(teams), dtype=float)
+    weighted_fitnesses = np.empty(len(teams), dtype=float)
+
+    for i, team in enumerate(teams):
+        # Representatives are candidates, so their results are reused.
+        ratios = get_remaining_hp_ratios(
+            team, compressed.candidates, type_multiplier_formula, damage_formula
+        )
+
+        full_fitnesses[i] = ratios.mean()
+        weighted_fitnesses[i] = np.average(
+            ratios[compressed.representatives_indexes], weights=compressed.weights
+        )
+
+    errors = np.abs(full_fitnesses - weighted_fitnesses)
+
+    return CompressionError(
+        full_fitnesses=full_fitnesses,
+        weighted_fitnesses=weighted_fitnesses,
+        mean_absolute_error=float(errors.mean()) if len(errors) else 0.0,
+        max_absolute_error=float(errors.max()) if len(errors) else 0.0,
+    )
@@ -1,29 +1,119 @@
+import io
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
-import os
+
+from constants import (
+    DEFAULT_REPORT_DPI,
+    DEFAULT_REPORT_ROWS_PER_PAGE,
+    DEFAULT_REPORT_WORKERS,
+)
+
+
+def _init_worker() -> None:
+    matplotlib.use("Agg")
+
+
+def _rasterize_page(fig: plt.Figure, dpi: int) -> bytes:
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
 
 
 class PdfReport:
-    def __init__(self, output_path: str, title: str = "Experiment report"):
+    def __init__(
+        self,
+        output_path: str | Path,
+        title: str = "Experiment report",
+        workers: int = DEFAULT_REPORT_WORKERS,
+        dpi: int = DEFAULT_REPORT_DPI,
+    ):
+        if workers <= 0:
+            raise ValueError("workers must be positive.")
+
         self.output_path = output_path
         self.title = title
-        self.pages = []
+        self.dpi = dpi
+        self.pages = 0
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        self.pdf = PdfPages(output_path)
+
+        # With several workers pages are rasterized in other processes and
+        # written in the order they were added, as soon as they are ready.
+        self.executor = (
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+            if workers > 1
+            else None
+        )
+        self.max_pending = 2 * workers
+        self.pending: deque[Future[bytes]] = deque()
+
+        # tytułowa
+        fig, ax = plt.subplots(figsize=(11.7, 8.3))
+        ax.axis("off")
+        ax.text(0.5, 0.6, self.title, ha="center", va="center", fontsize=22)
+        self._add_page(fig)
+
+    def _add_page(self, fig: plt.Figure):
+        self.pages += 1
 
-        if not os.path.exists(os.path.dirname(output_path)):
-            os.makedirs(os.path.dirname(output_path))
+        if self.executor is None:
+            self.pdf.savefig(fig, bbox_inches="tight")
+            plt.close(fig)
+            return
+
+        self.pending.append(self.executor.submit(_rasterize_page, fig, self.dpi))
+        plt.close(fig)
+
+        while self.pending and (
+            self.pending[0].done() or len(self.pending) > self.max_pending
+        ):
+            self._write_raster(self.pending.popleft().result())
+
+    def _write_raster(self, png: bytes):
+        image = plt.imread(io.BytesIO(png))
+        height, width = image.shape[:2]
+
+        fig = plt.figure(figsize=(width / self.dpi, height / self.dpi), dpi=self.dpi)
+        fig.figimage(image)
+        self.pdf.savefig(fig, dpi=self.dpi)
+        plt.close(fig)
 
     def add_text(self, text: str, fontsize: int = 12):
         fig, ax = plt.subplots(figsize=(11.7, 8.3))  # A4 landscape-ish
         ax.axis("off")
         ax.text(0.01, 0.99, text, va="top", ha="left", wrap=True, fontsize=fontsize)
-        self.pages.append(fig)
+        self._add_page(fig)
 
     def add_figure(self, fig: plt.Figure):
-        self.pages.append(fig)
-
-    def add_dataframe(self, df, title: str, max_rows: int = 25):
-        view = df.head(max_rows).copy()
+        self._add_page(fig)
+
+    def add_dataframe(
+        self, df, title: str, max_rows: int = DEFAULT_REPORT_ROWS_PER_PAGE
+    ):
+        if max_rows <= 0:
+            raise ValueError("max_rows must be positive.")
+
+        # Tables longer than max_rows continue on the following pages.
+        pages = max(1, -(-len(df) // max_rows))
+
+        for page in range(pages):
+            view = df.iloc[page * max_rows : (page + 1) * max_rows]
+            page_title = title if pages == 1 else f"{title} ({page + 1}/{pages})"
+            footer = (
+                f"Rows {page * max_rows + 1}-{page * max_rows + len(view)} of {len(df)}"
+                if pages > 1
+                else None
+            )
+            self._add_page(self._get_table_figure(view, page_title, footer))
 
+    def _get_table_figure(self, view, title: str, footer: str | None) -> plt.Figure:
         fig, ax = plt.subplots(figsize=(16, 6))
         ax.axis("off")
         ax.set_title(title, fontsize=12, pad=10)
@@ -62,26 +152,23 @@ class PdfReport:
         table.set_fontsize(8)
         table.scale(1, 1.3)
 
-        if len(df) > max_rows:
-            ax.text(
-                0.01,
-                0.02,
-                f"Showing first {max_rows} of {len(df)} rows",
-                transform=ax.transAxes,
-                fontsize=9,
-            )
+        if footer is not None:
+            ax.text(0.01, 0.02, footer, transform=ax.transAxes, fontsize=9)
 
-        self.pages.append(fig)
+        return fig
 
     def write(self):
-        with PdfPages(self.output_path) as pdf:
-            # tytułowa
-            fig, ax = plt.subplots(figsize=(11.7, 8.3))
-            ax.axis("off")
-            ax.text(0.5, 0.6, self.title, ha="center", va="center", fontsize=22)
-            pdf.savefig(fig, bbox_inches="tight")
-            plt.close(fig)
+        while self.pending:
+            self._write_raster(self.pending.popleft().result())
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        self.pdf.close()
+
+    def __enter__(self) -> "PdfReport":
+        return self
 
-            for fig in self.pages:
-                pdf.savefig(fig, bbox_inches="tight")
-                plt.close(fig)
+    def __exit__(self, exc_type, exc, traceback):
+        self.write()
@@ -0,0 +1,26 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .store import RESULTS_SCHEMA, ResultsStore, RunResult
+
+_LAZY_IMPORTS = {
+    "RESULTS_SCHEMA": ".store",
+    "ResultsStore": ".store",
+    "RunResult": ".store",
+}
+
+__all__ = [
+    "RESULTS_SCHEMA",
+    "ResultsStore",
+    "RunResult",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,151 @@
+import json
+import time
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from constants import TEAM_SIZE
+
+PART_PREFIX = "part"
+
+RESULTS_SCHEMA = pa.schema(
+    [
+        ("experiment", pa.string()),
+        ("solver", pa.string()),
+        ("config", pa.string()),
+        ("run", pa.int32()),
+        ("seed", pa.int64()),
+        ("fitness", pa.float64()),
+        ("stats_sum", pa.int64()),
+        ("team_ids", pa.list_(pa.int32(), TEAM_SIZE)),
+        ("outcomes", pa.list_(pa.float32())),
+        ("seconds", pa.float64()),
+        ("created_at", pa.timestamp("ms")),
+    ]
+)
+
+
+@dataclass
+class RunResult:
+    solver: str
+    fitness: float
+    team_ids: Sequence[int] | np.ndarray
+    experiment: str = ""
+    config: dict[str, Any] = field(default_factory=dict)
+    run: int = 0
+    seed: int | None = None
+    stats_sum: int | None = None
+    outcomes: np.ndarray | None = None
+    seconds: float | None = None
+
+
+type Filters = dict[str, Any]
+
+
+def _get_expression(filters: Filters | None) -> ds.Expression | None:
+    expression: ds.Expression | None = None
+
+    for name, value in (filters or {}).items():
+        if isinstance(value, list | tuple | set):
+            condition = ds.field(name).isin(list(value))
+        else:
+            condition = ds.field(name) == value
+
+        expression = condition if expression is None else expression & condition
+
+    return expression
+
+
+class ResultsStore:
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def append(self, results: Iterable[RunResult]) -> int:
+        results = list(results)
+
+        if not results:
+            return 0
+
+        # Every append is a new immutable part file, so writers never rewrite
+        # earlier results and readers always see whole parts.
+        columns = {
+            "experiment": [result.experiment for result in results],
+            "solver": [result.solver for result in results],
+            "config": [
+                json.dumps(result.config, sort_keys=True, default=str)
+                for result in results
+            ],
+            "run": [result.run for result in results],
+            "seed": [result.seed for result in results],
+            "fitness": [float(result.fitness) for result in results],
+            "stats_sum": [result.stats_sum for result in results],
+            "team_ids": [np.asarray(result.team_ids).tolist() for result in results],
+            "outcomes": [
+                None if result.outcomes is None else np.asarray(result.outcomes)
+                for result in results
+            ],
+            "seconds": [result.seconds for result in results],
+            "created_at": [pd.Timestamp.now()] * len(results),
+        }
+        table = pa.Table.from_pydict(columns, schema=RESULTS_SCHEMA)
+
+        name = f"{PART_PREFIX}-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+        temporary_path = self.directory / f".{name}.tmp"
+        pq.write_table(table, temporary_path)
+        temporary_path.replace(self.directory / name)
+
+        return len(results)
+
+    def get_dataset(self) -> ds.Dataset:
+        paths = sorted(self.directory.glob(f"{PART_PREFIX}-*.parquet"))
+        return ds.dataset([str(path) for path in paths], schema=RESULTS_SCHEMA)
+
+    def __len__(self) -> int:
+        return int(self.get_dataset().count_rows())
+
+    def read_table(
+        self, columns: list[str] | None = None, filters: Filters | None = None
+    ) -> pa.Table:
+        return self.get_dataset().to_table(
+            columns=columns, filter=_get_expression(filters)
+        )
+
+    def read(
+        self, columns: list[str] | None = None, filters: Filters | None = None
+    ) -> pd.DataFrame:
+        return pd.DataFrame(self.read_table(columns, filters).to_pandas())
+
+    def aggregate(
+        self,
+        by: list[str],
+        column: str = "fitness",
+        functions: tuple[str, ...] = ("mean", "min", "max", "count"),
+        filters: Filters | None = None,
+    ) -> pd.DataFrame:
+        table = self.read_table([*by, column], filters)
+        aggregated = table.group_by(by).aggregate(
+            [(column, function) for function in functions]
+        )
+        return pd.DataFrame(aggregated.to_pandas())
+
+    def get_team_ids(self, filters: Filters | None = None) -> np.ndarray:
+        teams = self.read_table(["team_ids"], filters).column("team_ids")
+        return np.asarray(pc.list_flatten(teams).to_numpy(), dtype=np.int64).reshape(
+            len(teams), TEAM_SIZE
+        )
+
+    def get_outcomes(self, filters: Filters | None = None) -> list[np.ndarray]:
+        outcomes = self.read_table(["outcomes"], filters).column("outcomes")
+        lengths = pc.list_value_length(outcomes).fill_null(0).to_numpy()
+        values = pc.list_flatten(outcomes).to_numpy().astype(float)
+        return np.split(values, np.cumsum(lengths)[:-1])
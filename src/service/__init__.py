@@ -0,0 +1,9 @@
+from .evaluation_service import EvaluationService
+from .jobs import Job, JobStatus, Progress
+
+__all__ = [
+    "EvaluationService",
+    "Job",
+    "JobStatus",
+    "Progress",
+]
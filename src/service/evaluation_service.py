@@ -0,0 +1,268 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Self
+
+import numpy as np
+from pandera.typing import DataFrame
+from pydantic import BaseModel
+
+from classes import PokemonTeam
+from constants import (
+    DEFAULT_SERVICE_CACHE_ENTRIES,
+    DEFAULT_SERVICE_CHUNK_SIZE,
+    DEFAULT_SERVICE_WORKERS,
+)
+from data import PokemonPool, get_pokemon_pool, get_pokemons
+from schemas import PokemonSchema
+from simulation import (
+    DamageFormula,
+    DamageLookup,
+    TypeMultiplierFormula,
+    damage_attack_devide_defense,
+    evaluate_teams,
+    get_damage_table,
+    get_team_keys,
+    multiply_type_multiplier,
+)
+
+from .jobs import Job
+
+
+@dataclass(frozen=True, eq=False)
+class WorkerContext:
+    pokemons: DataFrame[PokemonSchema]
+    pool: PokemonPool
+    damage: DamageLookup
+    type_multiplier_formula: TypeMultiplierFormula
+    damage_formula: DamageFormula
+
+
+_context: WorkerContext | None = None
+
+
+def _init_worker(
+    pokemons: DataFrame[PokemonSchema],
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+) -> None:
+    global _context
+    pool = get_pokemon_pool(pokemons)
+    _context = WorkerContext(
+        pokemons,
+        pool,
+        get_damage_table(pool, type_multiplier_formula, damage_formula),
+        type_multiplier_formula,
+        damage_formula,
+    )
+
+
+def _get_context() -> WorkerContext:
+    if _context is None:
+        raise RuntimeError("Worker was not initialized with a service context.")
+
+    return _context
+
+
+def _evaluate_chunk(
+    teams: np.ndarray, opponents: np.ndarray, opponents_weights: np.ndarray | None
+) -> np.ndarray:
+    context = _get_context()
+    return evaluate_teams(
+        context.pool, context.damage, teams, opponents, opponents_weights
+    )
+
+
+def _run_solver(solver: BaseModel, solve_kwargs: dict[str, Any]) -> Any:
+    context = _get_context()
+    return solver.solve(  # type: ignore[attr-defined]
+        context.pokemons,
+        type_multiplier_formula=context.type_multiplier_formula,
+        damage_formula=context.damage_formula,
+        **solve_kwargs,
+    )
+
+
+class EvaluationService:
+    def __init__(
+        self,
+        pokemons: DataFrame[PokemonSchema] | None = None,
+        workers: int = DEFAULT_SERVICE_WORKERS,
+        chunk_size: int = DEFAULT_SERVICE_CHUNK_SIZE,
+        cache_entries: int = DEFAULT_SERVICE_CACHE_ENTRIES,
+        type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+        damage_formula: DamageFormula = damage_attack_devide_defense,
+        use_processes: bool = True,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be positive.")
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+
+        if cache_entries <= 0:
+            raise ValueError("cache_entries must be positive.")
+
+        self.pokemons = get_pokemons() if pokemons is None else pokemons
+        self.pool = get_pokemon_pool(self.pokemons)
+        self.chunk_size = chunk_size
+        self.cache_entries = cache_entries
+
+        # Workers receive the pokemons once when they start, tasks only carry
+        # integer team encodings.
+        executor_type = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self.executor: Executor = executor_type(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.pokemons, type_multiplier_formula, damage_formula),
+        )
+
+        # Fitnesses are kept per opponents signature and team key, the least
+        # recently used ones are evicted to bound a long running service.
+        self.cache: OrderedDict[tuple[bytes, int], float] = OrderedDict()
+        self.in_flight: dict[tuple[bytes, int], asyncio.Future[float]] = {}
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_positions(self, teams: list[PokemonTeam]) -> np.ndarray:
+        return np.array([team.get_positions(self.pool) for team in teams])
+
+    def evaluate(
+        self,
+        teams: np.ndarray,
+        opponents: np.ndarray,
+        opponents_weights: np.ndarray | list[float] | None = None,
+    ) -> Job[np.ndarray]:
+        teams = np.asarray(teams, dtype=np.intp)
+        opponents = np.asarray(opponents, dtype=np.intp)
+        weights = (
+            None
+            if opponents_weights is None
+            else np.asarray(opponents_weights, dtype=float)
+        )
+
+        # Fitness is a (weighted) mean over the opponents, so requests with the
+        # same opponents in any order share the cache.
+        opponent_keys = get_team_keys(opponents, self.pool.get_size())
+        order = np.argsort(opponent_keys, kind="stable")
+        signature = opponent_keys[order].tobytes()
+        if weights is not None:
+            signature += weights[order].tobytes()
+
+        keys = get_team_keys(teams, self.pool.get_size())
+        unique_keys, first_indexes, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[float]] = []
+        missing: list[int] = []
+
+        # Identical requests share results: cached teams resolve at once and
+        # teams already being evaluated for another request are awaited.
+        for key, first_index in zip(
+            unique_keys.tolist(), first_indexes.tolist(), strict=True
+        ):
+            if (signature, key) in self.cache:
+                self.cache.move_to_end((signature, key))
+                future = loop.create_future()
+                future.set_result(self.cache[(signature, key)])
+            elif (signature, key) in self.in_flight:
+                future = self.in_flight[(signature, key)]
+            else:
+                future = loop.create_future()
+                self.in_flight[(signature, key)] = future
+                missing.append(first_index)
+
+            futures.append(future)
+
+        chunks = [
+            np.array(missing[start : start + self.chunk_size])
+            for start in range(0, len(missing), self.chunk_size)
+        ]
+        job: Job[np.ndarray] = Job(total=len(unique_keys))
+        job.advance(len(unique_keys) - len(missing))
+
+        async def run_chunk(chunk: np.ndarray) -> None:
+            chunk_keys = keys[chunk].tolist()
+
+            try:
+                fitnesses = await loop.run_in_executor(
+                    self.executor, _evaluate_chunk, teams[chunk], opponents, weights
+                )
+            except Exception as error:
+                for key in chunk_keys:
+                    self.in_flight.pop((signature, key)).set_exception(error)
+                raise
+
+            for key, fitness in zip(chunk_keys, fitnesses.tolist(), strict=True):
+                self._cache_fitness((signature, key), fitness)
+                self.in_flight.pop((signature, key)).set_result(fitness)
+
+            job.advance(len(chunk))
+
+        async def run() -> None:
+            try:
+                await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+                fitnesses = await asyncio.gather(*futures)
+            except Exception as error:
+                job.fail(error)
+                return
+
+            job.finish(np.array(fitnesses, dtype=float)[inverse.ravel()])
+
+        job.task = asyncio.create_task(run())
+        return job
+
+    def _cache_fitness(self, key: tuple[bytes, int], fitness: float) -> None:
+        self.cache[key] = fitness
+        self.cache.move_to_end(key)
+
+        while len(self.cache) > self.cache_entries:
+            self.cache.popitem(last=False)
+
+    def evaluate_teams(
+        self,
+        teams: list[PokemonTeam],
+        opponents: list[PokemonTeam],
+        opponents_weights: np.ndarray | list[float] | None = None,
+    ) -> Job[np.ndarray]:
+        return self.evaluate(
+            self.get_positions(teams), self.get_positions(opponents), opponents_weights
+        )
+
+    def solve(self, solver: BaseModel, **solve_kwargs: Any) -> Job[Any]:
+        loop = asyncio.get_running_loop()
+        # Solvers run in a worker without reporting back, so solve jobs have no
+        # total and only report their status.
+        job: Job[Any] = Job()
+
+        async def run() -> None:
+            job.advance(0)
+
+            try:
+                result = await loop.run_in_executor(
+                    self.executor, _run_solver, solver, solve_kwargs
+                )
+            except Exception as error:
+                job.fail(error)
+                return
+
+            job.finish(result)
+
+        job.task = asyncio.create_task(run())
+        return job
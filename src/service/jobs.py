@@ -0,0 +1,56 @@
+import asyncio
+from collections.abc import AsyncIterator, Generator
+from dataclasses import dataclass
+from typing import Any, Literal
+
+type JobStatus = Literal["pending", "running", "done", "failed"]
+
+
+@dataclass(frozen=True)
+class Progress:
+    completed: int
+    total: int | None
+    status: JobStatus
+
+
+class Job[T]:
+    def __init__(self, total: int | None = None) -> None:
+        self.total = total
+        self.completed = 0
+        self.status: JobStatus = "pending"
+        self.future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self.task: asyncio.Task[None] | None = None
+        self._events: asyncio.Queue[Progress] = asyncio.Queue()
+        self._events.put_nowait(self.get_progress())
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.future.__await__()
+
+    def get_progress(self) -> Progress:
+        return Progress(self.completed, self.total, self.status)
+
+    def advance(self, completed: int = 1) -> None:
+        self.completed += completed
+        self.status = "running"
+        self._events.put_nowait(self.get_progress())
+
+    def finish(self, result: T) -> None:
+        if self.total is not None:
+            self.completed = self.total
+
+        self.status = "done"
+        self.future.set_result(result)
+        self._events.put_nowait(self.get_progress())
+
+    def fail(self, error: BaseException) -> None:
+        self.status = "failed"
+        self.future.set_exception(error)
+        self._events.put_nowait(self.get_progress())
+
+    async def progress(self) -> AsyncIterator[Progress]:
+        while True:
+            event = await self._events.get()
+            yield event
+
+            if event.status in ("done", "failed"):
+                return
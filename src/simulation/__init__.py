@@ -1,3 +1,15 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .damage import (
+    DamageLookup,
+    DamageMatrix,
+    calculate_damage_block,
+    calculate_damage_pairs,
+    get_damage_matrix,
+)
+from .damage_table import DamageTable, get_damage_table, get_damage_table_key
+from .engine import evaluate_teams, get_remaining_hp_ratio_matrix, simulate_battles
 from .formulas import (
     DamageFormula,
     TypeMultiplierFormula,
@@ -7,10 +19,36 @@ from .formulas import (
     min_type_multiplier,
     multiply_type_multiplier,
 )
-from .simulation import simulate_battle
+from .results_cache import BattleResultsCache, SortedIndex, get_team_keys
+from .trace import BattleTrace, BattleTraceLog
+
+if TYPE_CHECKING:
+    from .simulation import get_remaining_hp_ratios, simulate_battle
+
+_LAZY_IMPORTS = {
+    "get_remaining_hp_ratios": ".simulation",
+    "simulate_battle": ".simulation",
+}
 
 __all__ = [
     "simulate_battle",
+    "simulate_battles",
+    "get_remaining_hp_ratios",
+    "get_remaining_hp_ratio_matrix",
+    "evaluate_teams",
+    "BattleResultsCache",
+    "SortedIndex",
+    "get_team_keys",
+    "BattleTrace",
+    "BattleTraceLog",
+    "DamageLookup",
+    "DamageMatrix",
+    "DamageTable",
+    "calculate_damage_block",
+    "calculate_damage_pairs",
+    "get_damage_matrix",
+    "get_damage_table",
+    "get_damage_table_key",
     "min_type_multiplier",
     "max_type_multiplier",
     "multiply_type_multiplier",
@@ -19,3 +57,12 @@ __all__ = [
     "TypeMultiplierFormula",
     "DamageFormula",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,151 @@
+from typing import Protocol
+
+import numpy as np
+
+from constants import DAMAGE_CHUNK_SIZE
+from data.pool import NO_TYPE, PokemonPool
+
+from .formulas import DamageFormula, TypeMultiplierFormula
+
+
+class DamageLookup(Protocol):
+    def lookup(self, attackers: np.ndarray, defenders: np.ndarray) -> np.ndarray: ...
+
+
+class DamageMatrix:
+    def __init__(self, values: np.ndarray) -> None:
+        self.values = values
+
+    def lookup(self, attackers: np.ndarray, defenders: np.ndarray) -> np.ndarray:
+        return np.asarray(self.values[attackers, defenders], dtype=np.int64)
+
+
+def calculate_damage_pairs(
+    pool: PokemonPool,
+    attackers: np.ndarray,
+    defenders: np.ndarray,
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+    damages_cache: dict[tuple[int, int, float], int] | None = None,
+) -> np.ndarray:
+    attackers = np.asarray(attackers, dtype=np.intp)
+    defenders = np.asarray(defenders, dtype=np.intp)
+
+    combined_attack = (pool.attack[attackers] + pool.sp_attack[attackers]).astype(
+        np.int64
+    )
+    combined_defense = (pool.defense[defenders] + pool.sp_defense[defenders]).astype(
+        np.int64
+    )
+
+    first_types = pool.first_types[defenders].astype(np.intp)
+    second_types = pool.second_types[defenders].astype(np.intp)
+    has_second_type = second_types != NO_TYPE
+
+    first_effectiveness = pool.against[attackers, first_types]
+    second_effectiveness = np.where(
+        has_second_type,
+        pool.against[attackers, np.where(has_second_type, second_types, 0)],
+        1.0,
+    )
+
+    # Formulas are scalar callables, so they are called once per distinct input.
+    # Inputs stay NumPy scalars to round exactly like simulate_battle does.
+    (first_values, second_values), pairs, pairs_inverse = _get_unique_combinations(
+        first_effectiveness, second_effectiveness
+    )
+    multipliers = np.array(
+        [
+            type_multiplier_formula(first_values[first], second_values[second])
+            for first, second in pairs
+        ],
+        dtype=float,
+    )[pairs_inverse]
+
+    (attack_values, defense_values, multiplier_values), inputs, inputs_inverse = (
+        _get_unique_combinations(combined_attack, combined_defense, multipliers)
+    )
+
+    # Callers computing many blocks may share a cache of formula results,
+    # since the same inputs repeat across blocks.
+    cache = {} if damages_cache is None else damages_cache
+    damages = np.empty(len(inputs), dtype=np.int64)
+    for index, (attack, defense, multiplier) in enumerate(inputs.tolist()):
+        key = (
+            attack_values[attack],
+            defense_values[defense],
+            multiplier_values[multiplier],
+        )
+        damage = cache.get(key)
+
+        if damage is None:
+            damage = cache[key] = 0 if key[2] == 0 else max(damage_formula(*key), 1)
+
+        damages[index] = damage
+
+    return np.asarray(damages[inputs_inverse], dtype=np.int64)
+
+
+def calculate_damage_block(
+    pool: PokemonPool,
+    attackers: np.ndarray,
+    defenders: np.ndarray,
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+    damages_cache: dict[tuple[int, int, float], int] | None = None,
+) -> np.ndarray:
+    damages = calculate_damage_pairs(
+        pool,
+        np.repeat(attackers, len(defenders)),
+        np.tile(defenders, len(attackers)),
+        type_multiplier_formula,
+        damage_formula,
+        damages_cache,
+    )
+    return damages.reshape(len(attackers), len(defenders))
+
+
+def _get_unique_combinations(
+    *columns: np.ndarray,
+) -> tuple[list[np.ndarray], np.ndarray, np.ndarray]:
+    values: list[np.ndarray] = []
+    keys = np.zeros(len(columns[0]), dtype=np.int64)
+    sizes: list[int] = []
+
+    for column in columns:
+        column_values, codes = np.unique(column, return_inverse=True)
+        values.append(column_values)
+        sizes.append(len(column_values))
+        keys = keys * len(column_values) + codes.ravel()
+
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    combinations = np.empty((len(unique_keys), len(columns)), dtype=np.int64)
+
+    for i in range(len(columns) - 1, -1, -1):
+        combinations[:, i] = unique_keys % sizes[i]
+        unique_keys = unique_keys // sizes[i]
+
+    return values, combinations, inverse.ravel()
+
+
+def get_damage_matrix(
+    pool: PokemonPool,
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+) -> DamageMatrix:
+    positions = np.arange(pool.get_size())
+    values = np.empty((pool.get_size(), pool.get_size()), dtype=np.int64)
+
+    # Blocks of attacker rows bound the temporary arrays, which are several
+    # times larger than the block itself.
+    rows = max(1, DAMAGE_CHUNK_SIZE // max(pool.get_size(), 1))
+    for start in range(0, pool.get_size(), rows):
+        values[start : start + rows] = calculate_damage_block(
+            pool,
+            positions[start : start + rows],
+            positions,
+            type_multiplier_formula,
+            damage_formula,
+        )
+
+    return DamageMatrix(values)
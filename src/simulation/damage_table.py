@@ -0,0 +1,352 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from constants import (
+    DAMAGE_CHUNK_SIZE,
+    DEFAULT_DAMAGE_TABLE_BYTES,
+    DEFAULT_DAMAGE_TILE_SIZE,
+    MAX_DAMAGE_CACHE_ENTRIES,
+)
+from data.pool import PokemonPool
+
+from .damage import (
+    DamageLookup,
+    calculate_damage_block,
+    calculate_damage_pairs,
+    get_damage_matrix,
+)
+from .formulas import DamageFormula, TypeMultiplierFormula
+
+TILES_FILE = "tiles.npy"
+COMPUTED_FILE = "computed.npy"
+METADATA_FILE = "metadata.json"
+
+NO_SLOT = -1
+NO_KEY = -1
+
+
+def get_damage_table_key(
+    pool: PokemonPool,
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+    tile_size: int,
+) -> str:
+    digest = hashlib.sha256()
+
+    for values in (
+        pool.attack,
+        pool.sp_attack,
+        pool.defense,
+        pool.sp_defense,
+        pool.first_types,
+        pool.second_types,
+        pool.against,
+    ):
+        digest.update(np.ascontiguousarray(values).tobytes())
+
+    for formula in (type_multiplier_formula, damage_formula):
+        digest.update(f"{formula.__module__}.{formula.__qualname__}".encode())
+
+    digest.update(str(tile_size).encode())
+    return digest.hexdigest()
+
+
+class DamageTable:
+    def __init__(
+        self,
+        pool: PokemonPool,
+        type_multiplier_formula: TypeMultiplierFormula,
+        damage_formula: DamageFormula,
+        tile_size: int = DEFAULT_DAMAGE_TILE_SIZE,
+        max_bytes: int = DEFAULT_DAMAGE_TABLE_BYTES,
+        directory: Path | None = None,
+    ) -> None:
+        if tile_size <= 0:
+            raise ValueError("tile_size must be positive.")
+
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+
+        self._setup(
+            pool,
+            type_multiplier_formula,
+            damage_formula,
+            tile_size,
+            max_bytes,
+            directory,
+        )
+
+    def _setup(
+        self,
+        pool: PokemonPool,
+        type_multiplier_formula: TypeMultiplierFormula,
+        damage_formula: DamageFormula,
+        tile_size: int,
+        max_bytes: int,
+        directory: Path | None,
+    ) -> None:
+        self.pool = pool
+        self.type_multiplier_formula = type_multiplier_formula
+        self.damage_formula = damage_formula
+        self.tile_size = tile_size
+        self.max_bytes = max_bytes
+        self.directory = None if directory is None else Path(directory)
+
+        self.tiles_amount = -(-pool.get_size() // tile_size)
+        self.max_tiles = max(1, max_bytes // (tile_size * tile_size * 8))
+
+        # Tiles live in one preallocated slab, so the cap is never exceeded
+        # and a lookup gathers from all of its tiles with a single index.
+        self.slab = np.zeros((self.max_tiles, tile_size, tile_size), dtype=np.int64)
+        self.key_by_slot = np.full(self.max_tiles, NO_KEY, dtype=np.int64)
+        self.slot_by_key = np.full(self.tiles_amount**2, NO_SLOT, dtype=np.int64)
+        self.last_used = np.full(self.max_tiles, -1, dtype=np.int64)
+        self.clock = 0
+        self.damages_cache: dict[tuple[int, int, float], int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.computed_tiles = 0
+
+        self.tiles: np.ndarray | None = None
+        self.computed: np.ndarray | None = None
+        if self.directory is not None:
+            self._open_store(self.directory)
+
+    def _open_store(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        key = get_damage_table_key(
+            self.pool,
+            self.type_multiplier_formula,
+            self.damage_formula,
+            self.tile_size,
+        )
+        metadata_path = directory / METADATA_FILE
+        shape = (self.tiles_amount**2, self.tile_size, self.tile_size)
+
+        # Tiles persisted for another pool or other formulas are dropped. The
+        # tiles file is sparse, so only computed tiles take disk space.
+        if (
+            metadata_path.exists()
+            and json.loads(metadata_path.read_text()).get("key") == key
+        ):
+            self.tiles = np.load(directory / TILES_FILE, mmap_mode="r+")
+            self.computed = np.load(directory / COMPUTED_FILE, mmap_mode="r+")
+            return
+
+        self.tiles = np.lib.format.open_memmap(
+            directory / TILES_FILE, mode="w+", dtype=np.int64, shape=shape
+        )
+        self.computed = np.lib.format.open_memmap(
+            directory / COMPUTED_FILE,
+            mode="w+",
+            dtype=bool,
+            shape=(self.tiles_amount**2,),
+        )
+        metadata_path.write_text(json.dumps({"key": key, "shape": shape}))
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Workers get the configuration only and build their own cache.
+        return {
+            "pool": self.pool,
+            "type_multiplier_formula": self.type_multiplier_formula,
+            "damage_formula": self.damage_formula,
+            "tile_size": self.tile_size,
+            "max_bytes": self.max_bytes,
+            "directory": self.directory,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._setup(**state)
+
+    def get_cached_tiles(self) -> int:
+        return int((self.key_by_slot != NO_KEY).sum())
+
+    def get_memory_bytes(self) -> int:
+        return self.slab.nbytes
+
+    def _get_tile_positions(self, tile: int) -> np.ndarray:
+        start = tile * self.tile_size
+        return np.arange(start, min(start + self.tile_size, self.pool.get_size()))
+
+    def _get_damages_cache(self) -> dict[tuple[int, int, float], int]:
+        if len(self.damages_cache) > MAX_DAMAGE_CACHE_ENTRIES:
+            self.damages_cache.clear()
+
+        return self.damages_cache
+
+    def _compute_tiles(self, keys: np.ndarray) -> np.ndarray:
+        row_tiles, column_tiles = np.divmod(keys, self.tiles_amount)
+        tiles = np.zeros((len(keys), self.tile_size, self.tile_size), dtype=np.int64)
+
+        # Tiles sharing a row (or a column) of tiles are computed with one
+        # call, whichever way takes fewer calls.
+        by_rows = len(np.unique(row_tiles)) <= len(np.unique(column_tiles))
+        groups, others = (
+            (row_tiles, column_tiles) if by_rows else (column_tiles, row_tiles)
+        )
+        tiles_per_call = max(1, DAMAGE_CHUNK_SIZE // self.tile_size**2)
+
+        for group in np.unique(groups):
+            selected = np.flatnonzero(groups == group)
+            fixed = self._get_tile_positions(int(group))
+
+            for start in range(0, len(selected), tiles_per_call):
+                chunk = selected[start : start + tiles_per_call]
+                parts = [self._get_tile_positions(int(tile)) for tile in others[chunk]]
+                positions = np.concatenate(parts)
+
+                if by_rows:
+                    block = calculate_damage_block(
+                        self.pool,
+                        fixed,
+                        positions,
+                        self.type_multiplier_formula,
+                        self.damage_formula,
+                        self._get_damages_cache(),
+                    )
+                else:
+                    block = calculate_damage_block(
+                        self.pool,
+                        positions,
+                        fixed,
+                        self.type_multiplier_formula,
+                        self.damage_formula,
+                        self._get_damages_cache(),
+                    ).T
+
+                offset = 0
+                for index, part in zip(chunk, parts, strict=True):
+                    values = block[:, offset : offset + len(part)]
+                    offset += len(part)
+
+                    if by_rows:
+                        tiles[index, : len(fixed), : len(part)] = values
+                    else:
+                        tiles[index, : len(part), : len(fixed)] = values.T
+
+        self.computed_tiles += len(keys)
+        return tiles
+
+    def _load_tiles(self, keys: np.ndarray) -> np.ndarray:
+        if self.tiles is None or self.computed is None:
+            return self._compute_tiles(keys)
+
+        tiles = np.empty((len(keys), self.tile_size, self.tile_size), dtype=np.int64)
+        stored = self.computed[keys]
+        tiles[stored] = self.tiles[keys[stored]]
+
+        if not stored.all():
+            missing = keys[~stored]
+            tiles[~stored] = self._compute_tiles(missing)
+            self.tiles[missing] = tiles[~stored]
+            self.computed[missing] = True
+
+        return tiles
+
+    def _get_slots(self, keys: np.ndarray) -> np.ndarray:
+        self.clock += 1
+        slots = self.slot_by_key[keys]
+        cached = slots != NO_SLOT
+
+        self.hits += int(cached.sum())
+        self.misses += int((~cached).sum())
+        self.last_used[slots[cached]] = self.clock
+
+        if cached.all():
+            return np.asarray(slots, dtype=np.int64)
+
+        # The least recently used slots are reused. Tiles of this call were
+        # just marked as used, so they are never evicted by it.
+        missing = keys[~cached]
+        victims = np.argpartition(self.last_used, len(missing) - 1)[: len(missing)]
+        evicted = self.key_by_slot[victims]
+        self.slot_by_key[evicted[evicted != NO_KEY]] = NO_SLOT
+
+        self.slab[victims] = self._load_tiles(missing)
+        self.key_by_slot[victims] = missing
+        self.slot_by_key[missing] = victims
+        self.last_used[victims] = self.clock
+
+        slots[~cached] = victims
+        return np.asarray(slots, dtype=np.int64)
+
+    def lookup(self, attackers: np.ndarray, defenders: np.ndarray) -> np.ndarray:
+        attackers, defenders = np.broadcast_arrays(
+            np.asarray(attackers, dtype=np.intp), np.asarray(defenders, dtype=np.intp)
+        )
+        attackers_flat, defenders_flat = attackers.ravel(), defenders.ravel()
+        row_tiles, rows = np.divmod(attackers_flat, self.tile_size)
+        column_tiles, columns = np.divmod(defenders_flat, self.tile_size)
+
+        keys, inverse, counts = np.unique(
+            row_tiles * self.tiles_amount + column_tiles,
+            return_inverse=True,
+            return_counts=True,
+        )
+        inverse = inverse.ravel()
+        values = np.empty(len(inverse), dtype=np.int64)
+
+        # A missing tile costs tile_size ** 2 damages, so pairs of tiles that
+        # are barely used, as in random lookups over a large pool, are
+        # computed directly instead.
+        direct = (self.slot_by_key[keys] == NO_SLOT) & (counts < self.tile_size)
+        if self.computed is not None:
+            direct &= ~self.computed[keys]
+
+        selected = direct[inverse]
+        if selected.any():
+            self.misses += int(direct.sum())
+            values[selected] = calculate_damage_pairs(
+                self.pool,
+                attackers_flat[selected],
+                defenders_flat[selected],
+                self.type_multiplier_formula,
+                self.damage_formula,
+                self._get_damages_cache(),
+            )
+
+        tiled = np.flatnonzero(~direct)
+        codes = np.full(len(keys), -1, dtype=np.intp)
+        codes[tiled] = np.arange(len(tiled))
+        codes = codes[inverse]
+
+        # A lookup touching more tiles than fit in the cache is served in
+        # parts of at most max_tiles tiles each.
+        for start in range(0, len(tiled), self.max_tiles):
+            slots = self._get_slots(keys[tiled[start : start + self.max_tiles]])
+            selected = np.flatnonzero(
+                (codes >= start) & (codes < start + self.max_tiles)
+            )
+            values[selected] = self.slab[
+                slots[codes[selected] - start], rows[selected], columns[selected]
+            ]
+
+        return values.reshape(attackers.shape)
+
+    def flush(self) -> None:
+        for stored in (self.tiles, self.computed):
+            if isinstance(stored, np.memmap):
+                stored.flush()
+
+
+def get_damage_table(
+    pool: PokemonPool,
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+    max_bytes: int = DEFAULT_DAMAGE_TABLE_BYTES,
+    tile_size: int = DEFAULT_DAMAGE_TILE_SIZE,
+    directory: Path | None = None,
+) -> DamageLookup:
+    # A dense matrix is the fastest lookup, so tiles are only used for pools
+    # whose matrix would not fit into the memory cap.
+    if directory is None and pool.get_size() ** 2 * 8 <= max_bytes:
+        return get_damage_matrix(pool, type_multiplier_formula, damage_formula)
+
+    return DamageTable(
+        pool, type_multiplier_formula, damage_formula, tile_size, max_bytes, directory
+    )
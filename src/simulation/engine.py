@@ -0,0 +1,297 @@
+import numpy as np
+
+from constants import BATTLES_CHUNK_SIZE, MAX_STEPS_PER_BATTLE
+from data.pool import PokemonPool
+
+from .damage import DamageLookup
+from .trace import (
+    DUEL_EVENT,
+    HIT_EVENT,
+    MAX_STEPS_OVERRIDE,
+    NO_OVERRIDE,
+    NO_POSITION,
+    OPPONENT_TURN_OVERRIDE,
+    SWAP_EVENT,
+    TRUNCATED_EVENT,
+    BattleTrace,
+)
+
+CURRENT_SIDE = 0
+OPPONENT_SIDE = 1
+NO_SIDE = -1
+
+
+def get_first_attackers(
+    speeds: np.ndarray, current_positions: np.ndarray, opponent_positions: np.ndarray
+) -> np.ndarray:
+    return np.where(
+        speeds[current_positions] > speeds[opponent_positions],
+        CURRENT_SIDE,
+        OPPONENT_SIDE,
+    )
+
+
+def simulate_battles(
+    pool: PokemonPool,
+    damage: DamageLookup,
+    current_teams: np.ndarray,
+    opponent_teams: np.ndarray,
+    max_steps: int = MAX_STEPS_PER_BATTLE,
+    trace: BattleTrace | None = None,
+) -> np.ndarray:
+    battles = len(current_teams)
+    teams = np.stack([current_teams, opponent_teams], axis=1).astype(np.intp)
+    team_size = teams.shape[2]
+
+    hps = pool.hp[teams].astype(np.int64)
+    indexes = np.zeros((battles, 2), dtype=np.intp)
+    turns = get_first_attackers(pool.speed, teams[:, 0, 0], teams[:, 1, 0])
+    steps = np.zeros(battles, dtype=np.int64)
+
+    active = np.arange(battles) if max_steps > 0 else np.arange(0)
+    trace_offset = trace.start_battles(battles) if trace is not None else 0
+
+    # Every iteration resolves one event per battle: a swap when the attacker
+    # deals no damage, a single hit when only the defender deals none, or
+    # a whole duel up to the next knockout, which is what simulate_battle
+    # reaches one step at a time.
+    while active.size > 0:
+        movers = turns[active]
+        others = 1 - movers
+        mover_indexes = indexes[active, movers]
+        other_indexes = indexes[active, others]
+        mover_positions = teams[active, movers, mover_indexes]
+        other_positions = teams[active, others, other_indexes]
+
+        mover_damage = damage.lookup(mover_positions, other_positions)
+        other_damage = damage.lookup(other_positions, mover_positions)
+        mover_hp = hps[active, movers, mover_indexes]
+        other_hp = hps[active, others, other_indexes]
+        remaining_steps = max_steps - steps[active]
+
+        ended = np.zeros(active.size, dtype=bool)
+
+        swap = mover_damage == 0
+        can_swap = swap & (mover_indexes + 1 < team_size)
+
+        swapped = active[can_swap]
+        sides = movers[can_swap]
+        first = mover_indexes[can_swap]
+        second = first + 1
+        teams[swapped, sides, first], teams[swapped, sides, second] = (
+            teams[swapped, sides, second],
+            teams[swapped, sides, first],
+        )
+        hps[swapped, sides, first], hps[swapped, sides, second] = (
+            hps[swapped, sides, second],
+            hps[swapped, sides, first],
+        )
+
+        ended |= swap & ~can_swap
+        turns[active[swap]] = others[swap]
+        steps[active[swap]] += 1
+
+        hit = ~swap
+        single = hit & (other_damage == 0)
+        duel = hit & ~single
+
+        safe_mover_damage = np.maximum(mover_damage, 1)
+        safe_other_damage = np.maximum(other_damage, 1)
+        mover_hits_needed = -(-other_hp // safe_mover_damage)
+        other_hits_needed = -(-mover_hp // safe_other_damage)
+        mover_wins = mover_hits_needed <= other_hits_needed
+        duel_steps = np.where(
+            mover_wins, 2 * mover_hits_needed - 1, 2 * other_hits_needed
+        )
+        truncated = duel & (duel_steps > remaining_steps)
+        finished = duel & ~truncated
+
+        mover_hits = np.zeros(active.size, dtype=np.int64)
+        other_hits = np.zeros(active.size, dtype=np.int64)
+        used_steps = np.zeros(active.size, dtype=np.int64)
+        knocked_out = np.full(active.size, NO_SIDE)
+        next_turns = movers.copy()
+
+        single_knockout = single & (other_hp <= mover_damage)
+        mover_hits[single] = 1
+        used_steps[single] = 1
+        knocked_out[single_knockout] = others[single_knockout]
+        next_turns[single & ~single_knockout] = others[single & ~single_knockout]
+
+        mover_hits[finished] = np.where(
+            mover_wins, mover_hits_needed, other_hits_needed
+        )[finished]
+        other_hits[finished] = np.where(
+            mover_wins, mover_hits_needed - 1, other_hits_needed
+        )[finished]
+        used_steps[finished] = duel_steps[finished]
+        knocked_out[finished] = np.where(mover_wins, others, movers)[finished]
+        next_turns[finished] = np.where(mover_wins, movers, others)[finished]
+
+        mover_hits[truncated] = (remaining_steps[truncated] + 1) // 2
+        other_hits[truncated] = remaining_steps[truncated] // 2
+        used_steps[truncated] = remaining_steps[truncated]
+        next_turns[truncated] = np.where(remaining_steps % 2 == 0, movers, others)[
+            truncated
+        ]
+        ended |= truncated
+
+        if trace is not None:
+            _trace_events(
+                trace,
+                trace_offset + active,
+                max_steps - remaining_steps,
+                np.select(
+                    [swap, single, finished],
+                    [SWAP_EVENT, HIT_EVENT, DUEL_EVENT],
+                    TRUNCATED_EVENT,
+                ),
+                movers,
+                mover_indexes,
+                other_indexes,
+                mover_positions,
+                other_positions,
+                np.where(can_swap, teams[active, movers, mover_indexes], NO_POSITION),
+                mover_damage,
+                other_damage,
+                mover_hits,
+                other_hits,
+                mover_hp,
+                other_hp,
+            )
+
+        hit_battles = active[hit]
+        hps[hit_battles, others[hit], other_indexes[hit]] = np.maximum(
+            other_hp - mover_hits * mover_damage, 0
+        )[hit]
+        hps[hit_battles, movers[hit], mover_indexes[hit]] = np.maximum(
+            mover_hp - other_hits * other_damage, 0
+        )[hit]
+        steps[hit_battles] += used_steps[hit]
+        turns[hit_battles] = next_turns[hit]
+
+        knocked = knocked_out != NO_SIDE
+        knocked_sides = knocked_out[knocked]
+        knocked_indexes = indexes[active[knocked], knocked_sides]
+        has_next = knocked_indexes + 1 < team_size
+        ended[np.flatnonzero(knocked)[~has_next]] = True
+
+        advanced = active[knocked][has_next]
+        indexes[advanced, knocked_sides[has_next]] += 1
+        turns[advanced] = get_first_attackers(
+            pool.speed,
+            teams[advanced, CURRENT_SIDE, indexes[advanced, CURRENT_SIDE]],
+            teams[advanced, OPPONENT_SIDE, indexes[advanced, OPPONENT_SIDE]],
+        )
+
+        ended |= steps[active] >= max_steps
+        active = active[~ended]
+
+    current_hp = hps[:, CURRENT_SIDE].sum(axis=1)
+    opponent_hp = hps[:, OPPONENT_SIDE].sum(axis=1)
+
+    final_current_hp = np.where(
+        (current_hp > 0) & (turns == OPPONENT_SIDE), 0, current_hp
+    )
+    final_current_hp = np.where(
+        (final_current_hp <= opponent_hp) & (steps >= max_steps), 0, final_current_hp
+    )
+
+    if trace is not None:
+        opponent_turn = (current_hp > 0) & (turns == OPPONENT_SIDE)
+        trace.add_results(
+            steps=steps,
+            current_hp=current_hp,
+            opponent_hp=opponent_hp,
+            turn=turns,
+            override=np.select(
+                [opponent_turn, (current_hp > 0) & (final_current_hp == 0)],
+                [OPPONENT_TURN_OVERRIDE, MAX_STEPS_OVERRIDE],
+                NO_OVERRIDE,
+            ),
+            result=final_current_hp,
+        )
+
+    return final_current_hp
+
+
+def _trace_events(
+    trace: BattleTrace,
+    battles: np.ndarray,
+    steps: np.ndarray,
+    kinds: np.ndarray,
+    movers: np.ndarray,
+    mover_indexes: np.ndarray,
+    other_indexes: np.ndarray,
+    mover_positions: np.ndarray,
+    other_positions: np.ndarray,
+    swapped_positions: np.ndarray,
+    mover_damage: np.ndarray,
+    other_damage: np.ndarray,
+    mover_hits: np.ndarray,
+    other_hits: np.ndarray,
+    mover_hp: np.ndarray,
+    other_hp: np.ndarray,
+) -> None:
+    trace.add_events(
+        battle=battles,
+        step=steps,
+        kind=kinds,
+        side=movers,
+        attacker_slot=mover_indexes,
+        defender_slot=other_indexes,
+        attacker_position=mover_positions,
+        defender_position=other_positions,
+        swapped_position=swapped_positions,
+        attacker_damage=mover_damage,
+        defender_damage=other_damage,
+        attacker_hits=mover_hits,
+        defender_hits=other_hits,
+        attacker_hp=mover_hp,
+        defender_hp=other_hp,
+    )
+
+
+def get_remaining_hp_ratio_matrix(
+    pool: PokemonPool,
+    damage: DamageLookup,
+    teams: np.ndarray,
+    opponents: np.ndarray,
+    max_steps: int = MAX_STEPS_PER_BATTLE,
+    trace: BattleTrace | None = None,
+) -> np.ndarray:
+    ratios = np.empty((len(teams), len(opponents)), dtype=float)
+    base_hps = pool.hp[teams].sum(axis=1)
+    rows_per_chunk = max(1, BATTLES_CHUNK_SIZE // max(1, len(opponents)))
+
+    for start in range(0, len(teams), rows_per_chunk):
+        chunk = teams[start : start + rows_per_chunk]
+        remaining = simulate_battles(
+            pool,
+            damage,
+            np.repeat(chunk, len(opponents), axis=0),
+            np.tile(opponents, (len(chunk), 1)),
+            max_steps,
+            trace,
+        )
+        ratios[start : start + len(chunk)] = (
+            remaining.reshape(len(chunk), len(opponents))
+            / base_hps[start : start + len(chunk), None]
+        )
+
+    return ratios
+
+
+def evaluate_teams(
+    pool: PokemonPool,
+    damage: DamageLookup,
+    teams: np.ndarray,
+    opponents: np.ndarray,
+    opponents_weights: np.ndarray | list[float] | None = None,
+    max_steps: int = MAX_STEPS_PER_BATTLE,
+    trace: BattleTrace | None = None,
+) -> np.ndarray:
+    ratios = get_remaining_hp_ratio_matrix(
+        pool, damage, teams, opponents, max_steps, trace
+    )
+    return np.average(ratios, axis=1, weights=opponents_weights)
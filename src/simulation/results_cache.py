@@ -0,0 +1,110 @@
+import numpy as np
+
+from constants import BATTLES_CHUNK_SIZE, MAX_STEPS_PER_BATTLE
+from data.pool import PokemonPool
+from data.team_keys import get_team_keys
+
+from .damage import DamageLookup
+from .engine import simulate_battles
+
+PAIR_KEY_SHIFT = 32
+
+
+class SortedIndex:
+    def __init__(self, dtype: np.dtype | type = float) -> None:
+        self.keys = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if len(self.keys) == 0:
+            empty = np.zeros(len(keys), dtype=self.values.dtype)
+            return empty, np.zeros(len(keys), dtype=bool)
+
+        found_at = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        return self.values[found_at], self.keys[found_at] == keys
+
+    def add(self, keys: np.ndarray, values: np.ndarray) -> None:
+        keys, first_indexes = np.unique(keys, return_index=True)
+        _, found = self.get(keys)
+
+        merged_keys = np.concatenate([self.keys, keys[~found]])
+        merged_values = np.concatenate([self.values, values[first_indexes][~found]])
+        order = np.argsort(merged_keys, kind="stable")
+
+        self.keys = merged_keys[order]
+        self.values = merged_values[order]
+
+
+class BattleResultsCache:
+    def __init__(
+        self,
+        pool: PokemonPool,
+        damage: DamageLookup,
+        max_steps: int = MAX_STEPS_PER_BATTLE,
+    ) -> None:
+        self.pool = pool
+        self.damage = damage
+        self.max_steps = max_steps
+
+        self.team_ids = SortedIndex(dtype=np.int64)
+        self.results = SortedIndex(dtype=float)
+        self.simulated_battles = 0
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def get_team_ids(self, teams: np.ndarray) -> np.ndarray:
+        keys = get_team_keys(teams, self.pool.get_size())
+        ids, found = self.team_ids.get(keys)
+
+        if not found.all():
+            new_keys = np.unique(keys[~found])
+            self.team_ids.add(
+                new_keys, len(self.team_ids) + np.arange(len(new_keys), dtype=np.int64)
+            )
+            ids, _ = self.team_ids.get(keys)
+
+        return ids
+
+    def get_remaining_hp_ratio_matrix(
+        self, teams: np.ndarray, opponents: np.ndarray
+    ) -> np.ndarray:
+        team_ids = self.get_team_ids(teams)
+        opponent_ids = self.get_team_ids(opponents)
+
+        # Results are stored sparsely by (team, opponent) pair, so only the
+        # pairs never seen before are simulated.
+        pair_keys = (
+            np.left_shift(team_ids[:, None], PAIR_KEY_SHIFT) | opponent_ids[None, :]
+        ).ravel()
+        ratios, found = self.results.get(pair_keys)
+        missing = np.flatnonzero(~found)
+
+        if missing.size > 0:
+            missing_keys, first_indexes = np.unique(
+                pair_keys[missing], return_index=True
+            )
+            missing = missing[first_indexes]
+            team_rows, opponent_rows = np.divmod(missing, len(opponents))
+            missing_ratios = np.empty(len(missing), dtype=float)
+
+            for start in range(0, len(missing), BATTLES_CHUNK_SIZE):
+                chunk = slice(start, start + BATTLES_CHUNK_SIZE)
+                current = teams[team_rows[chunk]]
+                remaining = simulate_battles(
+                    self.pool,
+                    self.damage,
+                    current,
+                    opponents[opponent_rows[chunk]],
+                    self.max_steps,
+                )
+                missing_ratios[chunk] = remaining / self.pool.hp[current].sum(axis=1)
+
+            self.results.add(missing_keys, missing_ratios)
+            self.simulated_battles += len(missing)
+            ratios, _ = self.results.get(pair_keys)
+
+        return ratios.reshape(len(teams), len(opponents))
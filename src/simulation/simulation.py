@@ -1,6 +1,7 @@
 from collections.abc import Callable
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
 from classes import PokemonTeam
@@ -135,6 +136,31 @@ def simulate_battle(
     return final_current_team_hp
 
 
+def get_remaining_hp_ratios(
+    current_team: PokemonTeam,
+    opponents: list[PokemonTeam],
+    type_multiplier_formula: TypeMultiplierFormula,
+    damage_formula: DamageFormula,
+    max_steps: int = MAX_STEPS_PER_BATTLE,
+) -> np.ndarray:
+    base_hp = sum(current_team.get_hps())
+
+    return np.array(
+        [
+            simulate_battle(
+                current_team,
+                opponent,
+                type_multiplier_formula,
+                damage_formula,
+                max_steps,
+            )
+            / base_hp
+            for opponent in opponents
+        ],
+        dtype=float,
+    )
+
+
 def calculate_damage(
     attacker: pd.Series,
     defender: pd.Series,
@@ -0,0 +1,187 @@
+from pathlib import Path
+from typing import Literal, Self
+
+import numpy as np
+
+SWAP_EVENT = 0
+HIT_EVENT = 1
+DUEL_EVENT = 2
+TRUNCATED_EVENT = 3
+
+NO_OVERRIDE = 0
+OPPONENT_TURN_OVERRIDE = 1
+MAX_STEPS_OVERRIDE = 2
+
+NO_POSITION = -1
+
+EVENTS_FILE = "events.npy"
+RESULTS_FILE = "results.npy"
+
+# Hit and duel events stand for several alternating attacks, the attacker
+# moving first, so a duel up to a knockout is one record instead of one per
+# step. Hit points are stored from before the event.
+TRACE_EVENT_DTYPE = np.dtype(
+    [
+        ("battle", np.int64),
+        ("step", np.int32),
+        ("kind", np.int8),
+        ("side", np.int8),
+        ("attacker_slot", np.int8),
+        ("defender_slot", np.int8),
+        ("attacker_position", np.int32),
+        ("defender_position", np.int32),
+        ("swapped_position", np.int32),
+        ("attacker_damage", np.int32),
+        ("defender_damage", np.int32),
+        ("attacker_hits", np.int32),
+        ("defender_hits", np.int32),
+        ("attacker_hp", np.int32),
+        ("defender_hp", np.int32),
+    ]
+)
+
+TRACE_RESULT_DTYPE = np.dtype(
+    [
+        ("steps", np.int32),
+        ("current_hp", np.int32),
+        ("opponent_hp", np.int32),
+        ("turn", np.int8),
+        ("override", np.int8),
+        ("result", np.int32),
+        ("first_event", np.int64),
+        ("events", np.int32),
+    ]
+)
+
+TRACE_STEP_DTYPE = np.dtype(
+    [
+        ("step", np.int32),
+        ("side", np.int8),
+        ("attacker_position", np.int32),
+        ("defender_position", np.int32),
+        ("swapped_position", np.int32),
+        ("damage", np.int32),
+        ("hp_after", np.int32),
+    ]
+)
+
+
+class BattleTraceLog:
+    def __init__(self, events: np.ndarray, results: np.ndarray) -> None:
+        self.events = events
+        self.results = results
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def get_battle_events(self, battle: int) -> np.ndarray:
+        result = self.results[battle]
+        first_event = int(result["first_event"])
+        return self.events[first_event : first_event + int(result["events"])]
+
+    def get_battle_steps(self, battle: int) -> np.ndarray:
+        events = self.get_battle_events(battle)
+        is_swap = events["kind"] == SWAP_EVENT
+        counts = np.where(
+            is_swap, 1, events["attacker_hits"] + events["defender_hits"]
+        ).astype(np.intp)
+
+        steps = np.zeros(int(counts.sum()), dtype=TRACE_STEP_DTYPE)
+        owners = np.repeat(np.arange(len(events)), counts)
+        offsets = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+        owned = events[owners]
+
+        attacker_moves = (offsets % 2 == 0) | is_swap[owners]
+        hits = offsets // 2 + 1
+        attacker_hp_after = np.maximum(
+            owned["attacker_hp"] - (offsets + 1) // 2 * owned["defender_damage"], 0
+        )
+        defender_hp_after = np.maximum(
+            owned["defender_hp"] - hits * owned["attacker_damage"], 0
+        )
+
+        steps["step"] = owned["step"] + offsets
+        steps["side"] = np.where(attacker_moves, owned["side"], 1 - owned["side"])
+        steps["attacker_position"] = np.where(
+            attacker_moves, owned["attacker_position"], owned["defender_position"]
+        )
+        steps["defender_position"] = np.where(
+            attacker_moves, owned["defender_position"], owned["attacker_position"]
+        )
+        steps["swapped_position"] = owned["swapped_position"]
+        steps["damage"] = np.where(
+            is_swap[owners],
+            0,
+            np.where(
+                attacker_moves, owned["attacker_damage"], owned["defender_damage"]
+            ),
+        )
+        steps["hp_after"] = np.where(
+            is_swap[owners],
+            owned["defender_hp"],
+            np.where(attacker_moves, defender_hp_after, attacker_hp_after),
+        )
+
+        return steps
+
+    def get_overridden_battles(self) -> np.ndarray:
+        return np.flatnonzero(self.results["override"] != NO_OVERRIDE)
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / EVENTS_FILE, self.events)
+        np.save(directory / RESULTS_FILE, self.results)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> Self:
+        mmap_mode: Literal["r"] | None = "r" if mmap else None
+        return cls(
+            np.load(directory / EVENTS_FILE, mmap_mode=mmap_mode),
+            np.load(directory / RESULTS_FILE, mmap_mode=mmap_mode),
+        )
+
+
+class BattleTrace:
+    def __init__(self) -> None:
+        self.event_chunks: list[np.ndarray] = []
+        self.result_chunks: list[np.ndarray] = []
+        self.battles = 0
+
+    def __len__(self) -> int:
+        return self.battles
+
+    def start_battles(self, battles: int) -> int:
+        offset = self.battles
+        self.battles += battles
+        return offset
+
+    def add_events(self, **fields: np.ndarray) -> None:
+        events = np.empty(len(fields["battle"]), dtype=TRACE_EVENT_DTYPE)
+        for name, values in fields.items():
+            events[name] = values
+
+        self.event_chunks.append(events)
+
+    def add_results(self, **fields: np.ndarray) -> None:
+        results = np.zeros(len(fields["steps"]), dtype=TRACE_RESULT_DTYPE)
+        for name, values in fields.items():
+            results[name] = values
+
+        self.result_chunks.append(results)
+
+    def get_log(self) -> BattleTraceLog:
+        events = np.concatenate(
+            [np.empty(0, dtype=TRACE_EVENT_DTYPE), *self.event_chunks]
+        )
+        results = np.concatenate(
+            [np.empty(0, dtype=TRACE_RESULT_DTYPE), *self.result_chunks]
+        )
+
+        # Events are recorded one engine iteration at a time, so all battles
+        # are interleaved. A stable sort groups them and keeps their order.
+        events = events[np.argsort(events["battle"], kind="stable")]
+        counts = np.bincount(events["battle"], minlength=len(results))
+        results["events"] = counts
+        results["first_event"] = np.cumsum(counts) - counts
+
+        return BattleTraceLog(events, results)
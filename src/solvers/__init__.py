@@ -1,11 +1,34 @@
-from .evolutionary_algorithm_solver import EvolutionaryAlgorithmPokemonSolver
-from .hill_climbing_solver import HillClimbingPokemonSolver
-from .random_search_solver import RandomSearchPokemonSolver
-from .simulated_annealing_solver import SimulatedAnnealingPokemonSolver
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .evolutionary_algorithm_solver import EvolutionaryAlgorithmPokemonSolver
+    from .hill_climbing_solver import HillClimbingPokemonSolver
+    from .random_search_solver import RandomSearchPokemonSolver
+    from .simulated_annealing_solver import SimulatedAnnealingPokemonSolver
+    from .tabu_search_solver import TabuSearchPokemonSolver
+
+_LAZY_IMPORTS = {
+    "EvolutionaryAlgorithmPokemonSolver": ".evolutionary_algorithm_solver",
+    "HillClimbingPokemonSolver": ".hill_climbing_solver",
+    "RandomSearchPokemonSolver": ".random_search_solver",
+    "SimulatedAnnealingPokemonSolver": ".simulated_annealing_solver",
+    "TabuSearchPokemonSolver": ".tabu_search_solver",
+}
 
 __all__ = [
     "EvolutionaryAlgorithmPokemonSolver",
     "HillClimbingPokemonSolver",
     "RandomSearchPokemonSolver",
     "SimulatedAnnealingPokemonSolver",
+    "TabuSearchPokemonSolver",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,66 @@
+import math
+from collections.abc import Callable
+
 import numpy as np
 from pandera.typing import DataFrame
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from classes import PokemonTeam
+from classes import PokemonTeam, sample_team_positions
 from constants import (
+    DEFAULT_COEVOLUTION_TOP_TEAMS,
+    DEFAULT_CROSSOVER_RATE,
+    DEFAULT_CROSSOVER_TYPE,
     DEFAULT_ELITE_SIZE,
     DEFAULT_GENERATIONS,
+    DEFAULT_HALL_OF_FAME_SIZE,
+    DEFAULT_HISTORY_LIMIT,
     DEFAULT_MUTATION_RATE,
+    DEFAULT_OBJECTIVES,
     DEFAULT_OPPONENTS_LIMIT,
     DEFAULT_POPULATION_SIZE,
+    DEFAULT_SURROGATE_FRACTION,
     DEFAULT_TOURNAMENT_SIZE,
     POKEMON_TO_REPLACE_AMOUNT,
+    TEAM_SIZE,
+)
+from data import (
+    PokemonPool,
+    get_pokemon_pool,
+    get_team_keys,
+    get_unique_team_indexes,
 )
 from schemas import PokemonSchema
 from simulation import (
+    BattleResultsCache,
     DamageFormula,
+    SortedIndex,
     TypeMultiplierFormula,
     damage_attack_devide_defense,
+    evaluate_teams,
+    get_damage_table,
+    get_remaining_hp_ratio_matrix,
     multiply_type_multiplier,
     simulate_battle,
 )
 
+from .genetic_operators import (
+    CrossoverType,
+    crossover_teams,
+    mutate_teams,
+    sort_population,
+    tournament_select,
+)
+from .pareto import (
+    ObjectiveName,
+    crowding_distances,
+    get_crowded_order,
+    get_objectives,
+    non_dominated_sort,
+    to_maximization,
+)
+from .population import PopulationStore
+from .surrogate import SurrogateModel, SurrogateType
+
 
 class EvolutionaryAlgorithmPokemonSolver(BaseModel):
     model_config = ConfigDict(validate_assignment=True)
@@ -56,6 +96,16 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
         gt=0,
     )
 
+    crossover_rate: float = Field(
+        default=DEFAULT_CROSSOVER_RATE,
+        ge=0.0,
+        le=1.0,
+    )
+
+    crossover_type: CrossoverType = Field(
+        default=DEFAULT_CROSSOVER_TYPE,
+    )
+
     opponents_limit: int | None = Field(
         default=DEFAULT_OPPONENTS_LIMIT,
         gt=0,
@@ -65,6 +115,44 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
         default=True,
     )
 
+    seed: int | None = Field(
+        default=None,
+    )
+
+    large_population: bool = Field(
+        default=False,
+    )
+
+    history_limit: int | None = Field(
+        default=DEFAULT_HISTORY_LIMIT,
+        gt=0,
+    )
+
+    hall_of_fame_size: int = Field(
+        default=DEFAULT_HALL_OF_FAME_SIZE,
+        gt=0,
+    )
+
+    coevolution_top_teams: int = Field(
+        default=DEFAULT_COEVOLUTION_TOP_TEAMS,
+        gt=0,
+    )
+
+    objectives: tuple[ObjectiveName, ...] = Field(
+        default=DEFAULT_OBJECTIVES,
+        min_length=1,
+    )
+
+    surrogate: SurrogateType | None = Field(
+        default=None,
+    )
+
+    surrogate_fraction: float = Field(
+        default=DEFAULT_SURROGATE_FRACTION,
+        gt=0.0,
+        le=1.0,
+    )
+
     @model_validator(mode="after")
     def check_elite_size(self) -> "EvolutionaryAlgorithmPokemonSolver":
         if self.elite_size >= self.population_size:
@@ -78,7 +166,9 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
         return self
 
     def _initialize_population(
-        self, pokemons: DataFrame[PokemonSchema]
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        rng: np.random.Generator | None = None,
     ) -> list[PokemonTeam]:
         population: list[PokemonTeam] = []
 
@@ -87,6 +177,7 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
                 PokemonTeam.generate_team(
                     pokemons,
                     unique_types=self.unique_types,
+                    rng=rng,
                 )
             )
 
@@ -95,24 +186,375 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
     def _tournament_select(
         self,
         rng: np.random.Generator,
-        population: list[PokemonTeam],
-        fitnesses: list[float],
-    ) -> PokemonTeam:
-        selected_indexes = rng.choice(
-            self.population_size, size=self.tournament_size, replace=False
-        )
+        fitnesses: np.ndarray,
+        amount: int,
+    ) -> np.ndarray:
+        return tournament_select(fitnesses, amount, self.tournament_size, rng)
+
+    def _get_surrogate(
+        self, pool: PokemonPool, surrogate: SurrogateModel | None
+    ) -> SurrogateModel | None:
+        if surrogate is not None or self.surrogate is None:
+            return surrogate
 
-        selected_teams = [population[int(i)] for i in selected_indexes]
-        selected_fitnesses = [fitnesses[int(i)] for i in selected_indexes]
+        return SurrogateModel(pool, self.surrogate)
 
-        best_fitness_index = int(np.argmax(selected_fitnesses))
-        return selected_teams[best_fitness_index].copy()
+    def _get_candidates_amount(
+        self, amount: int, surrogate: SurrogateModel | None
+    ) -> int:
+        # Only the top surrogate_fraction of the candidates is simulated, so
+        # the surrogate gets that many more candidates to choose from.
+        if surrogate is None or not surrogate.is_ready():
+            return amount
+
+        return math.ceil(amount / self.surrogate_fraction)
 
     def _mutate(
-        self, team: PokemonTeam, pokemons: DataFrame[PokemonSchema]
+        self,
+        team: PokemonTeam,
+        pokemons: DataFrame[PokemonSchema],
+        rng: np.random.Generator | None = None,
     ) -> PokemonTeam:
         return team.generate_team_with_random_replacement(
-            pokemons, self.mutation_replacements, self.unique_types
+            pokemons, self.mutation_replacements, self.unique_types, rng
+        )
+
+    def _crossover(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        pool: PokemonPool,
+        parents: list[PokemonTeam],
+        mates: list[PokemonTeam],
+        rng: np.random.Generator,
+    ) -> list[PokemonTeam]:
+        children = crossover_teams(
+            pool,
+            np.array([parent.get_positions(pool) for parent in parents]),
+            np.array([mate.get_positions(pool) for mate in mates]),
+            rng,
+            self.crossover_type,
+            self.crossover_rate,
+            self.unique_types,
+        )
+        return [PokemonTeam.from_positions(pokemons, child) for child in children]
+
+    def _get_opponents(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        opponents: list[PokemonTeam] | None,
+        rng: np.random.Generator | None = None,
+    ) -> list[PokemonTeam]:
+        if opponents is not None:
+            return opponents
+
+        if self.opponents_limit is None:
+            raise ValueError("If opponents is None, opponents_limit must be provided.")
+
+        return PokemonTeam.sample_unique_teams(
+            pokemons,
+            self.opponents_limit,
+            TEAM_SIZE,
+            self.unique_types,
+            rng,
+        )
+
+    def _get_history_entry(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        teams: np.ndarray,
+        fitnesses: np.ndarray,
+    ) -> list[tuple[PokemonTeam, float]]:
+        order = sort_population(fitnesses)
+
+        # Large populations are recorded by evenly spaced ranks, which keeps
+        # the best and the worst team and the shape of the distribution.
+        if self.history_limit is not None and len(order) > self.history_limit:
+            ranks = np.linspace(0, len(order) - 1, self.history_limit)
+            order = order[np.round(ranks).astype(int)]
+
+        return [
+            (
+                PokemonTeam.from_positions(pokemons, teams[i]),
+                float(fitnesses[i]),
+            )
+            for i in order
+        ]
+
+    def _breed(
+        self,
+        pool: PokemonPool,
+        teams: np.ndarray,
+        fitnesses: np.ndarray,
+        amount: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        children = teams[self._tournament_select(rng, fitnesses, amount)].astype(
+            np.intp
+        )
+
+        if self.crossover_rate > 0 and amount > 0:
+            mates = teams[self._tournament_select(rng, fitnesses, amount)].astype(
+                np.intp
+            )
+            children = crossover_teams(
+                pool,
+                children,
+                mates,
+                rng,
+                self.crossover_type,
+                self.crossover_rate,
+                self.unique_types,
+            )
+
+        mutated = rng.random(amount) < self.mutation_rate
+        children[mutated] = mutate_teams(
+            pool,
+            children[mutated],
+            self.mutation_replacements,
+            rng,
+            self.unique_types,
+        )
+
+        return np.asarray(children, dtype=np.intp)
+
+    def _solve_large_population(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        opponents: list[PokemonTeam],
+        type_multiplier_formula: TypeMultiplierFormula,
+        damage_formula: DamageFormula,
+        opponents_weights: list[float] | None,
+        population_rng: np.random.Generator,
+        rng: np.random.Generator,
+        surrogate: SurrogateModel | None,
+    ) -> tuple[
+        PokemonTeam, float, list[list[tuple[PokemonTeam, float]]], list[PokemonTeam]
+    ]:
+        pool = get_pokemon_pool(pokemons)
+        surrogate = self._get_surrogate(pool, surrogate)
+        damage = get_damage_table(pool, type_multiplier_formula, damage_formula)
+        opponents_positions = np.array([opp.get_positions(pool) for opp in opponents])
+
+        def evaluate(teams: np.ndarray) -> np.ndarray:
+            return evaluate_teams(
+                pool, damage, teams, opponents_positions, opponents_weights
+            )
+
+        population = PopulationStore(self.population_size)
+        population.teams[:] = sample_team_positions(
+            pool, self.population_size, TEAM_SIZE, self.unique_types, population_rng
+        )
+        population.fitnesses[:] = evaluate(population.teams)
+
+        if surrogate is not None:
+            surrogate.update(population.teams, population.fitnesses)
+
+        best_index = int(population.fitnesses.argmax())
+        best_team = population.teams[best_index].copy()
+        best_fitness = float(population.fitnesses[best_index])
+
+        history: list[list[tuple[PokemonTeam, float]]] = []
+        offspring_size = self.population_size - self.elite_size
+
+        for _ in range(self.generations):
+            history.append(
+                self._get_history_entry(
+                    pokemons, population.teams, population.fitnesses
+                )
+            )
+
+            # Elites keep their fitness, only the offspring are evaluated.
+            elites = sort_population(population.fitnesses)[: self.elite_size]
+            population.next_teams[: self.elite_size] = population.teams[elites]
+            population.next_fitnesses[: self.elite_size] = population.fitnesses[elites]
+
+            children = self._breed(
+                pool,
+                population.teams,
+                population.fitnesses,
+                self._get_candidates_amount(offspring_size, surrogate),
+                rng,
+            )
+
+            if surrogate is not None:
+                children = children[surrogate.screen(children, offspring_size)]
+
+            children_fitnesses = _evaluate_new_teams(
+                evaluate,
+                pool.get_size(),
+                children,
+                population.teams,
+                population.fitnesses,
+            )
+            population.next_teams[self.elite_size :] = children
+            population.next_fitnesses[self.elite_size :] = children_fitnesses
+            population.swap()
+
+            if surrogate is not None:
+                surrogate.update(children, children_fitnesses)
+
+            best_index = int(population.fitnesses.argmax())
+            if population.fitnesses[best_index] > best_fitness:
+                best_team = population.teams[best_index].copy()
+                best_fitness = float(population.fitnesses[best_index])
+
+        return (
+            PokemonTeam.from_positions(pokemons, best_team),
+            best_fitness,
+            history,
+            opponents,
+        )
+
+    def _rank_population(self, objectives: np.ndarray) -> np.ndarray:
+        maximized = to_maximization(objectives, self.objectives)
+        ranks = non_dominated_sort(maximized)
+        return get_crowded_order(ranks, crowding_distances(maximized, ranks))
+
+    def solve_pareto(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        opponents: list[PokemonTeam] | None = None,
+        type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+        damage_formula: DamageFormula = damage_attack_devide_defense,
+        opponents_weights: list[float] | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[list[PokemonTeam], np.ndarray, list[PokemonTeam]]:
+        rng = np.random.default_rng(self.seed if rng is None else rng)
+        opponents_rng, population_rng, rng = rng.spawn(3)
+        opponents = self._get_opponents(pokemons, opponents, opponents_rng)
+
+        pool = get_pokemon_pool(pokemons)
+        damage = get_damage_table(pool, type_multiplier_formula, damage_formula)
+        opponents_positions = np.array([opp.get_positions(pool) for opp in opponents])
+
+        def evaluate(teams: np.ndarray) -> np.ndarray:
+            ratios = get_remaining_hp_ratio_matrix(
+                pool, damage, teams, opponents_positions
+            )
+            return get_objectives(
+                pool, teams, ratios, self.objectives, opponents_weights
+            )
+
+        teams = sample_team_positions(
+            pool, self.population_size, TEAM_SIZE, self.unique_types, population_rng
+        )
+        objectives = evaluate(teams)
+        order = self._rank_population(objectives)
+
+        for _ in range(self.generations):
+            # Tournaments compare teams by rank and crowding distance, which
+            # is the position in the crowded order.
+            scores = np.empty(len(order), dtype=float)
+            scores[order] = -np.arange(len(order))
+
+            children = self._breed(pool, teams, scores, self.population_size, rng)
+            children_objectives = _evaluate_new_teams(
+                evaluate, pool.get_size(), children, teams, objectives
+            )
+            teams = np.concatenate([teams, children])
+            objectives = np.concatenate([objectives, children_objectives])
+
+            # Survivors are taken in crowded order, so they stay sorted by it.
+            survivors = self._rank_population(objectives)[: self.population_size]
+            teams, objectives = teams[survivors], objectives[survivors]
+            order = np.arange(self.population_size)
+
+        maximized = to_maximization(objectives, self.objectives)
+        front = np.flatnonzero(non_dominated_sort(maximized) == 0)
+
+        # The same team can survive several times, the front keeps it once.
+        front = front[get_unique_team_indexes(teams[front], pool.get_size())]
+
+        return (
+            [PokemonTeam.from_positions(pokemons, team) for team in teams[front]],
+            objectives[front],
+            opponents,
+        )
+
+    def _reproduce(
+        self,
+        pool: PokemonPool,
+        teams: np.ndarray,
+        fitnesses: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        elites = sort_population(fitnesses)[: self.elite_size]
+        children = self._breed(pool, teams, fitnesses, len(teams) - len(elites), rng)
+        return np.concatenate([teams[elites].astype(np.intp), children])
+
+    def solve_coevolution(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        opponents: list[PokemonTeam] | None = None,
+        type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+        damage_formula: DamageFormula = damage_attack_devide_defense,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[
+        PokemonTeam, float, list[list[tuple[PokemonTeam, float]]], list[PokemonTeam]
+    ]:
+        rng = np.random.default_rng(self.seed if rng is None else rng)
+        opponents_rng, population_rng, rng = rng.spawn(3)
+        opponents = self._get_opponents(pokemons, opponents, opponents_rng)
+
+        if len(opponents) <= self.elite_size or len(opponents) < self.tournament_size:
+            raise ValueError(
+                "Opponents population must be larger than elite_size "
+                "and at least as large as tournament_size."
+            )
+
+        pool = get_pokemon_pool(pokemons)
+        damage = get_damage_table(pool, type_multiplier_formula, damage_formula)
+        cache = BattleResultsCache(pool, damage)
+
+        teams = sample_team_positions(
+            pool, self.population_size, TEAM_SIZE, self.unique_types, population_rng
+        )
+        opponent_teams = np.array([opp.get_positions(pool) for opp in opponents])
+        teams_hall = np.empty((0, TEAM_SIZE), dtype=np.intp)
+        opponents_hall = np.empty((0, TEAM_SIZE), dtype=np.intp)
+
+        history: list[list[tuple[PokemonTeam, float]]] = []
+
+        for _ in range(self.generations):
+            # Hall of fame opponents stay in the evaluation, so teams cannot
+            # forget how to beat opponents that were strong before.
+            rivals = np.concatenate([opponent_teams, opponents_hall])
+            fitnesses = cache.get_remaining_hp_ratio_matrix(teams, rivals).mean(axis=1)
+            history.append(self._get_history_entry(pokemons, teams, fitnesses))
+
+            order = sort_population(fitnesses)
+            teams_hall = _add_to_hall_of_fame(
+                teams_hall, teams[order[0]], self.hall_of_fame_size
+            )
+
+            # Opponents evolve to beat the current best teams.
+            best_teams = np.concatenate(
+                [teams[order[: self.coevolution_top_teams]], teams_hall]
+            )
+            opponent_fitnesses = 1.0 - cache.get_remaining_hp_ratio_matrix(
+                best_teams, opponent_teams
+            ).mean(axis=0)
+            opponents_hall = _add_to_hall_of_fame(
+                opponents_hall,
+                opponent_teams[opponent_fitnesses.argmax()],
+                self.hall_of_fame_size,
+            )
+
+            teams = self._reproduce(pool, teams, fitnesses, rng)
+            opponent_teams = self._reproduce(
+                pool, opponent_teams, opponent_fitnesses, rng
+            )
+
+        rivals = np.concatenate([opponent_teams, opponents_hall])
+        candidates = np.concatenate([teams, teams_hall])
+        fitnesses = cache.get_remaining_hp_ratio_matrix(candidates, rivals).mean(axis=1)
+        best_index = int(fitnesses.argmax())
+
+        return (
+            PokemonTeam.from_positions(pokemons, candidates[best_index]),
+            float(fitnesses[best_index]),
+            history,
+            [PokemonTeam.from_positions(pokemons, rival) for rival in rivals],
         )
 
     def _evaluate(
@@ -121,6 +563,7 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
         opponents: list[PokemonTeam],
         type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
         damage_formula: DamageFormula = damage_attack_devide_defense,
+        opponents_weights: list[float] | None = None,
     ) -> float:
         team_remaining_hps_percentage: list[float] = []
 
@@ -136,7 +579,12 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
                 team_remaining_hp / sum(team.get_hps())
             )
 
-        return float(np.mean(np.array(team_remaining_hps_percentage, dtype=float)))
+        return float(
+            np.average(
+                np.array(team_remaining_hps_percentage, dtype=float),
+                weights=opponents_weights,
+            )
+        )
 
     def solve(
         self,
@@ -144,26 +592,42 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
         opponents: list[PokemonTeam] | None = None,
         type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
         damage_formula: DamageFormula = damage_attack_devide_defense,
+        opponents_weights: list[float] | None = None,
+        rng: np.random.Generator | None = None,
+        surrogate: SurrogateModel | None = None,
     ) -> tuple[
         PokemonTeam, float, list[list[tuple[PokemonTeam, float]]], list[PokemonTeam]
     ]:
-        rng = np.random.default_rng()
-        population = self._initialize_population(pokemons)
-        if opponents is None:
-            opponents = PokemonTeam.generate_unique_teams(
+        rng = np.random.default_rng(self.seed if rng is None else rng)
+        opponents_rng, population_rng, rng = rng.spawn(3)
+
+        if self.large_population:
+            return self._solve_large_population(
                 pokemons,
-                self.opponents_limit,
-                self.opponents_limit * 10 if self.opponents_limit is not None else None,
-                population[0].get_size(),
-                self.unique_types,
+                self._get_opponents(pokemons, opponents, opponents_rng),
+                type_multiplier_formula,
+                damage_formula,
+                opponents_weights,
+                population_rng,
+                rng,
+                surrogate,
             )
 
+        population = self._initialize_population(pokemons, population_rng)
+        opponents = self._get_opponents(pokemons, opponents, opponents_rng)
+
+        pool = get_pokemon_pool(pokemons)
+        surrogate = self._get_surrogate(pool, surrogate)
         best_team = population[0].copy()
         best_fitness = float("-inf")
 
         for team in population:
             fitness = self._evaluate(
-                team, opponents, type_multiplier_formula, damage_formula
+                team,
+                opponents,
+                type_multiplier_formula,
+                damage_formula,
+                opponents_weights,
             )
 
             if fitness > best_fitness:
@@ -172,7 +636,7 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
 
         history: list[list[tuple[PokemonTeam, float]]] = []
 
-        for _ in range(self.generations):
+        for generation in range(self.generations):
             fitnesses: list[float] = []
 
             for team in population:
@@ -181,38 +645,107 @@ class EvolutionaryAlgorithmPokemonSolver(BaseModel):
                     opponents,
                     type_multiplier_formula,
                     damage_formula,
+                    opponents_weights,
                 )
 
                 fitnesses.append(fitness)
 
             history.append(list(zip(population, fitnesses, strict=True)))
 
-            scored = sorted(
-                zip(fitnesses, population, strict=True),
-                key=lambda pair: pair[0],
-                reverse=True,
-            )
+            fitnesses_array = np.array(fitnesses, dtype=float)
 
-            sorted_fitnesses, sorted_population = zip(*scored, strict=True)
+            if surrogate is not None:
+                # Elites were already seen by the surrogate in the previous
+                # generation, only the new teams are added.
+                new_teams = (
+                    population if generation == 0 else population[self.elite_size :]
+                )
+                surrogate.update(
+                    np.array([team.get_positions(pool) for team in new_teams]),
+                    fitnesses_array[len(population) - len(new_teams) :],
+                )
+            order = sort_population(fitnesses_array)
 
-            if sorted_fitnesses[0] > best_fitness:
-                best_fitness = sorted_fitnesses[0]
-                best_team = sorted_population[0].copy()
+            if fitnesses_array[order[0]] > best_fitness:
+                best_fitness = fitnesses[order[0]]
+                best_team = population[order[0]].copy()
 
             new_population: list[PokemonTeam] = [
-                team.copy() for team in sorted_population[: self.elite_size]
+                population[i].copy() for i in order[: self.elite_size]
             ]
 
-            for _ in range(self.population_size - self.elite_size):
-                selected_team = self._tournament_select(
-                    rng, list(sorted_population), list(sorted_fitnesses)
+            offspring_size = self.population_size - self.elite_size
+            candidates_amount = self._get_candidates_amount(offspring_size, surrogate)
+            selected_teams = [
+                population[i]
+                for i in self._tournament_select(
+                    rng, fitnesses_array, candidates_amount
                 )
+            ]
 
-                if rng.random() < self.mutation_rate:
-                    selected_team = self._mutate(selected_team, pokemons)
+            if self.crossover_rate > 0 and candidates_amount > 0:
+                mates = [
+                    population[i]
+                    for i in self._tournament_select(
+                        rng, fitnesses_array, candidates_amount
+                    )
+                ]
+                selected_teams = self._crossover(
+                    pokemons, pool, selected_teams, mates, rng
+                )
 
-                new_population.append(selected_team)
+            mutated = rng.random(candidates_amount) < self.mutation_rate
+            offspring = [
+                self._mutate(selected_team, pokemons, rng)
+                if is_mutated
+                else selected_team
+                for selected_team, is_mutated in zip(
+                    selected_teams, mutated, strict=True
+                )
+            ]
 
-            population = new_population
+            if surrogate is not None and candidates_amount > offspring_size:
+                screened = surrogate.screen(
+                    np.array([team.get_positions(pool) for team in offspring]),
+                    offspring_size,
+                )
+                offspring = [offspring[i] for i in screened]
+
+            population = new_population + offspring
 
         return best_team, best_fitness, history, opponents
+
+
+def _add_to_hall_of_fame(hall: np.ndarray, team: np.ndarray, size: int) -> np.ndarray:
+    if (hall == team).all(axis=1).any():
+        return hall
+
+    return np.concatenate([hall, team[None, :]])[-size:]
+
+
+def _evaluate_new_teams(
+    evaluate: Callable[[np.ndarray], np.ndarray],
+    pool_size: int,
+    teams: np.ndarray,
+    known_teams: np.ndarray,
+    known_values: np.ndarray,
+) -> np.ndarray:
+    # Unchanged offspring and repeated children are common, so only teams
+    # never evaluated are simulated. The order of members changes the
+    # battles, so only teams equal in order share a result.
+    keys = get_team_keys(teams, pool_size)
+    known = SortedIndex(dtype=np.intp)
+    known.add(get_team_keys(known_teams, pool_size), np.arange(len(known_teams)))
+    rows, found = known.get(keys)
+
+    values = np.empty((len(teams), *known_values.shape[1:]), dtype=known_values.dtype)
+    values[found] = known_values[rows[found]]
+    missing = np.flatnonzero(~found)
+
+    if missing.size > 0:
+        _, first_indexes, inverse = np.unique(
+            keys[missing], return_index=True, return_inverse=True
+        )
+        values[missing] = evaluate(teams[missing[first_indexes]])[inverse.ravel()]
+
+    return values
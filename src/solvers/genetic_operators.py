@@ -0,0 +1,233 @@
+from typing import Literal
+
+import numpy as np
+
+from classes import sample_allowed_positions
+from constants import SAMPLING_CHUNK_SIZE
+from data import PokemonPool
+
+type CrossoverType = Literal["uniform", "slot", "type_aware"]
+
+
+def uniform_crossover(
+    first_parents: np.ndarray, second_parents: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    from_first = rng.random(first_parents.shape) < 0.5
+    return np.where(from_first, first_parents, second_parents)
+
+
+def slot_crossover(
+    first_parents: np.ndarray, second_parents: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    team_size = first_parents.shape[1]
+    cut_points = rng.integers(1, team_size, size=len(first_parents))
+    from_first = np.arange(team_size)[None, :] < cut_points[:, None]
+    return np.where(from_first, first_parents, second_parents)
+
+
+def repair_teams(
+    pool: PokemonPool,
+    teams: np.ndarray,
+    rng: np.random.Generator,
+    unique_types: bool = True,
+    alternatives: np.ndarray | None = None,
+    fallbacks: np.ndarray | None = None,
+) -> np.ndarray:
+    type_masks = pool.get_type_masks()
+    teams_amount, team_size = teams.shape
+    rows = np.arange(teams_amount)
+
+    repaired = teams.copy()
+    team_masks = np.zeros(teams_amount, dtype=np.int64)
+    failed = np.zeros(teams_amount, dtype=bool)
+
+    def is_allowed(candidates: np.ndarray, slot: int) -> np.ndarray:
+        duplicated = (repaired[:, :slot] == candidates[:, None]).any(axis=1)
+
+        if not unique_types:
+            return np.asarray(~duplicated, dtype=bool)
+
+        return np.asarray(
+            ~duplicated & ((type_masks[candidates] & team_masks) == 0), dtype=bool
+        )
+
+    # Slots are fixed left to right. A colliding member is replaced by the
+    # alternative for that slot (the other parent) when it fits, otherwise by
+    # a random pokemon that still fits the team.
+    for slot in range(team_size):
+        allowed = is_allowed(repaired[:, slot], slot)
+
+        if alternatives is not None:
+            use_alternative = ~allowed & is_allowed(alternatives[:, slot], slot)
+            repaired[use_alternative, slot] = alternatives[use_alternative, slot]
+            allowed |= use_alternative
+
+        colliding = np.flatnonzero(~allowed)
+
+        if colliding.size > 0:
+            blocked_masks = (
+                team_masks[colliding]
+                if unique_types
+                else np.zeros(colliding.size, dtype=np.int64)
+            )
+            chosen, found = sample_allowed_positions(
+                pool, blocked_masks, repaired[colliding, :slot], rng
+            )
+
+            repaired[colliding, slot] = chosen
+            failed[colliding] |= ~found
+
+        team_masks |= type_masks[repaired[rows, slot]]
+
+    if failed.any():
+        if fallbacks is None:
+            raise ValueError("Could not repair some teams.")
+
+        repaired[failed] = fallbacks[failed]
+
+    return repaired
+
+
+def crossover_teams(
+    pool: PokemonPool,
+    first_parents: np.ndarray,
+    second_parents: np.ndarray,
+    rng: np.random.Generator,
+    crossover_type: CrossoverType = "uniform",
+    crossover_rate: float = 1.0,
+    unique_types: bool = True,
+) -> np.ndarray:
+    if crossover_type == "slot":
+        children = slot_crossover(first_parents, second_parents, rng)
+    else:
+        children = uniform_crossover(first_parents, second_parents, rng)
+
+    crossed = rng.random(len(first_parents)) < crossover_rate
+    children = np.where(crossed[:, None], children, first_parents)
+
+    # For type aware crossover the genes of the parent not taken at a slot are
+    # tried first, so children stay close to their parents after repair.
+    alternatives = None
+    if crossover_type == "type_aware":
+        alternatives = np.where(
+            children == first_parents, second_parents, first_parents
+        )
+
+    for start in range(0, len(children), SAMPLING_CHUNK_SIZE):
+        chunk = slice(start, start + SAMPLING_CHUNK_SIZE)
+        children[chunk] = repair_teams(
+            pool,
+            children[chunk],
+            rng,
+            unique_types=unique_types,
+            alternatives=None if alternatives is None else alternatives[chunk],
+            fallbacks=first_parents[chunk],
+        )
+
+    return children
+
+
+def sample_tournaments(
+    population_size: int,
+    tournaments: int,
+    tournament_size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    if tournament_size > population_size:
+        raise ValueError(
+            "tournament_size must be smaller than or equal to population_size"
+        )
+
+    # Drawing whole rows with replacement and redrawing the few rows that
+    # repeat a contestant is cheap while tournaments are small compared to
+    # the population; otherwise every row is a prefix of a random permutation.
+    if 2 * tournament_size > population_size:
+        keys = rng.random((tournaments, population_size))
+        return np.argpartition(keys, tournament_size - 1, axis=1)[:, :tournament_size]
+
+    contestants = rng.integers(0, population_size, size=(tournaments, tournament_size))
+
+    while True:
+        sorted_contestants = np.sort(contestants, axis=1)
+        repeated = np.flatnonzero(
+            (sorted_contestants[:, 1:] == sorted_contestants[:, :-1]).any(axis=1)
+        )
+
+        if repeated.size == 0:
+            return contestants
+
+        contestants[repeated] = rng.integers(
+            0, population_size, size=(repeated.size, tournament_size)
+        )
+
+
+def tournament_select(
+    fitnesses: np.ndarray,
+    amount: int,
+    tournament_size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    contestants = sample_tournaments(len(fitnesses), amount, tournament_size, rng)
+    winners = fitnesses[contestants].argmax(axis=1)
+    return np.asarray(contestants[np.arange(amount), winners], dtype=np.intp)
+
+
+def sort_population(fitnesses: np.ndarray) -> np.ndarray:
+    return np.argsort(-fitnesses, kind="stable")
+
+
+def mutate_teams(
+    pool: PokemonPool,
+    teams: np.ndarray,
+    replacements: int,
+    rng: np.random.Generator,
+    unique_types: bool = True,
+) -> np.ndarray:
+    mutated = np.array(teams, dtype=np.intp)
+
+    for start in range(0, len(teams), SAMPLING_CHUNK_SIZE):
+        mutated[start : start + SAMPLING_CHUNK_SIZE] = _mutate_chunk(
+            pool,
+            mutated[start : start + SAMPLING_CHUNK_SIZE],
+            replacements,
+            rng,
+            unique_types,
+        )
+
+    return mutated
+
+
+def _mutate_chunk(
+    pool: PokemonPool,
+    teams: np.ndarray,
+    replacements: int,
+    rng: np.random.Generator,
+    unique_types: bool,
+) -> np.ndarray:
+    type_masks = pool.get_type_masks()
+    teams_amount, team_size = teams.shape
+    rows = np.arange(teams_amount)
+
+    slots = np.argsort(rng.random((teams_amount, team_size)), axis=1)
+    mutated = teams.copy()
+
+    # Like PokemonTeam.generate_team_with_random_replacement, a replaced slot
+    # takes a random pokemon outside the original team that fits the others,
+    # and stays unchanged when there is none.
+    for step in range(min(replacements, team_size)):
+        slot = slots[:, step]
+
+        others_masks = np.zeros(teams_amount, dtype=np.int64)
+
+        if unique_types:
+            member_masks = type_masks[mutated]
+            member_masks[rows, slot] = 0
+            others_masks = np.bitwise_or.reduce(member_masks, axis=1)
+
+        chosen, found = sample_allowed_positions(
+            pool, others_masks, np.concatenate([teams, mutated], axis=1), rng
+        )
+
+        mutated[rows[found], slot[found]] = chosen[found]
+
+    return mutated
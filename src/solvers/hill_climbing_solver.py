@@ -1,15 +1,17 @@
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pandera.typing import DataFrame
-from typing import Optional
 
-from classes import PokemonTeam
+from classes import PokemonTeam, apply_replacement_moves, get_replacement_moves
+from data import get_pokemon_pool
 from schemas import PokemonSchema
 from simulation import (
     TypeMultiplierFormula,
     DamageFormula,
     multiply_type_multiplier,
     damage_attack_devide_defense,
+    evaluate_teams,
+    get_damage_table,
     simulate_battle,
 )
 from constants import (
@@ -19,6 +21,7 @@ from constants import (
     DEFAULT_HILL_CLIMBING_OPPONENTS_LIMIT,
     DEFAULT_HILL_CLIMBING_PATIENCE,
     DEFAULT_HILL_CLIMBING_RESTARTS,
+    DEFAULT_HILL_CLIMBING_STEEPEST_MAX_EVALUATIONS,
 )
 
 
@@ -42,6 +45,16 @@ class HillClimbingPokemonSolver(BaseModel):
     restarts: int = Field(default=DEFAULT_HILL_CLIMBING_RESTARTS, ge=0)
     patience: int | None = Field(default=DEFAULT_HILL_CLIMBING_PATIENCE, gt=0)
 
+    # Scores the whole single-slot neighborhood each step instead of sampling
+    # neighbors_per_step random replacements.
+    steepest_ascent: bool = Field(default=False)
+    # Whole neighbourhoods need a larger budget than max_evaluations.
+    steepest_max_evaluations: int = Field(
+        default=DEFAULT_HILL_CLIMBING_STEEPEST_MAX_EVALUATIONS, gt=0
+    )
+    # Scores this many random moves per step instead of the whole neighbourhood.
+    steepest_sample_size: int | None = Field(default=None, gt=0)
+
     @model_validator(mode="after")
     def _check(self) -> "HillClimbingPokemonSolver":
         if self.neighbors_per_step <= 0:
@@ -54,6 +67,7 @@ class HillClimbingPokemonSolver(BaseModel):
         opponents: list[PokemonTeam],
         type_multiplier_formula: TypeMultiplierFormula,
         damage_formula: DamageFormula,
+        opponents_weights: list[float] | None = None,
     ) -> float:
         base_hp = sum(team.get_hps())
         ratios = []
@@ -62,40 +76,61 @@ class HillClimbingPokemonSolver(BaseModel):
                 team, opp, type_multiplier_formula, damage_formula
             )
             ratios.append(remaining / base_hp)
-        return float(np.mean(np.array(ratios, dtype=float)))
+        return float(
+            np.average(np.array(ratios, dtype=float), weights=opponents_weights)
+        )
 
     def _get_opponents(
         self,
         pokemons: DataFrame[PokemonSchema],
         opponents: list[PokemonTeam] | None,
+        rng: np.random.Generator | None = None,
     ) -> list[PokemonTeam]:
         if opponents is not None:
             return opponents
         if self.opponents_limit is None:
             raise ValueError("If opponents is None, opponents_limit must be provided.")
-        return PokemonTeam.generate_unique_teams(
+        return PokemonTeam.sample_unique_teams(
             pokemons,
-            opponents_limit=self.opponents_limit,
-            max_attempts=self.opponents_limit * 20,
+            teams_amount=self.opponents_limit,
             team_size=6,
             unique_types=self.unique_types,
+            rng=rng,
         )
 
-    def _random_team(self, pokemons: DataFrame[PokemonSchema]) -> PokemonTeam:
+    def _random_team(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        rng: np.random.Generator | None = None,
+    ) -> PokemonTeam:
         return PokemonTeam.generate_team(
-            pokemons, team_size=6, unique_types=self.unique_types
+            pokemons, team_size=6, unique_types=self.unique_types, rng=rng
         )
 
     def solve(
         self,
         pokemons: DataFrame[PokemonSchema],
         opponents: list[PokemonTeam] | None = None,
-        start_team: Optional[PokemonTeam] = None,
+        start_team: PokemonTeam | None = None,
         type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
         damage_formula: DamageFormula = damage_attack_devide_defense,
+        opponents_weights: list[float] | None = None,
+        rng: np.random.Generator | None = None,
     ) -> tuple[PokemonTeam, float, list[tuple[PokemonTeam, float]], list[PokemonTeam]]:
-        rng = np.random.default_rng(self.seed)
-        opponents = self._get_opponents(pokemons, opponents)
+        rng = np.random.default_rng(self.seed if rng is None else rng)
+        opponents_rng, *runs_rngs = rng.spawn(self.restarts + 2)
+        opponents = self._get_opponents(pokemons, opponents, opponents_rng)
+
+        if self.steepest_ascent:
+            return self._solve_steepest_ascent(
+                pokemons,
+                opponents,
+                runs_rngs,
+                start_team,
+                type_multiplier_formula,
+                damage_formula,
+                opponents_weights,
+            )
 
         history: list[tuple[PokemonTeam, float]] = []
 
@@ -107,13 +142,19 @@ class HillClimbingPokemonSolver(BaseModel):
             if evaluations >= self.max_evaluations:
                 break
 
+            run_rng = runs_rngs[run_idx]
+
             if run_idx == 0 and start_team is not None:
                 current = start_team.copy()
             else:
-                current = self._random_team(pokemons)
+                current = self._random_team(pokemons, run_rng)
 
             current_fit = self._evaluate(
-                current, opponents, type_multiplier_formula, damage_formula
+                current,
+                opponents,
+                type_multiplier_formula,
+                damage_formula,
+                opponents_weights,
             )
             evaluations += 1
 
@@ -135,9 +176,14 @@ class HillClimbingPokemonSolver(BaseModel):
                         pokemons,
                         replacements=self.neighbor_replacements,
                         unique_types=self.unique_types,
+                        rng=run_rng,
                     )
                     cand_fit = self._evaluate(
-                        cand, opponents, type_multiplier_formula, damage_formula
+                        cand,
+                        opponents,
+                        type_multiplier_formula,
+                        damage_formula,
+                        opponents_weights,
                     )
                     evaluations += 1
 
@@ -161,9 +207,131 @@ class HillClimbingPokemonSolver(BaseModel):
                         break
 
         if best_team is None:
-            best_team = self._random_team(pokemons)
+            best_team = self._random_team(pokemons, runs_rngs[-1])
             best_fit = self._evaluate(
-                best_team, opponents, type_multiplier_formula, damage_formula
+                best_team,
+                opponents,
+                type_multiplier_formula,
+                damage_formula,
+                opponents_weights,
             )
 
         return best_team, best_fit, history, opponents
+
+    def _solve_steepest_ascent(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        opponents: list[PokemonTeam],
+        runs_rngs: list[np.random.Generator],
+        start_team: PokemonTeam | None,
+        type_multiplier_formula: TypeMultiplierFormula,
+        damage_formula: DamageFormula,
+        opponents_weights: list[float] | None = None,
+    ) -> tuple[PokemonTeam, float, list[tuple[PokemonTeam, float]], list[PokemonTeam]]:
+        pool = get_pokemon_pool(pokemons)
+        damage = get_damage_table(pool, type_multiplier_formula, damage_formula)
+        opponents_positions = np.array([opp.get_positions(pool) for opp in opponents])
+
+        history: list[tuple[PokemonTeam, float]] = []
+
+        best_team = None
+        best_fit = float("-inf")
+        evaluations = 0
+
+        for run_idx in range(self.restarts + 1):
+            if evaluations >= self.steepest_max_evaluations:
+                break
+
+            if run_idx == 0 and start_team is not None:
+                current = start_team.get_positions(pool)
+            else:
+                current = self._random_team(pokemons, runs_rngs[run_idx]).get_positions(
+                    pool
+                )
+
+            current_fit = float(
+                evaluate_teams(
+                    pool,
+                    damage,
+                    current[None, :],
+                    opponents_positions,
+                    opponents_weights,
+                )[0]
+            )
+            evaluations += 1
+
+            if current_fit > best_fit:
+                best_fit = current_fit
+                best_team = current.copy()
+
+            no_improve = 0
+
+            while evaluations < self.steepest_max_evaluations:
+                slots, candidates = get_replacement_moves(
+                    pool, current, self.unique_types
+                )
+
+                if self.steepest_sample_size is not None and (
+                    len(slots) > self.steepest_sample_size
+                ):
+                    chosen = runs_rngs[run_idx].choice(
+                        len(slots), size=self.steepest_sample_size, replace=False
+                    )
+                    slots, candidates = slots[chosen], candidates[chosen]
+
+                # A step is never cut short, so the run ends once the next
+                # step does not fit into the budget.
+                if len(slots) == 0 or (
+                    evaluations + len(slots) > self.steepest_max_evaluations
+                ):
+                    break
+
+                neighbors = apply_replacement_moves(current, slots, candidates)
+                fits = evaluate_teams(
+                    pool, damage, neighbors, opponents_positions, opponents_weights
+                )
+                evaluations += len(neighbors)
+
+                history.append(
+                    (PokemonTeam.from_positions(pokemons, current), current_fit)
+                )
+
+                best_move = int(fits.argmax())
+
+                if fits[best_move] > current_fit:
+                    current = neighbors[best_move]
+                    current_fit = float(fits[best_move])
+                    no_improve = 0
+
+                    if current_fit > best_fit:
+                        best_fit = current_fit
+                        best_team = current.copy()
+                else:
+                    no_improve += 1
+                    # Without sampling the same neighbourhood would be scored
+                    # again, so a local optimum ends the run at once.
+                    if (
+                        self.steepest_sample_size is None
+                        or self.patience is None
+                        or no_improve >= self.patience
+                    ):
+                        break
+
+        if best_team is None:
+            best_team = self._random_team(pokemons, runs_rngs[-1]).get_positions(pool)
+            best_fit = float(
+                evaluate_teams(
+                    pool,
+                    damage,
+                    best_team[None, :],
+                    opponents_positions,
+                    opponents_weights,
+                )[0]
+            )
+
+        return (
+            PokemonTeam.from_positions(pokemons, best_team),
+            best_fit,
+            history,
+            opponents,
+        )
@@ -0,0 +1,112 @@
+from typing import Literal
+
+import numpy as np
+
+from data import PokemonPool
+
+type ObjectiveName = Literal["mean_hp_ratio", "win_rate", "worst_case", "stats_sum"]
+
+MINIMIZED_OBJECTIVES: tuple[ObjectiveName, ...] = ("stats_sum",)
+
+
+def get_objectives(
+    pool: PokemonPool,
+    teams: np.ndarray,
+    ratios: np.ndarray,
+    objectives: tuple[ObjectiveName, ...],
+    opponents_weights: np.ndarray | list[float] | None = None,
+) -> np.ndarray:
+    columns: list[np.ndarray] = []
+
+    for objective in objectives:
+        if objective == "mean_hp_ratio":
+            columns.append(np.average(ratios, axis=1, weights=opponents_weights))
+        elif objective == "win_rate":
+            columns.append(np.average(ratios > 0, axis=1, weights=opponents_weights))
+        elif objective == "worst_case":
+            columns.append(ratios.min(axis=1))
+        elif objective == "stats_sum":
+            stats = pool.attack + pool.sp_attack + pool.defense + pool.sp_defense
+            columns.append(stats[teams].sum(axis=1).astype(float))
+        else:
+            raise ValueError(f"Unknown objective: {objective}")
+
+    return np.stack(columns, axis=1)
+
+
+def to_maximization(
+    values: np.ndarray, objectives: tuple[ObjectiveName, ...]
+) -> np.ndarray:
+    signs = np.array(
+        [-1.0 if objective in MINIMIZED_OBJECTIVES else 1.0 for objective in objectives]
+    )
+    return np.asarray(values * signs, dtype=float)
+
+
+def non_dominated_sort(objectives: np.ndarray) -> np.ndarray:
+    unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+    unique_ranks = np.empty(len(unique), dtype=np.intp)
+
+    fronts: list[np.ndarray] = []
+    front_sizes: list[int] = []
+
+    # Rows are visited in descending lexicographic order, so everything that
+    # could dominate a row is already placed. A row dominated by some member
+    # of a front is dominated by a member of every earlier front as well,
+    # so its front is found by binary search instead of scanning all fronts.
+    for i in range(len(unique) - 1, -1, -1):
+        point = unique[i]
+        low, high = 0, len(fronts)
+
+        while low < high:
+            middle = (low + high) // 2
+            members = fronts[middle][: front_sizes[middle]]
+
+            if (members >= point).all(axis=1).any():
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == len(fronts):
+            fronts.append(np.empty((4, unique.shape[1]), dtype=unique.dtype))
+            front_sizes.append(0)
+        elif front_sizes[low] == len(fronts[low]):
+            fronts[low] = np.concatenate([fronts[low], np.empty_like(fronts[low])])
+
+        fronts[low][front_sizes[low]] = point
+        front_sizes[low] += 1
+        unique_ranks[i] = low
+
+    return unique_ranks[inverse.ravel()]
+
+
+def crowding_distances(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    distances = np.zeros(len(objectives), dtype=float)
+
+    if len(objectives) == 0:
+        return distances
+
+    # All fronts are handled at once: sorting by rank first keeps each front
+    # contiguous, and its ends are the front boundaries.
+    for column in objectives.T:
+        order = np.lexsort((column, ranks))
+        values = column[order]
+        sorted_ranks = ranks[order]
+
+        starts = np.r_[True, sorted_ranks[1:] != sorted_ranks[:-1]]
+        ends = np.r_[sorted_ranks[1:] != sorted_ranks[:-1], True]
+        fronts = np.cumsum(starts) - 1
+        spans = (values[ends] - values[starts])[fronts]
+
+        gaps = np.zeros(len(values), dtype=float)
+        gaps[1:-1] = values[2:] - values[:-2]
+
+        contributions = np.divide(gaps, spans, out=np.zeros_like(gaps), where=spans > 0)
+        contributions[starts | ends] = np.inf
+        distances[order] += contributions
+
+    return distances
+
+
+def get_crowded_order(ranks: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    return np.lexsort((-distances, ranks))
@@ -0,0 +1,34 @@
+import numpy as np
+
+from constants import TEAM_SIZE
+
+
+class PopulationStore:
+    def __init__(
+        self,
+        population_size: int,
+        team_size: int = TEAM_SIZE,
+        dtype: np.dtype | type = np.int32,
+    ) -> None:
+        self.teams = np.zeros((population_size, team_size), dtype=dtype)
+        self.fitnesses = np.full(population_size, -np.inf, dtype=float)
+
+        # The next generation is written into the back buffers, so replacing
+        # a generation never allocates a new population.
+        self.next_teams = np.zeros_like(self.teams)
+        self.next_fitnesses = np.full_like(self.fitnesses, -np.inf)
+
+    def get_size(self) -> int:
+        return len(self.teams)
+
+    def get_nbytes(self) -> int:
+        return (
+            self.teams.nbytes
+            + self.fitnesses.nbytes
+            + self.next_teams.nbytes
+            + self.next_fitnesses.nbytes
+        )
+
+    def swap(self) -> None:
+        self.teams, self.next_teams = self.next_teams, self.teams
+        self.fitnesses, self.next_fitnesses = self.next_fitnesses, self.fitnesses
@@ -29,6 +29,7 @@ class RandomSearchPokemonSolver(BaseModel):
         opponents: list[PokemonTeam],
         type_multiplier_formula: TypeMultiplierFormula,
         damage_formula: DamageFormula,
+        opponents_weights: list[float] | None = None,
     ) -> float:
         base_hp = sum(team.get_hps())
         ratios = []
@@ -37,30 +38,38 @@ class RandomSearchPokemonSolver(BaseModel):
                 team, opp, type_multiplier_formula, damage_formula
             )
             ratios.append(remaining / base_hp)
-        return float(np.mean(np.array(ratios, dtype=float)))
+        return float(
+            np.average(np.array(ratios, dtype=float), weights=opponents_weights)
+        )
 
     def _get_opponents(
         self,
         pokemons: DataFrame[PokemonSchema],
         opponents: list[PokemonTeam] | None,
+        rng: np.random.Generator | None = None,
     ) -> list[PokemonTeam]:
         if opponents is not None:
             return opponents
         if self.opponents_limit is None:
             raise ValueError("If opponents is None, opponents_limit must be provided.")
-        return PokemonTeam.generate_unique_teams(
+        return PokemonTeam.sample_unique_teams(
             pokemons,
-            opponents_limit=self.opponents_limit,
-            max_attempts=self.opponents_limit * 20,
+            teams_amount=self.opponents_limit,
             team_size=6,
             unique_types=self.unique_types,
+            rng=rng,
         )
 
-    def _get_random_team(self, pokemons: DataFrame[PokemonSchema]) -> PokemonTeam:
+    def _get_random_team(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        rng: np.random.Generator | None = None,
+    ) -> PokemonTeam:
         return PokemonTeam.generate_team(
             pokemons,
             team_size=6,
             unique_types=self.unique_types,
+            rng=rng,
         )
 
     def solve(
@@ -69,23 +78,32 @@ class RandomSearchPokemonSolver(BaseModel):
         opponents: list[PokemonTeam] | None = None,
         type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
         damage_formula: DamageFormula = damage_attack_devide_defense,
+        opponents_weights: list[float] | None = None,
+        rng: np.random.Generator | None = None,
     ) -> tuple[PokemonTeam, float, list[tuple[PokemonTeam, float]], list[PokemonTeam]]:
-        rng = np.random.default_rng(self.seed)
-        opponents = self._get_opponents(pokemons, opponents)
+        rng = np.random.default_rng(self.seed if rng is None else rng)
+        opponents_rng, trials_rng = rng.spawn(2)
+        opponents = self._get_opponents(pokemons, opponents, opponents_rng)
 
-        best_team = self._get_random_team(pokemons)
+        best_team = self._get_random_team(pokemons, trials_rng)
         best_fit = self._evaluate(
-            best_team, opponents, type_multiplier_formula, damage_formula
+            best_team,
+            opponents,
+            type_multiplier_formula,
+            damage_formula,
+            opponents_weights,
         )
 
         history: list[tuple[PokemonTeam, float]] = [(best_team.copy(), best_fit)]
 
         for _ in range(self.trials - 1):
-            team = PokemonTeam.generate_team(
-                pokemons, team_size=6, unique_types=self.unique_types
-            )
+            team = self._get_random_team(pokemons, trials_rng)
             fit = self._evaluate(
-                team, opponents, type_multiplier_formula, damage_formula
+                team,
+                opponents,
+                type_multiplier_formula,
+                damage_formula,
+                opponents_weights,
             )
             history.append((team.copy(), fit))
 
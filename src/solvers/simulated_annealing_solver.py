@@ -14,10 +14,12 @@ from constants import (
     DEFAULT_SA_OPPONENTS_LIMIT,
     DEFAULT_PATIENCE,
     DEFAULT_RESTARTS,
+    DEFAULT_SURROGATE_FRACTION,
     TEAM_SIZE,
 )
 
 from classes import PokemonTeam
+from data import get_pokemon_pool
 from schemas import PokemonSchema
 from simulation import (
     TypeMultiplierFormula,
@@ -27,6 +29,8 @@ from simulation import (
     simulate_battle,
 )
 
+from .surrogate import SurrogateModel, SurrogateType
+
 
 @dataclass
 class SAHistoryEntry:
@@ -95,6 +99,16 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
         ge=0,
     )
 
+    surrogate: SurrogateType | None = Field(
+        default=None,
+    )
+
+    surrogate_fraction: float = Field(
+        default=DEFAULT_SURROGATE_FRACTION,
+        gt=0.0,
+        le=1.0,
+    )
+
     @model_validator(mode="after")
     def _check_params(self) -> "SimulatedAnnealingSolver":
         if self.Tmin >= self.T0:
@@ -115,6 +129,7 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
         opponents: list[PokemonTeam],
         type_multiplier_formula: TypeMultiplierFormula,
         damage_formula: DamageFormula,
+        opponents_weights: list[float] | None = None,
     ) -> float:
         # Mean remaining HP ratio vs opponents
         ratios = []
@@ -124,7 +139,9 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
                 team, opp, type_multiplier_formula, damage_formula
             )
             ratios.append(remaining / base_hp)
-        return float(np.mean(np.array(ratios, dtype=float)))
+        return float(
+            np.average(np.array(ratios, dtype=float), weights=opponents_weights)
+        )
 
     def _accept(self, rng: np.random.Generator, delta: float, T: float) -> bool:
         if delta >= 0:
@@ -133,20 +150,36 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
             return False
         return rng.random() < math.exp(delta / T)
 
-    def _random_team(self, pokemons: DataFrame[PokemonSchema]) -> PokemonTeam:
+    def _random_team(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        rng: np.random.Generator | None = None,
+    ) -> PokemonTeam:
         return PokemonTeam.generate_team(
-            pokemons, team_size=6, unique_types=self.unique_types
+            pokemons, team_size=6, unique_types=self.unique_types, rng=rng
         )
 
     def _generate_opponents(
-        self, pokemons: DataFrame[PokemonSchema]
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        rng: np.random.Generator | None = None,
     ) -> list[PokemonTeam]:
-        return PokemonTeam.generate_unique_teams(
+        if self.opponents_limit is None:
+            return PokemonTeam.generate_unique_teams(
+                pokemons,
+                None,
+                10000,
+                team_size=6,
+                unique_types=self.unique_types,
+                rng=rng,
+            )
+
+        return PokemonTeam.sample_unique_teams(
             pokemons,
             self.opponents_limit,
-            self.opponents_limit * 10 if self.opponents_limit is not None else 10000,
             team_size=6,
             unique_types=self.unique_types,
+            rng=rng,
         )
 
     def _fitness(
@@ -156,14 +189,51 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
         cache: dict[tuple[str, ...], float],
         type_multiplier_formula: TypeMultiplierFormula,
         damage_formula: DamageFormula,
+        opponents_weights: list[float] | None = None,
+        surrogate: SurrogateModel | None = None,
     ) -> float:
         sig = tuple(team.get_ids())
         if sig in cache:
             return cache[sig]
-        val = self._evaluate(team, opponents, type_multiplier_formula, damage_formula)
+        val = self._evaluate(
+            team, opponents, type_multiplier_formula, damage_formula, opponents_weights
+        )
         cache[sig] = val
+        if surrogate is not None:
+            surrogate.update(
+                team.get_positions(surrogate.pool)[None, :], np.array([val])
+            )
         return val
 
+    def _neighbor(
+        self,
+        current: PokemonTeam,
+        pokemons: DataFrame[PokemonSchema],
+        rng: np.random.Generator,
+        surrogate: SurrogateModel | None = None,
+    ) -> PokemonTeam:
+        # A ready surrogate picks the most promising of several neighbors,
+        # only that one is simulated.
+        candidates_amount = (
+            math.ceil(1 / self.surrogate_fraction)
+            if surrogate is not None and surrogate.is_ready()
+            else 1
+        )
+        candidates = [
+            current.generate_team_with_random_replacement(
+                pokemons,
+                replacements=self.neighbor_replacements,
+                unique_types=self.unique_types,
+                rng=rng,
+            )
+            for _ in range(candidates_amount)
+        ]
+        if surrogate is None or len(candidates) == 1:
+            return candidates[0]
+
+        positions = np.array([c.get_positions(surrogate.pool) for c in candidates])
+        return candidates[int(np.argmax(surrogate.predict(positions)))]
+
     def _run_once(
         self,
         pokemons: DataFrame[PokemonSchema],
@@ -176,12 +246,22 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
         type_multiplier_formula: TypeMultiplierFormula,
         damage_formula: DamageFormula,
         start_team: Optional[PokemonTeam] = None,
+        opponents_weights: list[float] | None = None,
+        surrogate: SurrogateModel | None = None,
     ) -> tuple[PokemonTeam, float, int, int]:
         current = (
-            start_team.copy() if start_team is not None else self._random_team(pokemons)
+            start_team.copy()
+            if start_team is not None
+            else self._random_team(pokemons, rng)
         )
         current_fit = self._fitness(
-            current, opponents, cache, type_multiplier_formula, damage_formula
+            current,
+            opponents,
+            cache,
+            type_multiplier_formula,
+            damage_formula,
+            opponents_weights,
+            surrogate,
         )
         evaluations += 1
 
@@ -196,13 +276,15 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
                 if evaluations >= self.max_evaluations:
                     break
 
-                candidate = current.generate_team_with_random_replacement(
-                    pokemons,
-                    replacements=self.neighbor_replacements,
-                    unique_types=self.unique_types,
-                )
+                candidate = self._neighbor(current, pokemons, rng, surrogate)
                 cand_fit = self._fitness(
-                    candidate, opponents, cache, type_multiplier_formula, damage_formula
+                    candidate,
+                    opponents,
+                    cache,
+                    type_multiplier_formula,
+                    damage_formula,
+                    opponents_weights,
+                    surrogate,
                 )
                 evaluations += 1
 
@@ -239,23 +321,40 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
         start_team: Optional[PokemonTeam] = None,
         type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
         damage_formula: DamageFormula = damage_attack_devide_defense,
+        opponents_weights: list[float] | None = None,
+        rng: np.random.Generator | None = None,
+        surrogate: SurrogateModel | None = None,
     ) -> tuple[PokemonTeam, float, list[SAHistoryEntry], list[PokemonTeam]]:
-        rng = np.random.default_rng(self.seed)
+        rng = np.random.default_rng(self.seed if rng is None else rng)
+        opponents_rng, start_rng, *runs_rngs = rng.spawn(self.restarts + 3)
 
         # If not opponents given, generate them
         opponents = (
-            opponents if opponents is not None else self._generate_opponents(pokemons)
+            opponents
+            if opponents is not None
+            else self._generate_opponents(pokemons, opponents_rng)
         )
 
+        if surrogate is None and self.surrogate is not None:
+            surrogate = SurrogateModel(get_pokemon_pool(pokemons), self.surrogate)
+
         cache: dict[tuple[str, ...], float] = {}
         history: list[SAHistoryEntry] = []
 
         # If not start_team given, best_team starts as random team
         best_team = (
-            start_team.copy() if start_team is not None else self._random_team(pokemons)
+            start_team.copy()
+            if start_team is not None
+            else self._random_team(pokemons, start_rng)
         )
         best_fit = self._fitness(
-            best_team, opponents, cache, type_multiplier_formula, damage_formula
+            best_team,
+            opponents,
+            cache,
+            type_multiplier_formula,
+            damage_formula,
+            opponents_weights,
+            surrogate,
         )
         evaluations = 1
         step = 0
@@ -270,7 +369,7 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
             team_r, fit_r, evaluations, step = self._run_once(
                 pokemons,
                 opponents,
-                rng,
+                runs_rngs[run_idx],
                 cache,
                 history,
                 evaluations,
@@ -278,6 +377,8 @@ class SimulatedAnnealingPokemonSolver(BaseModel):
                 type_multiplier_formula,
                 damage_formula,
                 start_team=run_start,
+                opponents_weights=opponents_weights,
+                surrogate=surrogate,
             )
 
             if fit_r > best_fit:
@@ -0,0 +1,243 @@
+from typing import Literal, Protocol
+
+import numpy as np
+
+from constants import (
+    DEFAULT_SURROGATE_CORRELATION_WINDOW,
+    DEFAULT_SURROGATE_MAX_SAMPLES,
+    DEFAULT_SURROGATE_MIN_SAMPLES,
+    DEFAULT_SURROGATE_NEIGHBORS,
+    DEFAULT_SURROGATE_RIDGE_ALPHA,
+    SAMPLING_CHUNK_SIZE,
+)
+from data import PokemonPool
+
+type SurrogateType = Literal["ridge", "knn"]
+
+
+def get_features_amount(pool: PokemonPool) -> int:
+    return 8 + 2 * int(pool.against.shape[1])
+
+
+def get_team_features(pool: PokemonPool, teams: np.ndarray) -> np.ndarray:
+    teams = np.asarray(teams, dtype=np.intp)
+    offense = pool.attack + pool.sp_attack
+    defense = pool.defense + pool.sp_defense
+    stats = np.stack(
+        [pool.hp, offense, defense, offense + defense], axis=1, dtype=float
+    )
+
+    features = np.empty((len(teams), get_features_amount(pool)))
+
+    for start in range(0, len(teams), SAMPLING_CHUNK_SIZE):
+        chunk = teams[start : start + SAMPLING_CHUNK_SIZE]
+        against = pool.against[chunk]
+        speeds = pool.speed[chunk].astype(float)
+
+        # The lead's speed decides who attacks first, so it is kept apart
+        # from the speed profile of the whole team.
+        features[start : start + len(chunk)] = np.concatenate(
+            [
+                stats[chunk].sum(axis=1),
+                against.mean(axis=1),
+                against.max(axis=1),
+                speeds[:, :1],
+                speeds.mean(axis=1, keepdims=True),
+                speeds.min(axis=1, keepdims=True),
+                speeds.max(axis=1, keepdims=True),
+            ],
+            axis=1,
+        )
+
+    return features
+
+
+def get_average_ranks(values: np.ndarray) -> np.ndarray:
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    starts = np.cumsum(counts) - counts
+    return (starts + (counts - 1) / 2)[inverse.ravel()]
+
+
+def get_rank_correlation(first: np.ndarray, second: np.ndarray) -> float:
+    if len(first) < 2:
+        return float("nan")
+
+    first_ranks = get_average_ranks(np.asarray(first))
+    second_ranks = get_average_ranks(np.asarray(second))
+
+    if first_ranks.std() == 0 or second_ranks.std() == 0:
+        return float("nan")
+
+    return float(np.corrcoef(first_ranks, second_ranks)[0, 1])
+
+
+class FeatureStatistics:
+    def __init__(self, features_amount: int) -> None:
+        self.samples = 0
+        self.sums = np.zeros(features_amount)
+        self.squared_sums = np.zeros(features_amount)
+
+    def update(self, features: np.ndarray) -> None:
+        self.samples += len(features)
+        self.sums += features.sum(axis=0)
+        self.squared_sums += (features**2).sum(axis=0)
+
+    def get_means(self) -> np.ndarray:
+        return self.sums / max(self.samples, 1)
+
+    def get_scales(self) -> np.ndarray:
+        means = self.get_means()
+        variances = self.squared_sums / max(self.samples, 1) - means**2
+        scales = np.sqrt(np.maximum(variances, 0))
+        return np.where(scales > 0, scales, 1.0)
+
+
+class Regressor(Protocol):
+    def update(self, features: np.ndarray, targets: np.ndarray) -> None: ...
+
+    def predict(self, features: np.ndarray) -> np.ndarray: ...
+
+
+class RidgeRegressor:
+    def __init__(
+        self, features_amount: int, alpha: float = DEFAULT_SURROGATE_RIDGE_ALPHA
+    ) -> None:
+        self.alpha = alpha
+        self.statistics = FeatureStatistics(features_amount)
+        self.cross_products = np.zeros((features_amount, features_amount))
+        self.target_products = np.zeros(features_amount)
+        self.target_sum = 0.0
+        self.weights = np.zeros(features_amount)
+
+    def update(self, features: np.ndarray, targets: np.ndarray) -> None:
+        # Only sums are kept, so an update costs the same however many teams
+        # were seen before, and the fit is exactly the batch ridge solution.
+        self.statistics.update(features)
+        self.cross_products += features.T @ features
+        self.target_products += features.T @ targets
+        self.target_sum += float(targets.sum())
+
+        samples = self.statistics.samples
+        means = self.statistics.get_means()
+        scales = self.statistics.get_scales()
+        covariance = self.cross_products / samples - np.outer(means, means)
+        target_covariance = (
+            self.target_products / samples - means * self.target_sum / samples
+        )
+
+        standardized = covariance / np.outer(scales, scales)
+        standardized[np.diag_indices_from(standardized)] += self.alpha / samples
+        self.weights = np.linalg.solve(standardized, target_covariance / scales)
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        samples = max(self.statistics.samples, 1)
+        standardized = (
+            features - self.statistics.get_means()
+        ) / self.statistics.get_scales()
+        return np.asarray(
+            self.target_sum / samples + standardized @ self.weights, dtype=float
+        )
+
+
+class NearestNeighborsRegressor:
+    def __init__(
+        self,
+        features_amount: int,
+        neighbors: int = DEFAULT_SURROGATE_NEIGHBORS,
+        max_samples: int = DEFAULT_SURROGATE_MAX_SAMPLES,
+    ) -> None:
+        self.neighbors = neighbors
+        self.max_samples = max_samples
+        self.statistics = FeatureStatistics(features_amount)
+        self.features = np.empty((0, features_amount))
+        self.targets = np.empty(0)
+
+    def update(self, features: np.ndarray, targets: np.ndarray) -> None:
+        self.statistics.update(features)
+        self.features = np.concatenate([self.features, features])[-self.max_samples :]
+        self.targets = np.concatenate([self.targets, targets])[-self.max_samples :]
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        means = self.statistics.get_means()
+        scales = self.statistics.get_scales()
+        stored = (self.features - means) / scales
+        stored_norms = (stored**2).sum(axis=1)
+        neighbors = min(self.neighbors, len(stored))
+        predictions = np.empty(len(features))
+
+        for start in range(0, len(features), SAMPLING_CHUNK_SIZE):
+            queries = (features[start : start + SAMPLING_CHUNK_SIZE] - means) / scales
+            distances = stored_norms[None, :] - 2 * queries @ stored.T
+            nearest = np.argpartition(distances, neighbors - 1, axis=1)[:, :neighbors]
+            predictions[start : start + len(queries)] = self.targets[nearest].mean(
+                axis=1
+            )
+
+        return predictions
+
+
+class SurrogateModel:
+    def __init__(
+        self,
+        pool: PokemonPool,
+        surrogate_type: SurrogateType = "ridge",
+        min_samples: int = DEFAULT_SURROGATE_MIN_SAMPLES,
+        correlation_window: int = DEFAULT_SURROGATE_CORRELATION_WINDOW,
+        ridge_alpha: float = DEFAULT_SURROGATE_RIDGE_ALPHA,
+        neighbors: int = DEFAULT_SURROGATE_NEIGHBORS,
+        max_samples: int = DEFAULT_SURROGATE_MAX_SAMPLES,
+    ) -> None:
+        if min_samples <= 0:
+            raise ValueError("min_samples must be positive.")
+
+        self.pool = pool
+        self.min_samples = min_samples
+        self.correlation_window = correlation_window
+
+        features_amount = get_features_amount(pool)
+        if surrogate_type == "ridge":
+            self.regressor: Regressor = RidgeRegressor(features_amount, ridge_alpha)
+        elif surrogate_type == "knn":
+            self.regressor = NearestNeighborsRegressor(
+                features_amount, neighbors, max_samples
+            )
+        else:
+            raise ValueError(f"Unknown surrogate type: {surrogate_type}")
+
+        self.samples = 0
+        self.predictions = np.empty(0)
+        self.fitnesses = np.empty(0)
+
+    def is_ready(self) -> bool:
+        return self.samples >= self.min_samples
+
+    def predict(self, teams: np.ndarray) -> np.ndarray:
+        return self.regressor.predict(get_team_features(self.pool, teams))
+
+    def screen(self, teams: np.ndarray, amount: int) -> np.ndarray:
+        if amount <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        if not self.is_ready() or amount >= len(teams):
+            return np.arange(min(amount, len(teams)))
+
+        predicted = self.predict(teams)
+        return np.sort(np.argpartition(-predicted, amount - 1)[:amount])
+
+    def update(self, teams: np.ndarray, fitnesses: np.ndarray) -> None:
+        features = get_team_features(self.pool, teams)
+        fitnesses = np.asarray(fitnesses, dtype=float)
+
+        # Predictions are taken before the model sees the new fitnesses, so the
+        # rank correlation measures how well it screens teams it never saw.
+        if self.is_ready():
+            window = self.correlation_window
+            predicted = self.regressor.predict(features)
+            self.predictions = np.concatenate([self.predictions, predicted])[-window:]
+            self.fitnesses = np.concatenate([self.fitnesses, fitnesses])[-window:]
+
+        self.regressor.update(features, fitnesses)
+        self.samples += len(fitnesses)
+
+    def get_rank_correlation(self) -> float:
+        return get_rank_correlation(self.predictions, self.fitnesses)
@@ -0,0 +1,271 @@
+from collections import deque
+
+import numpy as np
+from pandera.typing import DataFrame
+from pydantic import BaseModel, ConfigDict, Field
+
+from classes import PokemonTeam, apply_replacement_moves, sample_replacement_moves
+from constants import (
+    DEFAULT_TABU_MAX_EVALUATIONS,
+    DEFAULT_TABU_NEIGHBOURS_PER_STEP,
+    DEFAULT_TABU_OPPONENTS_LIMIT,
+    DEFAULT_TABU_PATIENCE,
+    DEFAULT_TABU_RESTARTS,
+    DEFAULT_TABU_TENURE,
+    TEAM_SIZE,
+)
+from data import PokemonPool, get_pokemon_pool, get_team_keys
+from schemas import PokemonSchema
+from simulation import (
+    DamageFormula,
+    DamageLookup,
+    SortedIndex,
+    TypeMultiplierFormula,
+    damage_attack_devide_defense,
+    evaluate_teams,
+    get_damage_table,
+    multiply_type_multiplier,
+)
+
+type TabuMove = tuple[int, int, int]
+
+
+class TabuMemory:
+    def __init__(self, tenure: int) -> None:
+        self.tenure = tenure
+        self.expirations: dict[TabuMove, int] = {}
+        self.order: deque[tuple[int, TabuMove]] = deque()
+
+    def is_tabu(self, move: TabuMove, iteration: int) -> bool:
+        return self.expirations.get(move, -1) > iteration
+
+    def add(self, move: TabuMove, iteration: int) -> None:
+        expiration = iteration + self.tenure
+        self.expirations[move] = expiration
+        self.order.append((expiration, move))
+
+        while self.order and self.order[0][0] <= iteration:
+            old_expiration, old_move = self.order.popleft()
+
+            if self.expirations.get(old_move) == old_expiration:
+                del self.expirations[old_move]
+
+
+class TabuSearchPokemonSolver(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    max_evaluations: int = Field(default=DEFAULT_TABU_MAX_EVALUATIONS, gt=0)
+    neighbors_per_step: int = Field(default=DEFAULT_TABU_NEIGHBOURS_PER_STEP, gt=0)
+    tabu_tenure: int = Field(default=DEFAULT_TABU_TENURE, gt=0)
+
+    opponents_limit: int | None = Field(default=DEFAULT_TABU_OPPONENTS_LIMIT, gt=0)
+    unique_types: bool = Field(default=True)
+    seed: int | None = Field(default=None)
+
+    restarts: int = Field(default=DEFAULT_TABU_RESTARTS, ge=0)
+    patience: int | None = Field(default=DEFAULT_TABU_PATIENCE, gt=0)
+
+    def _evaluate_batch(
+        self,
+        pool: PokemonPool,
+        damage: DamageLookup,
+        teams: np.ndarray,
+        opponents: np.ndarray,
+        cache: SortedIndex,
+        opponents_weights: list[float] | None = None,
+    ) -> tuple[np.ndarray, int]:
+        keys = get_team_keys(teams, pool.get_size())
+        _, found = cache.get(keys)
+        missing = np.flatnonzero(~found)
+
+        if missing.size > 0:
+            _, first_indexes = np.unique(keys[missing], return_index=True)
+            missing = missing[first_indexes]
+            cache.add(
+                keys[missing],
+                evaluate_teams(
+                    pool, damage, teams[missing], opponents, opponents_weights
+                ),
+            )
+
+        fitnesses, _ = cache.get(keys)
+        return fitnesses, len(missing)
+
+    def _get_opponents(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        opponents: list[PokemonTeam] | None,
+        rng: np.random.Generator | None = None,
+    ) -> list[PokemonTeam]:
+        if opponents is not None:
+            return opponents
+        if self.opponents_limit is None:
+            raise ValueError("If opponents is None, opponents_limit must be provided.")
+        return PokemonTeam.sample_unique_teams(
+            pokemons,
+            teams_amount=self.opponents_limit,
+            team_size=TEAM_SIZE,
+            unique_types=self.unique_types,
+            rng=rng,
+        )
+
+    def _random_team(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        pool: PokemonPool,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray:
+        team = PokemonTeam.generate_team(
+            pokemons, team_size=TEAM_SIZE, unique_types=self.unique_types, rng=rng
+        )
+        return team.get_positions(pool)
+
+    def solve(
+        self,
+        pokemons: DataFrame[PokemonSchema],
+        opponents: list[PokemonTeam] | None = None,
+        start_team: PokemonTeam | None = None,
+        type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+        damage_formula: DamageFormula = damage_attack_devide_defense,
+        opponents_weights: list[float] | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> tuple[PokemonTeam, float, list[tuple[PokemonTeam, float]], list[PokemonTeam]]:
+        rng = np.random.default_rng(self.seed if rng is None else rng)
+        opponents_rng, *runs_rngs = rng.spawn(self.restarts + 2)
+        opponents = self._get_opponents(pokemons, opponents, opponents_rng)
+
+        pool = get_pokemon_pool(pokemons)
+        damage = get_damage_table(pool, type_multiplier_formula, damage_formula)
+        opponents_positions = np.array([opp.get_positions(pool) for opp in opponents])
+        cache = SortedIndex(dtype=float)
+        history: list[tuple[PokemonTeam, float]] = []
+
+        best_team: np.ndarray | None = None
+        best_fit = float("-inf")
+        evaluations = 0
+
+        for run_idx in range(self.restarts + 1):
+            if evaluations >= self.max_evaluations:
+                break
+
+            run_rng = runs_rngs[run_idx]
+
+            if run_idx == 0 and start_team is not None:
+                current = start_team.get_positions(pool)
+            else:
+                current = self._random_team(pokemons, pool, run_rng)
+
+            current_fits, used = self._evaluate_batch(
+                pool,
+                damage,
+                current[None, :],
+                opponents_positions,
+                cache,
+                opponents_weights,
+            )
+            current_fit = float(current_fits[0])
+            evaluations += used
+
+            if current_fit > best_fit:
+                best_fit = current_fit
+                best_team = current.copy()
+
+            tabu = TabuMemory(self.tabu_tenure)
+            iteration = 0
+            no_improve = 0
+
+            # Cached neighbors cost no evaluations, so iterations are capped too.
+            while (
+                evaluations < self.max_evaluations and iteration < self.max_evaluations
+            ):
+                iteration += 1
+
+                slots, candidates = sample_replacement_moves(
+                    pool,
+                    current,
+                    min(self.neighbors_per_step, self.max_evaluations - evaluations),
+                    self.unique_types,
+                    run_rng,
+                )
+
+                if len(slots) == 0:
+                    break
+
+                neighbors = apply_replacement_moves(current, slots, candidates)
+
+                fits, used = self._evaluate_batch(
+                    pool,
+                    damage,
+                    neighbors,
+                    opponents_positions,
+                    cache,
+                    opponents_weights,
+                )
+                evaluations += used
+
+                # Aspiration: a tabu move is still allowed when it beats the best.
+                admissible = np.array(
+                    [
+                        not tabu.is_tabu(
+                            (int(slot), int(candidate), int(current[slot])),
+                            iteration,
+                        )
+                        or fit > best_fit
+                        for slot, candidate, fit in zip(
+                            slots, candidates, fits, strict=True
+                        )
+                    ],
+                    dtype=bool,
+                )
+
+                if not admissible.any():
+                    history.append(
+                        (PokemonTeam.from_positions(pokemons, current), current_fit)
+                    )
+                    no_improve += 1
+                    if self.patience is None or no_improve >= self.patience:
+                        break
+                    continue
+
+                best_move = int(np.flatnonzero(admissible)[fits[admissible].argmax()])
+                slot = int(slots[best_move])
+                removed = int(current[slot])
+
+                current = neighbors[best_move]
+                current_fit = float(fits[best_move])
+
+                # Putting the removed pokemon back into the same slot is tabu.
+                tabu.add((slot, removed, int(current[slot])), iteration)
+
+                # History records the state each step ends in.
+                history.append(
+                    (PokemonTeam.from_positions(pokemons, current), current_fit)
+                )
+
+                if current_fit > best_fit:
+                    best_fit = current_fit
+                    best_team = current.copy()
+                    no_improve = 0
+                else:
+                    no_improve += 1
+                    if self.patience is None or no_improve >= self.patience:
+                        break
+
+        if best_team is None:
+            best_team = self._random_team(pokemons, pool, runs_rngs[-1])
+            best_fit = float(
+                evaluate_teams(
+                    pool,
+                    damage,
+                    best_team[None, :],
+                    opponents_positions,
+                    opponents_weights,
+                )[0]
+            )
+
+        return (
+            PokemonTeam.from_positions(pokemons, best_team),
+            best_fit,
+            history,
+            opponents,
+        )
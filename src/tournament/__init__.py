@@ -0,0 +1,41 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .ratings import get_bradley_terry_strengths, get_elo_ratings, get_pairwise_results
+from .round_robin import OutcomeStore, compute_outcome_matrix
+
+if TYPE_CHECKING:
+    from .tournament import (
+        TournamentResult,
+        get_win_rate_table,
+        rank_outcomes,
+        run_tournament,
+    )
+
+_LAZY_IMPORTS = {
+    "TournamentResult": ".tournament",
+    "get_win_rate_table": ".tournament",
+    "rank_outcomes": ".tournament",
+    "run_tournament": ".tournament",
+}
+
+__all__ = [
+    "OutcomeStore",
+    "TournamentResult",
+    "compute_outcome_matrix",
+    "get_bradley_terry_strengths",
+    "get_elo_ratings",
+    "get_pairwise_results",
+    "get_win_rate_table",
+    "rank_outcomes",
+    "run_tournament",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
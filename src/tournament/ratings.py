@@ -0,0 +1,57 @@
+import numpy as np
+
+from constants import (
+    DEFAULT_BRADLEY_TERRY_ITERATIONS,
+    DEFAULT_BRADLEY_TERRY_PRIOR,
+    DEFAULT_BRADLEY_TERRY_TOLERANCE,
+    ELO_BASE_RATING,
+    ELO_SCALE,
+)
+
+
+def get_pairwise_results(outcomes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # A battle is won by the current team when it keeps any hp, and by the
+    # opponent otherwise, so every pair plays twice, once on each side.
+    played = ~np.isnan(outcomes)
+    np.fill_diagonal(played, False)
+
+    wins = (played & (outcomes > 0)).astype(float)
+    wins += (played & (outcomes == 0)).T
+    games = played.astype(float) + played.T
+
+    return wins, games
+
+
+def get_bradley_terry_strengths(
+    wins: np.ndarray,
+    games: np.ndarray,
+    prior: float = DEFAULT_BRADLEY_TERRY_PRIOR,
+    iterations: int = DEFAULT_BRADLEY_TERRY_ITERATIONS,
+    tolerance: float = DEFAULT_BRADLEY_TERRY_TOLERANCE,
+) -> np.ndarray:
+    # Every pair gets a few virtual games split evenly, so teams that never
+    # win or never lose still get finite strengths.
+    off_diagonal = ~np.eye(len(wins), dtype=bool)
+    wins = wins + prior * off_diagonal
+    games = games + 2 * prior * off_diagonal
+    total_wins = wins.sum(axis=1)
+
+    strengths = np.ones(len(wins), dtype=float)
+
+    # Minorization-maximization updates of Hunter (2004).
+    for _ in range(iterations):
+        pair_sums = strengths[:, None] + strengths[None, :]
+        updated = total_wins / (games / pair_sums).sum(axis=1)
+        updated /= np.exp(np.log(updated).mean())
+
+        converged = np.abs(updated - strengths).max() < tolerance
+        strengths = updated
+
+        if converged:
+            break
+
+    return strengths
+
+
+def get_elo_ratings(strengths: np.ndarray) -> np.ndarray:
+    return np.asarray(ELO_BASE_RATING + ELO_SCALE * np.log10(strengths), dtype=float)
@@ -0,0 +1,203 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from constants import (
+    DEFAULT_TOURNAMENT_BLOCK_SIZE,
+    DEFAULT_TOURNAMENT_WORKERS,
+    MAX_STEPS_PER_BATTLE,
+)
+from data.pool import PokemonPool
+from data.shared_pool import SharedArrays, SharedArraysHandle, share_pokemon_pool
+from simulation import DamageLookup, DamageMatrix, get_remaining_hp_ratio_matrix
+
+OUTCOMES_FILE = "outcomes.npy"
+COMPLETED_BLOCKS_FILE = "completed_blocks.npy"
+TEAMS_FILE = "teams.npy"
+DAMAGE_ARRAY = "damage"
+
+type Block = tuple[int, int]
+
+
+@dataclass(frozen=True, eq=False)
+class BlockContext:
+    pool: PokemonPool
+    damage: DamageLookup
+    teams: np.ndarray
+    block_size: int
+    max_steps: int
+
+    def simulate(self, block: Block) -> np.ndarray:
+        rows, columns = (
+            slice(index * self.block_size, (index + 1) * self.block_size)
+            for index in block
+        )
+        return get_remaining_hp_ratio_matrix(
+            self.pool,
+            self.damage,
+            self.teams[rows],
+            self.teams[columns],
+            self.max_steps,
+        )
+
+
+_context: BlockContext | None = None
+_shared: SharedArrays | None = None
+
+
+def _init_worker(
+    handle: SharedArraysHandle,
+    damage: DamageLookup | None,
+    teams: np.ndarray,
+    block_size: int,
+    max_steps: int,
+) -> None:
+    global _context, _shared
+
+    # The pool and a dense damage matrix are read from shared memory in place,
+    # so starting a worker copies nothing but the team encodings. A damage
+    # table is sent as its configuration and fills its own cache.
+    _shared = SharedArrays.attach(handle)
+    _context = BlockContext(
+        _shared.get_pool(),
+        damage or DamageMatrix(_shared.get_arrays()[DAMAGE_ARRAY]),
+        teams,
+        block_size,
+        max_steps,
+    )
+
+
+def _simulate_block(block: Block) -> tuple[Block, np.ndarray]:
+    if _context is None:
+        raise RuntimeError("Worker was not initialized with a block context.")
+
+    return block, _context.simulate(block)
+
+
+class OutcomeStore:
+    def __init__(
+        self, teams: np.ndarray, block_size: int, directory: Path | None = None
+    ) -> None:
+        blocks = -(-len(teams) // block_size)
+        blocks_shape = (blocks, blocks)
+        self.block_size = block_size
+        self.directory = directory
+
+        if directory is None:
+            self.outcomes = np.full((len(teams), len(teams)), np.nan)
+            self.completed = np.zeros(blocks_shape, dtype=bool)
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+        outcomes_path = directory / OUTCOMES_FILE
+
+        if outcomes_path.exists():
+            stored_teams = np.load(directory / TEAMS_FILE)
+            self.completed = np.load(directory / COMPLETED_BLOCKS_FILE)
+
+            if (
+                not np.array_equal(stored_teams, teams)
+                or self.completed.shape != blocks_shape
+            ):
+                raise ValueError(
+                    f"{directory} holds a tournament of different teams "
+                    "or a different block size."
+                )
+
+            self.outcomes = np.load(outcomes_path, mmap_mode="r+")
+            return
+
+        np.save(directory / TEAMS_FILE, teams)
+        self.outcomes = np.lib.format.open_memmap(
+            outcomes_path, mode="w+", dtype=float, shape=(len(teams), len(teams))
+        )
+        self.outcomes[:] = np.nan
+        self.completed = np.zeros(blocks_shape, dtype=bool)
+        self._save_completed()
+
+    def get_pending_blocks(self) -> list[Block]:
+        rows, columns = np.nonzero(~self.completed)
+        return [
+            (int(row), int(column)) for row, column in zip(rows, columns, strict=True)
+        ]
+
+    def write(self, block: Block, ratios: np.ndarray) -> None:
+        row, column = block
+        self.outcomes[
+            row * self.block_size : row * self.block_size + ratios.shape[0],
+            column * self.block_size : column * self.block_size + ratios.shape[1],
+        ] = ratios
+        self.completed[block] = True
+
+        if self.directory is not None:
+            # Outcomes reach the disk before the block is marked as done, so an
+            # interrupted run never trusts a block that was not written.
+            assert isinstance(self.outcomes, np.memmap)
+            self.outcomes.flush()
+            self._save_completed()
+
+    def _save_completed(self) -> None:
+        assert self.directory is not None
+        temporary_path = self.directory / f"{COMPLETED_BLOCKS_FILE}.tmp.npy"
+        np.save(temporary_path, self.completed)
+        os.replace(temporary_path, self.directory / COMPLETED_BLOCKS_FILE)
+
+
+def compute_outcome_matrix(
+    pool: PokemonPool,
+    damage: DamageLookup,
+    teams: np.ndarray,
+    block_size: int = DEFAULT_TOURNAMENT_BLOCK_SIZE,
+    workers: int = DEFAULT_TOURNAMENT_WORKERS,
+    directory: Path | None = None,
+    max_steps: int = MAX_STEPS_PER_BATTLE,
+) -> np.ndarray:
+    if block_size <= 0:
+        raise ValueError("block_size must be positive.")
+
+    if workers <= 0:
+        raise ValueError("workers must be positive.")
+
+    teams = np.asarray(teams, dtype=np.intp)
+    store = OutcomeStore(teams, block_size, directory)
+    pending = store.get_pending_blocks()
+
+    if workers == 1:
+        context = BlockContext(pool, damage, teams, block_size, max_steps)
+        for block in pending:
+            store.write(block, context.simulate(block))
+
+        return np.asarray(store.outcomes)
+
+    if isinstance(damage, DamageMatrix):
+        shared_arrays, worker_damage = {DAMAGE_ARRAY: damage.values}, None
+    else:
+        shared_arrays, worker_damage = {}, damage
+
+    with (
+        share_pokemon_pool(pool, **shared_arrays) as shared,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared.handle, worker_damage, teams, block_size, max_steps),
+        ) as executor,
+    ):
+        # Only a few blocks per worker are queued at a time, so finished blocks
+        # are written to disk while the rest are still being simulated.
+        running: set[Future[tuple[Block, np.ndarray]]] = set()
+
+        for block in pending:
+            running.add(executor.submit(_simulate_block, block))
+
+            if len(running) >= 2 * workers:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    store.write(*future.result())
+
+        for future in wait(running).done:
+            store.write(*future.result())
+
+    return np.asarray(store.outcomes)
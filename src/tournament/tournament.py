@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandera.typing import DataFrame
+
+from classes import PokemonTeam
+from constants import DEFAULT_TOURNAMENT_BLOCK_SIZE, DEFAULT_TOURNAMENT_WORKERS
+from data import get_pokemon_pool
+from schemas import PokemonSchema
+from simulation import (
+    DamageFormula,
+    TypeMultiplierFormula,
+    damage_attack_devide_defense,
+    get_damage_table,
+    multiply_type_multiplier,
+)
+
+from .ratings import get_bradley_terry_strengths, get_elo_ratings, get_pairwise_results
+from .round_robin import compute_outcome_matrix
+
+
+@dataclass
+class TournamentResult:
+    outcomes: np.ndarray
+    wins: np.ndarray
+    games: np.ndarray
+    win_rates: np.ndarray
+    mean_hp_ratios: np.ndarray
+    strengths: np.ndarray
+    elo_ratings: np.ndarray
+
+
+def rank_outcomes(outcomes: np.ndarray) -> TournamentResult:
+    wins, games = get_pairwise_results(outcomes)
+    team_wins, team_games = wins.sum(axis=1), games.sum(axis=1)
+    strengths = get_bradley_terry_strengths(wins, games)
+
+    hp_ratios = np.array(outcomes, dtype=float)
+    np.fill_diagonal(hp_ratios, np.nan)
+    played = (~np.isnan(hp_ratios)).sum(axis=1)
+
+    return TournamentResult(
+        outcomes=outcomes,
+        wins=team_wins,
+        games=team_games,
+        win_rates=np.divide(
+            team_wins, team_games, out=np.zeros(len(wins)), where=team_games > 0
+        ),
+        mean_hp_ratios=np.divide(
+            np.nansum(hp_ratios, axis=1),
+            played,
+            out=np.zeros(len(wins)),
+            where=played > 0,
+        ),
+        strengths=strengths,
+        elo_ratings=get_elo_ratings(strengths),
+    )
+
+
+def run_tournament(
+    pokemons: DataFrame[PokemonSchema],
+    teams: list[PokemonTeam],
+    type_multiplier_formula: TypeMultiplierFormula = multiply_type_multiplier,
+    damage_formula: DamageFormula = damage_attack_devide_defense,
+    block_size: int = DEFAULT_TOURNAMENT_BLOCK_SIZE,
+    workers: int = DEFAULT_TOURNAMENT_WORKERS,
+    directory: Path | None = None,
+) -> TournamentResult:
+    pool = get_pokemon_pool(pokemons)
+    damage = get_damage_table(pool, type_multiplier_formula, damage_formula)
+    positions = np.array([team.get_positions(pool) for team in teams])
+
+    outcomes = compute_outcome_matrix(
+        pool, damage, positions, block_size, workers, directory
+    )
+    return rank_outcomes(outcomes)
+
+
+def get_win_rate_table(
+    result: TournamentResult, teams: list[PokemonTeam]
+) -> pd.DataFrame:
+    table = pd.DataFrame(
+        {
+            "team_idx": np.arange(len(teams)),
+            "team": [repr(team) for team in teams],
+            "wins": result.wins,
+            "games": result.games,
+            "win_rate": result.win_rates,
+            "mean_hp_ratio": result.mean_hp_ratios,
+            "bradley_terry": result.strengths,
+            "elo": result.elo_ratings,
+        }
+    )
+    return table.sort_values("elo", ascending=False).reset_index(drop=True)
@@ -0,0 +1,122 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from constants import DEFAULT_HISTORY_BINS, DEFAULT_HISTORY_QUANTILES
+
+type Generation = Sequence[tuple[Any, float]] | np.ndarray
+
+
+@dataclass(frozen=True)
+class HistorySummary:
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+    quantiles: np.ndarray
+    quantile_values: np.ndarray
+    density: np.ndarray
+    bin_edges: np.ndarray
+
+    def get_generations(self) -> np.ndarray:
+        return np.arange(1, len(self.mean) + 1)
+
+
+def get_generation_fitnesses(generation: Generation) -> np.ndarray:
+    if isinstance(generation, np.ndarray):
+        return generation.astype(float, copy=False)
+
+    return np.fromiter(
+        (fitness for _, fitness in generation), dtype=float, count=len(generation)
+    )
+
+
+def summarize_history(
+    history: Iterable[Generation],
+    quantiles: tuple[float, ...] = DEFAULT_HISTORY_QUANTILES,
+    bins: int = DEFAULT_HISTORY_BINS,
+    value_range: tuple[float, float] = (0.0, 1.0),
+) -> HistorySummary:
+    bin_edges = np.linspace(*value_range, bins + 1)
+    rows: list[np.ndarray] = []
+    densities: list[np.ndarray] = []
+
+    # Generations are reduced one at a time, so the history is never held
+    # as a single array of every fitness.
+    for generation in history:
+        fitnesses = get_generation_fitnesses(generation)
+        rows.append(
+            np.concatenate(
+                [
+                    [fitnesses.min(), fitnesses.max(), fitnesses.mean()],
+                    np.quantile(fitnesses, quantiles),
+                ]
+            )
+        )
+        counts, _ = np.histogram(np.clip(fitnesses, *value_range), bin_edges)
+        densities.append(counts / len(fitnesses))
+
+    summary = np.array(rows).reshape(-1, 3 + len(quantiles))
+    return HistorySummary(
+        minimum=summary[:, 0],
+        maximum=summary[:, 1],
+        mean=summary[:, 2],
+        quantiles=np.array(quantiles),
+        quantile_values=summary[:, 3:],
+        density=np.array(densities).reshape(-1, bins),
+        bin_edges=bin_edges,
+    )
+
+
+def visualize_history_summary(
+    summary: HistorySummary,
+    title: str = "Evolutionary Algorithm Fitness over Generations",
+    show_density: bool = True,
+) -> plt.Figure:
+    generations = summary.get_generations()
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # The whole plot is a few artists, however large the population is.
+    if show_density and len(generations) > 0:
+        ax.pcolormesh(
+            np.arange(0.5, len(generations) + 1),
+            summary.bin_edges,
+            summary.density.T,
+            cmap="Blues",
+            shading="flat",
+        )
+
+    bands = len(summary.quantiles) // 2
+    for band in range(bands):
+        lower, upper = summary.quantiles[band], summary.quantiles[-band - 1]
+        ax.fill_between(
+            generations,
+            summary.quantile_values[:, band],
+            summary.quantile_values[:, -band - 1],
+            color="tab:orange",
+            alpha=0.2,
+            label=f"{lower:.0%}-{upper:.0%}",
+        )
+
+    if len(summary.quantiles) % 2 == 1:
+        ax.plot(
+            generations,
+            summary.quantile_values[:, bands],
+            color="tab:orange",
+            label=f"{summary.quantiles[bands]:.0%}",
+        )
+
+    ax.plot(generations, summary.mean, color="tab:red", label="mean")
+    ax.plot(generations, summary.maximum, "k--", linewidth=1, label="max")
+    ax.plot(generations, summary.minimum, "k:", linewidth=1, label="min")
+
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Fitness")
+    ax.set_title(title)
+    ax.set_ylim(*summary.bin_edges[[0, -1]])
+    ax.legend(loc="lower right")
+    fig.tight_layout()
+
+    return fig
@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
 from classes import PokemonTeam
+from data import PokemonPool
 from constants import ATTACK, DEFENSE, HP, SPECIAL_ATTACK, SPECIAL_DEFENSE
 from visualization.utils import (
     get_typing_distribution,
@@ -11,9 +13,11 @@ from visualization.utils import (
 
 
 def visualize_opponents_typing_distribution(
-    opponents: list[PokemonTeam], sorted=False
+    opponents: list[PokemonTeam] | np.ndarray,
+    sorted=False,
+    pool: PokemonPool | None = None,
 ) -> plt.figure:
-    typings_count = get_typing_distribution(opponents)
+    typings_count = get_typing_distribution(opponents, pool)
 
     if sorted:
         typings_count = sort_typing_distribution(typings_count)
@@ -34,8 +38,12 @@ def visualize_opponents_typing_distribution(
     return fig
 
 
-def visualize_opponents_stat_sums_violin(opponents: list[PokemonTeam], figsize=None) -> plt.figure:
-    stats_df = get_opponents_statistics_df(opponents)
+def visualize_opponents_stat_sums_violin(
+    opponents: list[PokemonTeam] | np.ndarray,
+    figsize=None,
+    pool: PokemonPool | None = None,
+) -> plt.figure:
+    stats_df = get_opponents_statistics_df(opponents, pool)
 
     stat_cols = [HP, ATTACK, SPECIAL_ATTACK, DEFENSE, SPECIAL_DEFENSE]
 
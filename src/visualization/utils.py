@@ -1,26 +1,75 @@
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+import pandas as pd
+from pandera.typing import DataFrame
+
+from classes import PokemonTeam
 from constants import (
     ATTACK,
     DEFENSE,
     HP,
+    NO_TYPE_LABEL,
     SPECIAL_ATTACK,
     SPECIAL_DEFENSE,
     STATS_COLS,
     STATS_SUM,
+    TYPES,
 )
-from classes import PokemonTeam
-import pandas as pd
+from data import PokemonPool, get_pokemon_pool
+from data.pool import NO_TYPE
+from schemas import PokemonSchema
+
+if TYPE_CHECKING:
+    from results import ResultsStore
+
+
+def get_opponents_positions(
+    opponents: list[PokemonTeam],
+) -> tuple[PokemonPool, np.ndarray]:
+    # Members of all teams are gathered into one pool, so the teams become
+    # rows of positions into it and everything else is a single gather.
+    members = cast(
+        DataFrame[PokemonSchema],
+        pd.concat([team.members for team in opponents], ignore_index=True),
+    )
+    positions = np.arange(len(members)).reshape(len(opponents), -1)
+    return get_pokemon_pool(members), positions
 
 
-def get_typing_distribution(opponents):
-    typings_count = {}
-    for team in opponents:
-        types_1 = team.members["type1"].to_list()
-        types_2 = team.members["type2"].to_list()
+def _get_pool_and_teams(
+    opponents: list[PokemonTeam] | np.ndarray, pool: PokemonPool | None
+) -> tuple[PokemonPool, np.ndarray]:
+    if not isinstance(opponents, np.ndarray):
+        return get_opponents_positions(opponents)
+
+    if pool is None:
+        raise ValueError("pool must be provided for teams given as positions.")
+
+    return pool, opponents
+
+
+def get_typing_distribution(
+    opponents: list[PokemonTeam] | np.ndarray, pool: PokemonPool | None = None
+) -> dict[str, int]:
+    pool, teams = _get_pool_and_teams(opponents, pool)
+    codes = np.concatenate(
+        [pool.first_types[teams].ravel(), pool.second_types[teams].ravel()]
+    ).astype(np.intp)
+    missing = codes == NO_TYPE
+    counts = np.bincount(codes[~missing], minlength=len(TYPES))
+
+    typings_count = {
+        type_name: int(count)
+        for type_name, count in zip(TYPES, counts, strict=True)
+        if count > 0
+    }
+
+    # Teams with a single typed member count a missing second type too,
+    # like the member lists they were counted from before.
+    if missing.any():
+        typings_count[NO_TYPE_LABEL] = int(missing.sum())
 
-        for t in types_1 + types_2:
-            if t not in typings_count:
-                typings_count[t] = 0
-            typings_count[t] += 1
     return typings_count
 
 
@@ -35,44 +84,36 @@ def sort_alphabetically(typing_distribution: dict) -> dict:
     return dict(sorted(typing_distribution.items(), key=lambda kv: str(kv[0]).lower()))
 
 
-def get_opponents_statistics_df(opponents: list[PokemonTeam]) -> pd.DataFrame:
-    rows = []
-    for i, team in enumerate(opponents):
-        m = team.members
-
-        hp_sum = int(pd.to_numeric(m[HP], errors="coerce").sum())
-        atk_sum = int(pd.to_numeric(m[ATTACK], errors="coerce").sum())
-        spa_sum = int(pd.to_numeric(m[SPECIAL_ATTACK], errors="coerce").sum())
-        def_sum = int(pd.to_numeric(m[DEFENSE], errors="coerce").sum())
-        spd_sum = int(pd.to_numeric(m[SPECIAL_DEFENSE], errors="coerce").sum())
-
-        stats_df = m[STATS_COLS].apply(pd.to_numeric, errors="coerce")
-        stats_sum = int(stats_df.sum().sum())
-
-        n = len(m)
-
-        rows.append(
-            {
-                "team_idx": i,
-                HP: hp_sum,
-                ATTACK: atk_sum,
-                SPECIAL_ATTACK: spa_sum,
-                DEFENSE: def_sum,
-                SPECIAL_DEFENSE: spd_sum,
-                STATS_SUM: stats_sum,
-                f"{HP}_mean": hp_sum / n,
-                f"{ATTACK}_mean": atk_sum / n,
-                f"{SPECIAL_ATTACK}_mean": spa_sum / n,
-                f"{DEFENSE}_mean": def_sum / n,
-                f"{SPECIAL_DEFENSE}_mean": spd_sum / n,
-                f"{STATS_SUM}_mean": stats_sum / n,
-            }
-        )
-
-    return pd.DataFrame(rows)
-
-
-def summarize(df_long, decimals: int = 4):
+def get_opponents_statistics_df(
+    opponents: list[PokemonTeam] | np.ndarray, pool: PokemonPool | None = None
+) -> pd.DataFrame:
+    pool, teams = _get_pool_and_teams(opponents, pool)
+    stats = {
+        HP: pool.hp,
+        ATTACK: pool.attack,
+        SPECIAL_ATTACK: pool.sp_attack,
+        DEFENSE: pool.defense,
+        SPECIAL_DEFENSE: pool.sp_defense,
+    }
+    sums = {
+        name: values[teams].sum(axis=1, dtype=np.int64)
+        for name, values in stats.items()
+    }
+    sums[STATS_SUM] = sum(sums[name] for name in STATS_COLS)
+
+    team_size = teams.shape[1]
+    statistics = pd.DataFrame({"team_idx": np.arange(len(teams)), **sums})
+    for name in sums:
+        statistics[f"{name}_mean"] = statistics[name] / team_size
+
+    return statistics
+
+
+def summarize(df_long: "pd.DataFrame | ResultsStore", decimals: int = 4):
+    # A results store is read column-wise, only the two summarized columns.
+    if not isinstance(df_long, pd.DataFrame):
+        df_long = df_long.read(columns=["solver", "fitness"])
+
     summary = (
         df_long.groupby("solver")["fitness"]
         .agg(["mean", "median", "std", "min", "max", "count"])
@@ -0,0 +1,25 @@
+import numpy as np
+
+from classes import PokemonTeam
+from data import get_pokemons
+from opponents import cluster_features, compress_opponents
+
+
+def test_cluster_features_leaves_no_cluster_empty_for_duplicates() -> None:
+    _, labels = cluster_features(np.ones((5, 3)), 3, np.random.default_rng(0))
+
+    assert np.bincount(labels, minlength=3).min() > 0
+
+
+def test_compress_opponents_accepts_duplicate_candidates() -> None:
+    pokemons = get_pokemons()
+    team = PokemonTeam.generate_team(
+        pokemons, team_size=6, rng=np.random.default_rng(0)
+    )
+
+    compressed = compress_opponents(
+        pokemons, candidates=[team.copy() for _ in range(5)], representatives=3
+    )
+
+    assert len(compressed.opponents) == 3
+    assert compressed.weights.sum() == 1.0
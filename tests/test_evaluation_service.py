@@ -0,0 +1,43 @@
+import asyncio
+
+import numpy as np
+
+from data import get_pokemon_pool, get_pokemons
+from service import EvaluationService
+from simulation import get_team_keys
+from solvers import RandomSearchPokemonSolver
+
+
+def test_cache_evicts_least_recently_used_fitnesses() -> None:
+    pokemons = get_pokemons()
+    pool_size = get_pokemon_pool(pokemons).get_size()
+    teams = np.arange(3 * 6).reshape(3, 6)
+    opponents = np.arange(18, 18 + 2 * 6).reshape(2, 6)
+
+    async def run() -> None:
+        async with EvaluationService(
+            pokemons, workers=1, cache_entries=2, use_processes=False
+        ) as service:
+            await service.evaluate(teams[:2], opponents)
+            await service.evaluate(teams[:1], opponents)
+            await service.evaluate(teams[2:], opponents)
+
+            assert [key for _, key in service.cache] == get_team_keys(
+                teams[[0, 2]], pool_size
+            ).tolist()
+
+    asyncio.run(run())
+
+
+def test_solve_job_reports_status_without_total() -> None:
+    async def run() -> None:
+        async with EvaluationService(workers=1, use_processes=False) as service:
+            job = service.solve(
+                RandomSearchPokemonSolver(trials=2, opponents_limit=2, seed=0)
+            )
+            events = [progress async for progress in job.progress()]
+
+            assert {progress.total for progress in events} == {None}
+            assert events[-1].status == "done"
+
+    asyncio.run(run())
@@ -0,0 +1,66 @@
+import numpy as np
+
+from classes import PokemonTeam, apply_replacement_moves, get_replacement_moves
+from data import get_pokemon_pool, get_pokemons
+from simulation import (
+    damage_attack_devide_defense,
+    evaluate_teams,
+    get_damage_table,
+    multiply_type_multiplier,
+)
+from solvers import HillClimbingPokemonSolver
+
+
+def test_steepest_ascent_step_scores_whole_neighbourhood() -> None:
+    pokemons = get_pokemons()
+    pool = get_pokemon_pool(pokemons)
+    rng = np.random.default_rng(0)
+    start_team = PokemonTeam.generate_team(pokemons, team_size=6, rng=rng)
+    opponents = PokemonTeam.sample_unique_teams(
+        pokemons, teams_amount=5, team_size=6, rng=rng
+    )
+
+    start = start_team.get_positions(pool)
+    slots, candidates = get_replacement_moves(pool, start, unique_types=True)
+    neighbors = apply_replacement_moves(start, slots, candidates)
+    damage = get_damage_table(
+        pool, multiply_type_multiplier, damage_attack_devide_defense
+    )
+    fits = evaluate_teams(
+        pool,
+        damage,
+        neighbors,
+        np.array([opponent.get_positions(pool) for opponent in opponents]),
+    )
+
+    # The budget fits the start team and exactly one whole neighbourhood.
+    solver = HillClimbingPokemonSolver(
+        steepest_ascent=True, steepest_max_evaluations=1 + len(neighbors)
+    )
+    best_team, best_fit, history, _ = solver.solve(
+        pokemons, opponents=opponents, start_team=start_team
+    )
+
+    assert len(history) == 1
+    assert best_fit == float(fits.max())
+    np.testing.assert_array_equal(
+        best_team.get_positions(pool), neighbors[fits.argmax()]
+    )
+
+
+def test_steepest_ascent_does_not_cut_a_step_short() -> None:
+    pokemons = get_pokemons()
+    rng = np.random.default_rng(1)
+    start_team = PokemonTeam.generate_team(pokemons, team_size=6, rng=rng)
+    opponents = PokemonTeam.sample_unique_teams(
+        pokemons, teams_amount=5, team_size=6, rng=rng
+    )
+
+    solver = HillClimbingPokemonSolver(
+        steepest_ascent=True, steepest_max_evaluations=10
+    )
+    _, _, history, _ = solver.solve(
+        pokemons, opponents=opponents, start_team=start_team
+    )
+
+    assert history == []